@@ -1,10 +1,17 @@
 import warnings
+from functools import partial
+from typing import Any, Optional, Tuple, Union
+from urllib.parse import urlsplit
 
 from typing_extensions import Literal
 
-from lemon.market_data.api import MarketDataAPI
-from lemon.streaming.api import StreamingAPI
-from lemon.trading.api import TradingAPI
+from lemon.base import JSONLoads, make_async_session, make_session
+from lemon.cache import ResponseCache
+from lemon.market_data.api import AsyncMarketDataAPI, MarketDataAPI
+from lemon.rate_limit import RateLimiter
+from lemon.streaming.api import AsyncStreamingAPI, StreamingAPI
+from lemon.trading.api import AsyncTradingAPI, TradingAPI
+from lemon.transport import AsyncTransport, Transport
 
 MARKET_DATA_API_URL = "https://data.lemon.markets/v1/"
 LIVE_TRADING_API_URL = "https://trading.lemon.markets/v1/"
@@ -12,6 +19,24 @@ PAPER_TRADING_API_URL = "https://paper-trading.lemon.markets/v1/"
 STREAMING_API_URL = "https://realtime.lemon.markets/v1/"
 
 
+def _same_host(url: str, other_url: str) -> bool:
+    return urlsplit(url).netloc == urlsplit(other_url).netloc
+
+
+def _check_transport_options(transport: Any, **options: Tuple[Any, Any]) -> None:
+    """Reject (value, default) options which are configured by the transport."""
+    if transport is None:
+        return
+    conflicting = [
+        name for name, (value, default) in options.items() if value != default
+    ]
+    if conflicting:
+        raise ValueError(
+            f"{', '.join(conflicting)} cannot be used with a transport, "
+            "pass them to the transport instead"
+        )
+
+
 class Api:
     def __init__(
         self,
@@ -23,13 +48,56 @@ class Api:
         timeout: float,
         retry_count: int,
         retry_backoff_factor: float,
+        json_loads: Optional[JSONLoads] = None,
+        market_data_rate_limiter: Optional[RateLimiter] = None,
+        trading_rate_limiter: Optional[RateLimiter] = None,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        tcp_keepalive: Optional[float] = None,
+        transport: Optional[Transport] = None,
+        coalesce_requests: bool = False,
+        cache: Optional[ResponseCache] = None,
     ):
+        _check_transport_options(
+            transport,
+            pool_connections=(pool_connections, 10),
+            pool_maxsize=(pool_maxsize, 10),
+            pool_block=(pool_block, False),
+            tcp_keepalive=(tcp_keepalive, None),
+        )
+        if transport is not None:
+            market_data_session = trading_session = transport.session
+            streaming_session = transport.session
+        else:
+            new_session = partial(
+                make_session,
+                retry_count=retry_count,
+                retry_backoff_factor=retry_backoff_factor,
+                pool_connections=pool_connections,
+                pool_maxsize=pool_maxsize,
+                pool_block=pool_block,
+                tcp_keepalive=tcp_keepalive,
+            )
+            market_data_session, trading_session = new_session(), new_session()
+            # streaming and market data APIs share connections on the same host
+            streaming_session = (
+                market_data_session
+                if _same_host(market_data_api_url, streaming_api_url)
+                else new_session()
+            )
+        self._transport = transport
         self._market_data = MarketDataAPI(
             api_token=market_data_api_token,
             market_data_api_url=market_data_api_url,
             timeout=timeout,
             retry_count=retry_count,
             retry_backoff_factor=retry_backoff_factor,
+            json_loads=json_loads,
+            rate_limiter=market_data_rate_limiter,
+            session=market_data_session,
+            coalesce_requests=coalesce_requests,
+            cache=cache,
         )
         self._trading = TradingAPI(
             api_token=trading_api_token,
@@ -37,6 +105,11 @@ class Api:
             timeout=timeout,
             retry_count=retry_count,
             retry_backoff_factor=retry_backoff_factor,
+            json_loads=json_loads,
+            rate_limiter=trading_rate_limiter,
+            session=trading_session,
+            coalesce_requests=coalesce_requests,
+            cache=cache,
         )
         self._streaming = StreamingAPI(
             api_token=market_data_api_token,
@@ -44,6 +117,11 @@ class Api:
             timeout=timeout,
             retry_count=retry_count,
             retry_backoff_factor=retry_backoff_factor,
+            json_loads=json_loads,
+            rate_limiter=market_data_rate_limiter,
+            session=streaming_session,
+            coalesce_requests=coalesce_requests,
+            cache=cache,
         )
 
     @property
@@ -59,6 +137,129 @@ class Api:
         return self._streaming
 
 
+class AsyncApi:
+    def __init__(
+        self,
+        market_data_api_token: str,
+        trading_api_token: str,
+        market_data_api_url: str,
+        trading_api_url: str,
+        streaming_api_url: str,
+        timeout: float,
+        retry_count: int,
+        retry_backoff_factor: float,
+        json_loads: Optional[JSONLoads] = None,
+        market_data_rate_limiter: Optional[RateLimiter] = None,
+        trading_rate_limiter: Optional[RateLimiter] = None,
+        pool_maxsize: int = 10,
+        tcp_keepalive: Optional[float] = None,
+        transport: Optional[AsyncTransport] = None,
+        coalesce_requests: bool = False,
+        cache: Optional[ResponseCache] = None,
+    ):
+        _check_transport_options(
+            transport,
+            pool_maxsize=(pool_maxsize, 10),
+            tcp_keepalive=(tcp_keepalive, None),
+        )
+        if transport is not None:
+            market_data_session = trading_session = transport.session
+            streaming_session = transport.session
+        else:
+            new_session = partial(
+                make_async_session,
+                timeout=timeout,
+                retry_count=retry_count,
+                pool_maxsize=pool_maxsize,
+                tcp_keepalive=tcp_keepalive,
+            )
+            market_data_session, trading_session = new_session(), new_session()
+            # streaming and market data APIs share connections on the same host
+            streaming_session = (
+                market_data_session
+                if _same_host(market_data_api_url, streaming_api_url)
+                else new_session()
+            )
+        self._transport = transport
+        self._market_data = AsyncMarketDataAPI(
+            api_token=market_data_api_token,
+            market_data_api_url=market_data_api_url,
+            timeout=timeout,
+            retry_count=retry_count,
+            retry_backoff_factor=retry_backoff_factor,
+            json_loads=json_loads,
+            rate_limiter=market_data_rate_limiter,
+            session=market_data_session,
+            coalesce_requests=coalesce_requests,
+            cache=cache,
+        )
+        self._trading = AsyncTradingAPI(
+            api_token=trading_api_token,
+            trading_api_url=trading_api_url,
+            timeout=timeout,
+            retry_count=retry_count,
+            retry_backoff_factor=retry_backoff_factor,
+            json_loads=json_loads,
+            rate_limiter=trading_rate_limiter,
+            session=trading_session,
+            coalesce_requests=coalesce_requests,
+            cache=cache,
+        )
+        self._streaming = AsyncStreamingAPI(
+            api_token=market_data_api_token,
+            streaming_api_url=streaming_api_url,
+            timeout=timeout,
+            retry_count=retry_count,
+            retry_backoff_factor=retry_backoff_factor,
+            json_loads=json_loads,
+            rate_limiter=market_data_rate_limiter,
+            session=streaming_session,
+            coalesce_requests=coalesce_requests,
+            cache=cache,
+        )
+
+    @property
+    def market_data(self) -> AsyncMarketDataAPI:
+        return self._market_data
+
+    @property
+    def trading(self) -> AsyncTradingAPI:
+        return self._trading
+
+    @property
+    def streaming(self) -> AsyncStreamingAPI:
+        return self._streaming
+
+    async def aclose(self) -> None:
+        # shared transport is closed by its owner
+        if self._transport is not None:
+            return
+        await self._market_data.aclose()
+        await self._trading.aclose()
+        await self._streaming.aclose()
+
+    async def __aenter__(self) -> "AsyncApi":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
+
+
+def _trading_api_url(env: Literal["paper", "money", "live"]) -> str:
+    if env == "money":
+        warnings.warn(
+            "Usage of 'money' as env is deprecated, please use 'live' in the future",
+            category=FutureWarning,
+        )
+    return LIVE_TRADING_API_URL if env in ["money", "live"] else PAPER_TRADING_API_URL
+
+
+def _rate_limiter(limit: Union[float, RateLimiter, None]) -> Optional[RateLimiter]:
+    if limit is None or isinstance(limit, RateLimiter):
+        return limit
+    return RateLimiter(rate=limit)
+
+
 def create(
     market_data_api_token: str,
     trading_api_token: str,
@@ -66,21 +267,76 @@ def create(
     timeout: float = 5,
     retry_count: int = 3,
     retry_backoff_factor: float = 0.1,
+    json_loads: Optional[JSONLoads] = None,
+    market_data_rate_limit: Union[float, RateLimiter, None] = None,
+    trading_rate_limit: Union[float, RateLimiter, None] = None,
+    pool_connections: int = 10,
+    pool_maxsize: int = 10,
+    pool_block: bool = False,
+    tcp_keepalive: Optional[float] = None,
+    transport: Optional[Transport] = None,
+    coalesce_requests: bool = False,
+    cache: Optional[ResponseCache] = None,
 ) -> Api:
-    if env == "money":
-        warnings.warn(
-            "Usage of 'money' as env is deprecated, please use 'live' in the future",
-            category=FutureWarning,
-        )
+    # requests are retried by the session of the transport
+    _check_transport_options(
+        transport,
+        retry_count=(retry_count, 3),
+        retry_backoff_factor=(retry_backoff_factor, 0.1),
+    )
     return Api(
         market_data_api_token=market_data_api_token,
         trading_api_token=trading_api_token,
         market_data_api_url=MARKET_DATA_API_URL,
         streaming_api_url=STREAMING_API_URL,
-        trading_api_url=LIVE_TRADING_API_URL
-        if env in ["money", "live"]
-        else PAPER_TRADING_API_URL,
+        trading_api_url=_trading_api_url(env),
+        timeout=timeout,
+        retry_count=retry_count,
+        retry_backoff_factor=retry_backoff_factor,
+        json_loads=json_loads,
+        market_data_rate_limiter=_rate_limiter(market_data_rate_limit),
+        trading_rate_limiter=_rate_limiter(trading_rate_limit),
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+        tcp_keepalive=tcp_keepalive,
+        transport=transport,
+        coalesce_requests=coalesce_requests,
+        cache=cache,
+    )
+
+
+def create_async(
+    market_data_api_token: str,
+    trading_api_token: str,
+    env: Literal["paper", "money", "live"] = "paper",
+    timeout: float = 5,
+    retry_count: int = 3,
+    retry_backoff_factor: float = 0.1,
+    json_loads: Optional[JSONLoads] = None,
+    market_data_rate_limit: Union[float, RateLimiter, None] = None,
+    trading_rate_limit: Union[float, RateLimiter, None] = None,
+    pool_maxsize: int = 10,
+    tcp_keepalive: Optional[float] = None,
+    transport: Optional[AsyncTransport] = None,
+    coalesce_requests: bool = False,
+    cache: Optional[ResponseCache] = None,
+) -> AsyncApi:
+    return AsyncApi(
+        market_data_api_token=market_data_api_token,
+        trading_api_token=trading_api_token,
+        market_data_api_url=MARKET_DATA_API_URL,
+        streaming_api_url=STREAMING_API_URL,
+        trading_api_url=_trading_api_url(env),
         timeout=timeout,
         retry_count=retry_count,
         retry_backoff_factor=retry_backoff_factor,
+        json_loads=json_loads,
+        market_data_rate_limiter=_rate_limiter(market_data_rate_limit),
+        trading_rate_limiter=_rate_limiter(trading_rate_limit),
+        pool_maxsize=pool_maxsize,
+        tcp_keepalive=tcp_keepalive,
+        transport=transport,
+        coalesce_requests=coalesce_requests,
+        cache=cache,
     )
@@ -1,11 +1,25 @@
-from functools import wraps
-from typing import Any, Callable, Dict, Optional
-from urllib.parse import urljoin
+import asyncio
+import json
+import socket
+import ssl
+from functools import partial, wraps
+from hashlib import sha256
+from importlib import import_module
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlencode, urljoin
 
 import requests
 from requests.adapters import HTTPAdapter, Retry
-from typing_extensions import ParamSpec
+from typing_extensions import NoReturn, ParamSpec
+from urllib3.connection import HTTPConnection
 
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None  # type: ignore
+
+from lemon.cache import CachedResponse, ResponseCache
+from lemon.coalesce import AsyncSingleFlight, SingleFlight
 from lemon.errors import (
     APIError,
     AuthenticationError,
@@ -13,10 +27,45 @@ from lemon.errors import (
     InternalServerError,
     InvalidQueryError,
 )
+from lemon.rate_limit import RateLimiter, RateLimitStatus
 from lemon.types import filter_out_optionals
 
 P = ParamSpec("P")
 
+JSONLoads = Callable[[bytes], Any]
+
+RETRY_STATUS_CODES = [429, 500, 502, 503, 504]
+RETRY_METHODS = ["HEAD", "GET", "DELETE", "OPTIONS", "TRACE"]
+
+SocketOptions = List[Tuple[int, int, int]]
+
+
+def _default_json_loads() -> JSONLoads:
+    # prefer the fastest decoder available
+    for module, function in [("orjson", "loads"), ("msgspec.json", "decode")]:
+        try:
+            return getattr(import_module(module), function)  # type: ignore
+        except ImportError:
+            continue
+    return json.loads
+
+
+DEFAULT_JSON_LOADS = _default_json_loads()
+
+
+def _raise_error(error: Dict[str, Any]) -> NoReturn:
+    error_code: Optional[str] = error.get("error_code")
+    if error_code is None:
+        raise APIError._from_data(error)
+    if error_code == "invalid_query":
+        raise InvalidQueryError._from_data(error)
+    if error_code == "internal_error":
+        raise InternalServerError._from_data(error)
+    if error_code in ["unauthorized", "token_invalid"]:
+        raise AuthenticationError._from_data(error)
+
+    raise BusinessLogicError._from_data(error)
+
 
 def _handle_error(
     func: Callable[P, requests.Response]
@@ -25,24 +74,96 @@ def _handle_error(
     def inner(*arg: P.args, **kwargs: P.kwargs) -> requests.Response:
         response = func(*arg, **kwargs)
         if not response.ok:
-            error = response.json()
-            error_code: Optional[str] = error.get("error_code")
-            if error_code is None:
-                raise APIError._from_data(error)
-            if error_code == "invalid_query":
-                raise InvalidQueryError._from_data(error)
-            if error_code == "internal_error":
-                raise InternalServerError._from_data(error)
-            if error_code in ["unauthorized", "token_invalid"]:
-                raise AuthenticationError._from_data(error)
-
-            raise BusinessLogicError._from_data(error)
+            _raise_error(response.json())
 
         return response
 
     return inner
 
 
+def _handle_async_error(
+    func: Callable[P, Awaitable["httpx.Response"]]
+) -> Callable[P, Awaitable["httpx.Response"]]:
+    @wraps(func)
+    async def inner(*arg: P.args, **kwargs: P.kwargs) -> "httpx.Response":
+        response = await func(*arg, **kwargs)
+        if response.is_error:
+            _raise_error(response.json())
+
+        return response
+
+    return inner
+
+
+def keepalive_socket_options(idle: float) -> SocketOptions:
+    """Socket options enabling TCP keep-alive probes after `idle` seconds."""
+    options = [
+        *HTTPConnection.default_socket_options,
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+    ]
+    # TCP_KEEPIDLE on linux, TCP_KEEPALIVE on macOS
+    for name in ["TCP_KEEPIDLE", "TCP_KEEPALIVE", "TCP_KEEPINTVL"]:
+        if hasattr(socket, name):
+            options.append((socket.IPPROTO_TCP, getattr(socket, name), int(idle)))
+    return options
+
+
+class PoolAdapter(HTTPAdapter):
+    """`HTTPAdapter` creating connections with the given socket options and
+    TLS context shared by all the connections."""
+
+    __attrs__ = [*HTTPAdapter.__attrs__, "_socket_options", "_ssl_context"]
+
+    def __init__(
+        self,
+        socket_options: Optional[SocketOptions] = None,
+        ssl_context: Optional[ssl.SSLContext] = None,
+        **kwargs: Any,
+    ) -> None:
+        # has to be set before `HTTPAdapter.__init__` creates the pool manager
+        self._socket_options = socket_options
+        self._ssl_context = ssl_context
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        if self._socket_options is not None:
+            kwargs["socket_options"] = self._socket_options
+        if self._ssl_context is not None:
+            kwargs["ssl_context"] = self._ssl_context
+        super().init_poolmanager(*args, **kwargs)
+
+
+def make_session(
+    retry_count: int,
+    retry_backoff_factor: float,
+    pool_connections: int = 10,
+    pool_maxsize: int = 10,
+    pool_block: bool = False,
+    tcp_keepalive: Optional[float] = None,
+    ssl_context: Optional[ssl.SSLContext] = None,
+) -> requests.Session:
+    session = requests.Session()
+    retries = Retry(
+        total=retry_count,
+        backoff_factor=retry_backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=RETRY_METHODS,
+    )
+    adapter = PoolAdapter(
+        socket_options=keepalive_socket_options(tcp_keepalive)
+        if tcp_keepalive is not None
+        else None,
+        ssl_context=ssl_context,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        pool_block=pool_block,
+        max_retries=retries,
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
 class Client:
     def __init__(
         self,
@@ -51,20 +172,58 @@ class Client:
         timeout: float,
         retry_count: int,
         retry_backoff_factor: float,
+        json_loads: Optional[JSONLoads] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        session: Optional[requests.Session] = None,
+        coalesce_requests: bool = False,
+        cache: Optional[ResponseCache] = None,
     ):
         self._base_url = base_url
         self._api_token = api_token
         self._timeout = timeout
-        self._session = requests.Session()
-        retries = Retry(
-            total=retry_count,
-            backoff_factor=retry_backoff_factor,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["HEAD", "GET", "DELETE", "OPTIONS", "TRACE"],
+        self._json_loads = json_loads or DEFAULT_JSON_LOADS
+        self._rate_limiter = rate_limiter
+        self._rate_limit: Optional[RateLimitStatus] = None
+        self._cache = cache
+        # the session may be shared with other clients
+        self._session = session or make_session(
+            retry_count=retry_count, retry_backoff_factor=retry_backoff_factor
         )
+        self._hooks = {"response": [self._on_response]}
+        # identical GET requests running at the same time share one response
+        self._single_flight = SingleFlight() if coalesce_requests else None
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "Client":
+        # shared by responses fetching following pages, `BaseModel.dict` must
+        # not copy its locks and connections
+        return self
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        return self._rate_limiter
+
+    @property
+    def rate_limit(self) -> Optional[RateLimitStatus]:
+        """Rate limit budget reported with the last response, if any."""
+        return self._rate_limit
+
+    def decode(self, response: requests.Response) -> Any:
+        if isinstance(response, CachedResponse):
+            return response.decode(self._json_loads)
+        return self._json_loads(response.content)
+
+    def _on_response(self, response: requests.Response, **kwargs: Any) -> None:
+        # `Retry-After` of retried responses is already honored by urllib3
+        status = RateLimitStatus.from_headers(response.headers)
+        if status is None:
+            return
+        self._rate_limit = status
+        if self._rate_limiter is not None:
+            self._rate_limiter.update(status)
 
-        self._session.mount("http://", HTTPAdapter(max_retries=retries))
-        self._session.mount("https://", HTTPAdapter(max_retries=retries))
+    def _throttle(self) -> None:
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
 
     @_handle_error
     def get(
@@ -75,11 +234,46 @@ class Client:
     ) -> requests.Response:
         url = urljoin(self._base_url, url)
         headers = headers or {}
+        cache_entry = _cache_entry(
+            self._cache, self._base_url, self._api_token, url, params, headers
+        )
+        if cache_entry is None:
+            return self._get(url, params, headers)
+
+        key, endpoint, ttl = cache_entry
+        cached = self._cache.get(key)  # type: ignore
+        if cached is not None:
+            return cached  # type: ignore
+        response = self._get(url, params, headers)
+        if response.status_code == 200:
+            self._cache.set(  # type: ignore
+                key,
+                endpoint,
+                CachedResponse(200, response.headers, response.content),
+                ttl,
+            )
+        return response
+
+    def _get(
+        self, url: str, params: Optional[Dict[str, Any]], headers: Dict[str, Any]
+    ) -> requests.Response:
+        if self._single_flight is not None:
+            return self._single_flight.do(
+                _request_key(url, params, headers),
+                partial(self._send_get, url, params, headers),
+            )
+        return self._send_get(url, params, headers)
+
+    def _send_get(
+        self, url: str, params: Optional[Dict[str, Any]], headers: Dict[str, Any]
+    ) -> requests.Response:
+        self._throttle()
         return self._session.get(
             url,
             params=filter_out_optionals(params) if params else None,
             headers={"Authorization": f"Bearer {self._api_token}", **headers},
             timeout=self._timeout,
+            hooks=self._hooks,
         )
 
     @_handle_error
@@ -92,12 +286,14 @@ class Client:
     ) -> requests.Response:
         url = urljoin(self._base_url, url)
         headers = headers or {}
+        self._throttle()
         return self._session.put(
             url,
             json=filter_out_optionals(json),
             params=filter_out_optionals(params) if params else None,
             headers={"Authorization": f"Bearer {self._api_token}", **headers},
             timeout=self._timeout,
+            hooks=self._hooks,
         )
 
     @_handle_error
@@ -110,12 +306,14 @@ class Client:
     ) -> requests.Response:
         url = urljoin(self._base_url, url)
         headers = headers or {}
+        self._throttle()
         return self._session.post(
             url,
             json=filter_out_optionals(json),
             params=filter_out_optionals(params) if params else None,
             headers={"Authorization": f"Bearer {self._api_token}", **headers},
             timeout=self._timeout,
+            hooks=self._hooks,
         )
 
     @_handle_error
@@ -127,9 +325,264 @@ class Client:
     ) -> requests.Response:
         url = urljoin(self._base_url, url)
         headers = headers or {}
+        self._throttle()
         return self._session.delete(
             url,
             params=filter_out_optionals(params) if params else None,
             headers={"Authorization": f"Bearer {self._api_token}", **headers},
             timeout=self._timeout,
+            hooks=self._hooks,
+        )
+
+
+def _encode_params(params: Optional[Dict[str, Any]]) -> List[Tuple[str, str]]:
+    # mirror the way `requests` serializes query parameters, so both clients
+    # send exactly the same query strings (lists as repeated keys, `str()` values)
+    encoded: List[Tuple[str, str]] = []
+    for key, value in filter_out_optionals(params or {}).items():
+        values = (
+            value
+            if isinstance(value, (list, tuple, set)) and not isinstance(value, str)
+            else [value]
+        )
+        encoded.extend((key, str(val)) for val in values if val is not None)
+    return encoded
+
+
+def _request_key(
+    url: str, params: Optional[Dict[str, Any]], headers: Dict[str, Any]
+) -> Tuple[str, Tuple[Tuple[str, str], ...], Tuple[Tuple[str, str], ...]]:
+    return (
+        url,
+        tuple(_encode_params(params)),
+        tuple(sorted((key, str(value)) for key, value in headers.items())),
+    )
+
+
+def _cache_entry(
+    cache: Optional[ResponseCache],
+    base_url: str,
+    api_token: str,
+    url: str,
+    params: Optional[Dict[str, Any]],
+    headers: Dict[str, Any],
+) -> Optional[Tuple[str, str, float]]:
+    # key, endpoint and TTL of the response, if it should be cached
+    if cache is None or not url.startswith(base_url):
+        return None
+    endpoint = url[len(base_url) :]
+    ttl = cache.ttl(endpoint)
+    if ttl is None:
+        return None
+    # responses of different accounts must never be mixed up
+    account = sha256(api_token.encode()).hexdigest()[:16]
+    return f"{account}:{_request_key(url, params, headers)!r}", endpoint, ttl
+
+
+def make_async_session(
+    timeout: float,
+    retry_count: int,
+    pool_maxsize: int = 10,
+    tcp_keepalive: Optional[float] = None,
+) -> "httpx.AsyncClient":
+    if httpx is None:
+        raise ImportError(
+            "Asynchronous client requires 'httpx' package, "
+            "install it with: pip install lemon[async]"
+        )
+    transport_kwargs: Dict[str, Any] = {}
+    if tcp_keepalive is not None:
+        transport_kwargs["socket_options"] = keepalive_socket_options(tcp_keepalive)
+    return httpx.AsyncClient(
+        timeout=timeout,
+        transport=httpx.AsyncHTTPTransport(
+            retries=retry_count,
+            limits=httpx.Limits(
+                max_connections=pool_maxsize, max_keepalive_connections=pool_maxsize
+            ),
+            **transport_kwargs,
+        ),
+    )
+
+
+class AsyncClient:
+    def __init__(
+        self,
+        base_url: str,
+        api_token: str,
+        timeout: float,
+        retry_count: int,
+        retry_backoff_factor: float,
+        json_loads: Optional[JSONLoads] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        session: Optional["httpx.AsyncClient"] = None,
+        coalesce_requests: bool = False,
+        cache: Optional[ResponseCache] = None,
+    ):
+        self._base_url = base_url
+        self._api_token = api_token
+        self._timeout = timeout
+        self._retry_count = retry_count
+        self._retry_backoff_factor = retry_backoff_factor
+        self._json_loads = json_loads or DEFAULT_JSON_LOADS
+        self._rate_limiter = rate_limiter
+        self._rate_limit: Optional[RateLimitStatus] = None
+        self._cache = cache
+        # the session may be shared with other clients
+        self._session = session or make_async_session(
+            timeout=timeout, retry_count=retry_count
+        )
+        # identical GET requests running at the same time share one response
+        self._single_flight = AsyncSingleFlight() if coalesce_requests else None
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> "AsyncClient":
+        # shared by responses fetching following pages, `BaseModel.dict` must
+        # not copy its session
+        return self
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        return self._rate_limiter
+
+    @property
+    def rate_limit(self) -> Optional[RateLimitStatus]:
+        """Rate limit budget reported with the last response, if any."""
+        return self._rate_limit
+
+    def decode(self, response: "httpx.Response") -> Any:
+        if isinstance(response, CachedResponse):
+            return response.decode(self._json_loads)
+        return self._json_loads(response.content)
+
+    def _on_response(self, response: "httpx.Response") -> Optional[RateLimitStatus]:
+        status = RateLimitStatus.from_headers(response.headers)
+        if status is not None:
+            self._rate_limit = status
+            if self._rate_limiter is not None:
+                self._rate_limiter.update(status)
+        return status
+
+    async def aclose(self) -> None:
+        await self._session.aclose()
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        json: Any = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, Any]] = None,
+    ) -> "httpx.Response":
+        url = urljoin(self._base_url, url)
+        query = urlencode(_encode_params(params))
+        if query:
+            url = f"{url}{'&' if '?' in url else '?'}{query}"
+        headers = {"Authorization": f"Bearer {self._api_token}", **(headers or {})}
+        retries = self._retry_count if method in RETRY_METHODS else 0
+
+        attempt = 0
+        while True:
+            if self._rate_limiter is not None:
+                await self._rate_limiter.acquire_async()
+            response = await self._session.request(
+                method,
+                url,
+                json=filter_out_optionals(json) if json is not None else None,
+                headers=headers,
+                timeout=self._timeout,
+            )
+            status = self._on_response(response)
+            if attempt >= retries or response.status_code not in RETRY_STATUS_CODES:
+                return response
+
+            attempt += 1
+            # same schedule as urllib3 `Retry`: no sleep before the first retry,
+            # unless the server asks to wait with `Retry-After` (rate limiter,
+            # if any, already got paused for that time)
+            backoff = (
+                self._retry_backoff_factor * 2 ** (attempt - 1) if attempt > 1 else 0
+            )
+            if (
+                status is not None
+                and status.retry_after is not None
+                and self._rate_limiter is None
+            ):
+                backoff = max(backoff, status.retry_after)
+            if backoff > 0:
+                await asyncio.sleep(backoff)
+
+    @_handle_async_error
+    async def get(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, Any]] = None,
+    ) -> "httpx.Response":
+        headers = headers or {}
+        cache_entry = _cache_entry(
+            self._cache,
+            self._base_url,
+            self._api_token,
+            urljoin(self._base_url, url),
+            params,
+            headers,
         )
+        if cache_entry is None:
+            return await self._get(url, params, headers)
+
+        key, endpoint, ttl = cache_entry
+        cached = self._cache.get(key)  # type: ignore
+        if cached is not None:
+            return cached  # type: ignore
+        response = await self._get(url, params, headers)
+        if response.status_code == 200:
+            self._cache.set(  # type: ignore
+                key,
+                endpoint,
+                CachedResponse(200, response.headers, response.content),
+                ttl,
+            )
+        return response
+
+    async def _get(
+        self, url: str, params: Optional[Dict[str, Any]], headers: Dict[str, Any]
+    ) -> "httpx.Response":
+        if self._single_flight is not None:
+            return await self._single_flight.do(
+                _request_key(urljoin(self._base_url, url), params, headers),
+                partial(self._request, "GET", url, params=params, headers=headers),
+            )
+        return await self._request("GET", url, params=params, headers=headers)
+
+    @_handle_async_error
+    async def put(
+        self,
+        url: str,
+        json: Any,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, Any]] = None,
+    ) -> "httpx.Response":
+        return await self._request(
+            "PUT", url, json=json, params=params, headers=headers
+        )
+
+    @_handle_async_error
+    async def post(
+        self,
+        url: str,
+        json: Any,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, Any]] = None,
+    ) -> "httpx.Response":
+        return await self._request(
+            "POST", url, json=json, params=params, headers=headers
+        )
+
+    @_handle_async_error
+    async def delete(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, Any]] = None,
+    ) -> "httpx.Response":
+        return await self._request("DELETE", url, params=params, headers=headers)
@@ -0,0 +1,179 @@
+import abc
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, Mapping, Optional, Tuple
+
+# seconds responses of the endpoints (their paths) are cached for
+DEFAULT_TTLS: Dict[str, float] = {
+    "venues": 60,
+    "instruments": 300,
+    "user": 60,
+    "account/documents": 300,
+}
+
+
+class CachedResponse:
+    """Successful response stored in a cache, served instead of a new request."""
+
+    __slots__ = ("status_code", "headers", "content", "_data")
+
+    def __init__(self, status_code: int, headers: Mapping[str, str], content: bytes):
+        self.status_code = status_code
+        self.headers = dict(headers)
+        self.content = content
+        self._data: Any = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status_code < 400
+
+    @property
+    def is_error(self) -> bool:
+        return not self.ok
+
+    def json(self) -> Any:
+        return json.loads(self.content)
+
+    def decode(self, json_loads: Callable[[bytes], Any]) -> Any:
+        # decoded once, models do not modify the data they are parsed from
+        if self._data is None:
+            self._data = json_loads(self.content)
+        return self._data
+
+
+class ResponseCache(abc.ABC):
+    """Cache of GET responses of the endpoints with a configured TTL.
+
+    `ttls` maps endpoint paths (e.g. `"venues"`) to the number of seconds
+    their responses stay valid, with any query. Responses of other endpoints,
+    also of the ones below a configured path (e.g. a single document below
+    `"account/documents"`), are not cached.
+    """
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None):
+        self._ttls = {
+            path.strip("/"): ttl
+            for path, ttl in (DEFAULT_TTLS if ttls is None else ttls).items()
+        }
+
+    def ttl(self, endpoint: str) -> Optional[float]:
+        return self._ttls.get(endpoint.split("?", 1)[0].strip("/"))
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[CachedResponse]:
+        ...
+
+    @abc.abstractmethod
+    def set(
+        self, key: str, endpoint: str, response: CachedResponse, ttl: float
+    ) -> None:
+        ...
+
+    @abc.abstractmethod
+    def invalidate(self, endpoint: str = "") -> None:
+        """Remove responses of endpoints starting with given prefix (all by default)."""
+
+
+class MemoryCache(ResponseCache):
+    """In-memory cache keeping at most `maxsize` least recently used responses."""
+
+    def __init__(self, ttls: Optional[Dict[str, float]] = None, maxsize: int = 1024):
+        super().__init__(ttls)
+        self._maxsize = maxsize
+        self._lock = Lock()
+        self._entries: "OrderedDict[str, Tuple[str, float, CachedResponse]]" = (
+            OrderedDict()
+        )
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            _, expires_at, response = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return response
+
+    def set(
+        self, key: str, endpoint: str, response: CachedResponse, ttl: float
+    ) -> None:
+        with self._lock:
+            self._entries[key] = (endpoint, time.monotonic() + ttl, response)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, endpoint: str = "") -> None:
+        with self._lock:
+            for key in [
+                key
+                for key, (entry_endpoint, _, _) in self._entries.items()
+                if entry_endpoint.startswith(endpoint)
+            ]:
+                del self._entries[key]
+
+
+class SQLiteCache(ResponseCache):
+    """On-disk cache in a SQLite database, kept between runs of the process."""
+
+    def __init__(self, path: str, ttls: Optional[Dict[str, float]] = None):
+        super().__init__(ttls)
+        self._lock = Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, endpoint TEXT, expires_at REAL, "
+                "status_code INTEGER, headers TEXT, content BLOB)"
+            )
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT status_code, headers, content FROM responses "
+                "WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        if row is None:
+            return None
+        status_code, headers, content = row
+        return CachedResponse(status_code, json.loads(headers), content)
+
+    def set(
+        self, key: str, endpoint: str, response: CachedResponse, ttl: float
+    ) -> None:
+        with self._lock, self._connection:
+            now = time.time()
+            self._connection.execute(
+                "DELETE FROM responses WHERE expires_at <= ?", (now,)
+            )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    key,
+                    endpoint,
+                    now + ttl,
+                    response.status_code,
+                    json.dumps(response.headers),
+                    response.content,
+                ),
+            )
+
+    def invalidate(self, endpoint: str = "") -> None:
+        with self._lock, self._connection:
+            self._connection.execute(
+                "DELETE FROM responses WHERE substr(endpoint, 1, ?) = ?",
+                (len(endpoint), endpoint),
+            )
+
+    def close(self) -> None:
+        self._connection.close()
@@ -0,0 +1,59 @@
+import asyncio
+from concurrent.futures import Future
+from threading import Lock
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar, cast
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Share the result of identical calls running at the same time.
+
+    The first caller of `do` with a given key executes the function, callers
+    with the same key arriving before it finishes wait for and get its result
+    (or exception) instead of executing the function again.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._calls: Dict[Hashable, "Future[Any]"] = {}
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        with self._lock:
+            future = self._calls.get(key)
+            if future is not None:
+                leader = False
+            else:
+                leader, future = True, Future()
+                self._calls[key] = future
+
+        if not leader:
+            return cast(T, future.result())
+
+        try:
+            result = func()
+        except BaseException as exc:
+            future.set_exception(exc)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._calls[key]
+
+
+class AsyncSingleFlight:
+    """Asynchronous counterpart of `SingleFlight`."""
+
+    def __init__(self) -> None:
+        self._calls: Dict[Hashable, "asyncio.Future[Any]"] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        task = self._calls.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._calls[key] = task
+            task.add_done_callback(lambda _: self._calls.pop(key, None))
+        # cancellation of one of the callers must not cancel the others
+        return await asyncio.shield(task)
@@ -1,9 +1,15 @@
-from lemon.base import Client
-from lemon.market_data.instruments import Instruments
-from lemon.market_data.ohlc import Ohlc
-from lemon.market_data.quotes import Quotes
-from lemon.market_data.trades import Trades
-from lemon.market_data.venues import Venues
+from typing import Any, Optional
+
+import requests
+
+from lemon.base import AsyncClient, Client, JSONLoads
+from lemon.cache import ResponseCache
+from lemon.market_data.instruments import AsyncInstruments, Instruments
+from lemon.market_data.ohlc import AsyncOhlc, Ohlc
+from lemon.market_data.quotes import AsyncQuotes, Quotes
+from lemon.market_data.trades import AsyncTrades, Trades
+from lemon.market_data.venues import AsyncVenues, Venues
+from lemon.rate_limit import RateLimiter
 
 
 class MarketDataAPI(Client):
@@ -14,6 +20,11 @@ class MarketDataAPI(Client):
         timeout: float,
         retry_count: int,
         retry_backoff_factor: float,
+        json_loads: Optional[JSONLoads] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        session: Optional[requests.Session] = None,
+        coalesce_requests: bool = False,
+        cache: Optional[ResponseCache] = None,
     ):
         super().__init__(
             base_url=market_data_api_url,
@@ -21,6 +32,11 @@ class MarketDataAPI(Client):
             timeout=timeout,
             retry_count=retry_count,
             retry_backoff_factor=retry_backoff_factor,
+            json_loads=json_loads,
+            rate_limiter=rate_limiter,
+            session=session,
+            coalesce_requests=coalesce_requests,
+            cache=cache,
         )
         self._venues = Venues(self)
         self._instruments = Instruments(self)
@@ -47,3 +63,56 @@ class MarketDataAPI(Client):
     @property
     def ohlc(self) -> Ohlc:
         return self._ohlc
+
+
+class AsyncMarketDataAPI(AsyncClient):
+    def __init__(
+        self,
+        api_token: str,
+        market_data_api_url: str,
+        timeout: float,
+        retry_count: int,
+        retry_backoff_factor: float,
+        json_loads: Optional[JSONLoads] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        session: Any = None,
+        coalesce_requests: bool = False,
+        cache: Optional[ResponseCache] = None,
+    ):
+        super().__init__(
+            base_url=market_data_api_url,
+            api_token=api_token,
+            timeout=timeout,
+            retry_count=retry_count,
+            retry_backoff_factor=retry_backoff_factor,
+            json_loads=json_loads,
+            rate_limiter=rate_limiter,
+            session=session,
+            coalesce_requests=coalesce_requests,
+            cache=cache,
+        )
+        self._venues = AsyncVenues(self)
+        self._instruments = AsyncInstruments(self)
+        self._trades = AsyncTrades(self)
+        self._quotes = AsyncQuotes(self)
+        self._ohlc = AsyncOhlc(self)
+
+    @property
+    def venues(self) -> AsyncVenues:
+        return self._venues
+
+    @property
+    def instruments(self) -> AsyncInstruments:
+        return self._instruments
+
+    @property
+    def trades(self) -> AsyncTrades:
+        return self._trades
+
+    @property
+    def quotes(self) -> AsyncQuotes:
+        return self._quotes
+
+    @property
+    def ohlc(self) -> AsyncOhlc:
+        return self._ohlc
@@ -0,0 +1,91 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional
+
+from lemon.base import AsyncClient, Client
+
+# maximal number of ISINs accepted by a single market data request
+MAX_ISINS = 10
+# maximal number of chunks requested at the same time
+MAX_CONCURRENT_CHUNKS = 4
+
+
+def _chunks(isin: List[str]) -> List[List[str]]:
+    return [isin[i : i + MAX_ISINS] for i in range(0, len(isin), MAX_ISINS)]
+
+
+def _needs_batching(params: Dict[str, Any]) -> bool:
+    isin = params.get("isin")
+    if not (isinstance(isin, list) and len(isin) > MAX_ISINS):
+        return False
+    if params.get("page") is not None:
+        raise ValueError(
+            f"page cannot be requested for more than {MAX_ISINS} ISINs, "
+            "all pages are merged into a single one"
+        )
+    return True
+
+
+def _merge(pages: List[Dict[str, Any]], sorting: Optional[str]) -> Dict[str, Any]:
+    results = [row for page in pages for row in page["results"]]
+    if sorting is not None:
+        # timestamps of a response are all epoch numbers or all ISO strings
+        # in UTC, both compare in time order
+        results.sort(key=lambda row: row["t"], reverse=sorting == "desc")
+    return dict(
+        pages[0],
+        results=results,
+        previous=None,
+        next=None,
+        total=len(results),
+        page=1,
+        pages=1,
+    )
+
+
+def get_batched(client: Client, url: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    """Decoded response of a GET request with any number of ISINs.
+
+    ISIN lists longer than the server accepts are split into chunks
+    requested concurrently. All pages of the chunks are fetched and merged
+    into a single page, so `page` is rejected and `limit` only sets the size
+    of the requested pages. Rows are ordered by `t` with `sorting`, by chunk
+    otherwise.
+    """
+    if not _needs_batching(params):
+        data: Dict[str, Any] = client.decode(client.get(url, params=params))
+        return data
+
+    def fetch_chunk(isin: List[str]) -> List[Dict[str, Any]]:
+        pages = [client.decode(client.get(url, params=dict(params, isin=isin)))]
+        while pages[-1]["next"]:
+            pages.append(client.decode(client.get(pages[-1]["next"])))
+        return pages
+
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_CHUNKS) as executor:
+        chunks = list(executor.map(fetch_chunk, _chunks(params["isin"])))
+    return _merge([page for pages in chunks for page in pages], params.get("sorting"))
+
+
+async def aget_batched(
+    client: AsyncClient, url: str, params: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Asynchronous counterpart of `get_batched`."""
+    if not _needs_batching(params):
+        data: Dict[str, Any] = client.decode(await client.get(url, params=params))
+        return data
+
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_CHUNKS)
+
+    async def fetch_chunk(isin: List[str]) -> List[Dict[str, Any]]:
+        async with semaphore:
+            response = await client.get(url, params=dict(params, isin=isin))
+            pages = [client.decode(response)]
+            while pages[-1]["next"]:
+                pages.append(client.decode(await client.get(pages[-1]["next"])))
+            return pages
+
+    chunks = await asyncio.gather(
+        *(fetch_chunk(isin) for isin in _chunks(params["isin"]))
+    )
+    return _merge([page for pages in chunks for page in pages], params.get("sorting"))
@@ -0,0 +1,101 @@
+import json
+import os
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional
+
+from lemon.market_data.instruments import Instruments
+from lemon.market_data.model import Instrument
+from lemon.types import JSONEncoder, from_isoformat
+
+
+class InstrumentCatalog:
+    """Local copy of all the instruments, kept up to date incrementally.
+
+    The first `sync` downloads the whole catalog, following ones request only
+    instruments modified since the previous sync (`modified_since`) and merge
+    them by ISIN. With `path` the catalog is persisted in a JSON file, so the
+    full download happens only once.
+
+    Instruments removed from the API are not reported by incremental syncs,
+    use `sync(full=True)` to download the whole catalog again.
+    """
+
+    def __init__(
+        self,
+        instruments: Instruments,
+        path: Optional[str] = None,
+        limit: int = 100,
+        concurrency: int = 4,
+    ):
+        self._instruments_api = instruments
+        self._path = path
+        self._limit = limit
+        self._concurrency = concurrency
+        self._instruments: Dict[str, Instrument] = {}
+        self._synced_at: Optional[datetime] = None
+        if path is not None and os.path.exists(path):
+            self.load(path)
+
+    @property
+    def synced_at(self) -> Optional[datetime]:
+        """Server time of the last sync."""
+        return self._synced_at
+
+    @property
+    def instruments(self) -> List[Instrument]:
+        return list(self._instruments.values())
+
+    def __getitem__(self, isin: str) -> Instrument:
+        return self._instruments[isin]
+
+    def __contains__(self, isin: str) -> bool:
+        return isin in self._instruments
+
+    def __iter__(self) -> Iterator[Instrument]:
+        return iter(self._instruments.values())
+
+    def __len__(self) -> int:
+        return len(self._instruments)
+
+    def get(self, isin: str) -> Optional[Instrument]:
+        return self._instruments.get(isin)
+
+    def sync(self, full: bool = False) -> List[Instrument]:
+        """Fetch instruments changed since the last sync, return the changes."""
+        full = full or self._synced_at is None
+        response = self._instruments_api.get(
+            limit=self._limit, modified_since=None if full else self._synced_at
+        )
+        changed = response.fetch_all(concurrency=self._concurrency)
+
+        if full:
+            self._instruments = {}
+        for instrument in changed:
+            self._instruments[instrument.isin] = instrument
+        self._synced_at = response.time
+
+        if self._path is not None:
+            self.save(self._path)
+        return changed
+
+    def save(self, path: str) -> None:
+        data = {
+            "synced_at": self._synced_at,
+            "instruments": [instrument.dict() for instrument in self],
+        }
+        # never leave a truncated file behind
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as file:
+            json.dump(data, file, cls=JSONEncoder)
+        os.replace(tmp_path, path)
+
+    def load(self, path: str) -> None:
+        with open(path, encoding="utf-8") as file:
+            data = json.load(file)
+        self._synced_at = (
+            from_isoformat(data["synced_at"]) if data["synced_at"] else None
+        )
+        self._instruments = {
+            instrument["isin"]: Instrument._from_data(instrument)
+            for instrument in data["instruments"]
+        }
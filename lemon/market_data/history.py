@@ -0,0 +1,142 @@
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Any, Callable, Deque, Iterator, List, Optional, Tuple
+
+from typing_extensions import Literal
+
+from lemon.market_data.api import MarketDataAPI
+from lemon.market_data.model import OhlcData, Quote, Trade
+
+Shard = Tuple[datetime, datetime]
+
+
+def shards(from_: datetime, to: datetime, size: timedelta) -> List[Shard]:
+    """Split the range into consecutive shards of the given size."""
+    if size <= timedelta(0):
+        raise ValueError("Shard size has to be positive")
+    result = []
+    while from_ < to:
+        end = min(from_ + size, to)
+        result.append((from_, end))
+        from_ = end
+    return result
+
+
+class HistoryDownloader:
+    """Download long ranges of ohlc, quotes or trades history.
+
+    The range is split into shards (`shard`, a day by default) downloaded
+    concurrently, at most `concurrency` at the same time. Rows are yielded in
+    time order, a row on the boundary of two shards only once. Boundaries
+    are compared with timestamps of rows, so they have to be timezone aware.
+    """
+
+    def __init__(
+        self,
+        market_data: MarketDataAPI,
+        shard: timedelta = timedelta(days=1),
+        concurrency: int = 4,
+    ):
+        self._market_data = market_data
+        self._shard = shard
+        self._concurrency = concurrency
+
+    def ohlc(
+        self,
+        period: Literal["m1", "h1", "d1"],
+        isin: List[str],
+        from_: datetime,
+        to: datetime,
+        mic: Optional[str] = None,
+        decimals: Optional[bool] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[OhlcData]:
+        def get(start: datetime, end: datetime) -> Any:
+            return self._market_data.ohlc.get(
+                period,
+                isin=isin,
+                mic=mic,
+                from_=start,
+                to=end,
+                decimals=decimals,
+                sorting="asc",
+                limit=limit,
+            )
+
+        return self._download(get, from_, to)
+
+    def quotes(
+        self,
+        isin: str,
+        from_: datetime,
+        to: datetime,
+        mic: Optional[str] = None,
+        decimals: Optional[bool] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[Quote]:
+        def get(start: datetime, end: datetime) -> Any:
+            return self._market_data.quotes.get(
+                isin=isin,
+                mic=mic,
+                from_=start,
+                to=end,
+                decimals=decimals,
+                sorting="asc",
+                limit=limit,
+            )
+
+        return self._download(get, from_, to)
+
+    def trades(
+        self,
+        isin: str,
+        from_: datetime,
+        to: datetime,
+        mic: Optional[str] = None,
+        decimals: Optional[bool] = None,
+        limit: Optional[int] = None,
+    ) -> Iterator[Trade]:
+        def get(start: datetime, end: datetime) -> Any:
+            return self._market_data.trades.get(
+                isin=isin,
+                mic=mic,
+                from_=start,
+                to=end,
+                decimals=decimals,
+                sorting="asc",
+                limit=limit,
+            )
+
+        return self._download(get, from_, to)
+
+    def _download(
+        self, get: Callable[[datetime, datetime], Any], from_: datetime, to: datetime
+    ) -> Iterator[Any]:
+        def fetch(shard: Shard) -> List[Any]:
+            start, end = shard
+            rows = list(get(start, end).auto_iter())
+            # shards overlap in their boundaries, which belong to the later one
+            # (except the end of the whole range)
+            if end == to:
+                return [row for row in rows if start <= row.t <= end]
+            return [row for row in rows if start <= row.t < end]
+
+        remaining = iter(shards(from_, to, self._shard))
+        pending: Deque["Future[List[Any]]"] = deque()
+        with ThreadPoolExecutor(max_workers=self._concurrency) as executor:
+            try:
+                # keep `concurrency` shards in flight, yield them in order
+                for shard in remaining:
+                    pending.append(executor.submit(fetch, shard))
+                    if len(pending) == self._concurrency:
+                        break
+                while pending:
+                    rows = pending.popleft().result()
+                    for shard in remaining:
+                        pending.append(executor.submit(fetch, shard))
+                        break
+                    yield from rows
+            finally:
+                for future in pending:
+                    future.cancel()
@@ -0,0 +1,173 @@
+from bisect import bisect_left
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from lemon.market_data.model import Instrument, InstrumentType, InstrumentVenue
+
+
+def _normalize(text: Optional[str]) -> str:
+    return (text or "").casefold()
+
+
+def _trigrams(text: str) -> Set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+class InstrumentIndex:
+    """In-memory index of instruments, e.g. of an `InstrumentCatalog`.
+
+    Provides lookups by ISIN, WKN and symbol, search in names and titles and
+    the filters of `Instruments.get` without requests to the API.
+    """
+
+    def __init__(self, instruments: Iterable[Instrument]):
+        self._instruments = list(instruments)
+        self._by_isin: Dict[str, int] = {}
+        self._by_wkn: Dict[str, int] = {}
+        self._by_symbol: Dict[str, List[int]] = defaultdict(list)
+        self._texts: List[str] = []
+        # sorted (word, position) pairs of all words in names and titles
+        self._words: List[Tuple[str, int]] = []
+        self._by_trigram: Dict[str, Set[int]] = defaultdict(set)
+        self._by_type: Dict[str, Set[int]] = defaultdict(set)
+        self._by_mic: Dict[str, Set[int]] = defaultdict(set)
+        self._by_currency: Dict[str, Set[int]] = defaultdict(set)
+        self._by_tradable: Dict[bool, Set[int]] = defaultdict(set)
+
+        for i, instrument in enumerate(self._instruments):
+            self._by_isin[instrument.isin.upper()] = i
+            if instrument.wkn:
+                self._by_wkn[instrument.wkn.upper()] = i
+            if instrument.symbol:
+                self._by_symbol[instrument.symbol.upper()].append(i)
+
+            text = f"{_normalize(instrument.name)}\n{_normalize(instrument.title)}"
+            self._texts.append(text)
+            self._words.extend((word, i) for word in set(text.split()))
+            for trigram in _trigrams(text):
+                self._by_trigram[trigram].add(i)
+
+            self._by_type[instrument.type].add(i)
+            for venue in instrument.venues:
+                self._by_mic[venue.mic.upper()].add(i)
+                self._by_currency[venue.currency.upper()].add(i)
+                self._by_tradable[venue.tradable].add(i)
+        self._words.sort()
+
+    def __len__(self) -> int:
+        return len(self._instruments)
+
+    def by_isin(self, isin: str) -> Optional[Instrument]:
+        i = self._by_isin.get(isin.upper())
+        return None if i is None else self._instruments[i]
+
+    def by_wkn(self, wkn: str) -> Optional[Instrument]:
+        i = self._by_wkn.get(wkn.upper())
+        return None if i is None else self._instruments[i]
+
+    def by_symbol(self, symbol: str) -> List[Instrument]:
+        return [self._instruments[i] for i in self._by_symbol.get(symbol.upper(), [])]
+
+    def search(
+        self,
+        query: Optional[str] = None,
+        type: Optional[List[InstrumentType]] = None,
+        mic: Optional[List[str]] = None,
+        currency: Optional[List[str]] = None,
+        tradable: Optional[bool] = None,
+        limit: Optional[int] = None,
+    ) -> List[Instrument]:
+        """Find instruments matching the query and all the given filters.
+
+        Instruments with ISIN, WKN or symbol equal to the query come first,
+        followed by the ones with a word of name or title starting with the
+        query and the ones containing it anywhere in name or title.
+        """
+        allowed = self._filter(type, mic, currency, tradable)
+
+        if query is None:
+            positions = sorted(allowed) if allowed is not None else range(len(self))
+        else:
+            positions = self._search(query)
+            if allowed is not None:
+                positions = [i for i in positions if i in allowed]
+
+        if limit is not None:
+            positions = positions[:limit]
+        return [self._instruments[i] for i in positions]
+
+    def _search(self, query: str) -> List[int]:
+        key, text = query.strip().upper(), _normalize(query.strip())
+        if not text:
+            return []
+
+        ids = [
+            i for i in (self._by_isin.get(key), self._by_wkn.get(key)) if i is not None
+        ]
+        ids.extend(self._by_symbol.get(key, []))
+
+        # words starting with the query are adjacent in the sorted list
+        prefixed = set()
+        start = bisect_left(self._words, (text,))
+        for word, i in self._words[start:]:
+            if not word.startswith(text):
+                break
+            prefixed.add(i)
+
+        if len(text) < 3:
+            contained: Set[int] = set()
+        else:
+            candidates = set.intersection(
+                *(self._by_trigram.get(trigram, set()) for trigram in _trigrams(text))
+            )
+            contained = {i for i in candidates if text in self._texts[i]}
+
+        found: List[int] = []
+        seen: Set[int] = set()
+        for group in [ids, sorted(prefixed), sorted(contained)]:
+            for i in group:
+                if i not in seen:
+                    seen.add(i)
+                    found.append(i)
+        return found
+
+    def _filter(
+        self,
+        type: Optional[List[InstrumentType]],
+        mic: Optional[List[str]],
+        currency: Optional[List[str]],
+        tradable: Optional[bool],
+    ) -> Optional[Set[int]]:
+        sets = []
+        if type is not None:
+            sets.append(set().union(*(self._by_type.get(t, set()) for t in type)))
+        mics = {m.upper() for m in mic} if mic is not None else None
+        currencies = {c.upper() for c in currency} if currency is not None else None
+        if mics is not None:
+            sets.append(set().union(*(self._by_mic.get(m, set()) for m in mics)))
+        if currencies is not None:
+            sets.append(
+                set().union(*(self._by_currency.get(c, set()) for c in currencies))
+            )
+        if tradable is not None:
+            sets.append(self._by_tradable.get(tradable, set()))
+        if not sets:
+            return None
+
+        allowed = set.intersection(*sets)
+        if sum(f is not None for f in [mics, currencies, tradable]) > 1:
+            # venue filters have to be satisfied by the same venue
+
+            def matches(venue: InstrumentVenue) -> bool:
+                return (
+                    (mics is None or venue.mic.upper() in mics)
+                    and (currencies is None or venue.currency.upper() in currencies)
+                    and (tradable is None or venue.tradable == tradable)
+                )
+
+            allowed = {
+                i
+                for i in allowed
+                if any(matches(venue) for venue in self._instruments[i].venues)
+            }
+        return allowed
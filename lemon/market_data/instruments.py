@@ -1,12 +1,72 @@
 from datetime import datetime, timezone
 from http import HTTPStatus
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Union
 
-from lemon.base import Client
+from lemon.base import AsyncClient, Client
 from lemon.market_data.model import GetInstrumentsResponse, InstrumentType
 from lemon.types import Sorting
 
 
+def _modified_since_headers(
+    modified_since: Optional[datetime],
+) -> Optional[Dict[str, str]]:
+    if not modified_since:
+        return None
+    modified_since = modified_since.astimezone(timezone.utc)
+    return {
+        "if-modified-since": datetime.strftime(
+            modified_since, "%a, %d %b %Y %H:%M:%S GMT"
+        )
+    }
+
+
+def _instruments_params(
+    isin: Optional[List[str]],
+    search: Optional[str],
+    type: Optional[List[InstrumentType]],
+    mic: Optional[List[str]],
+    currency: Optional[List[str]],
+    tradable: Optional[bool],
+    sorting: Optional[Sorting],
+    limit: Optional[int],
+    page: Optional[int],
+) -> Dict[str, Any]:
+    return {
+        "isin": isin,
+        "search": search,
+        "type": type,
+        "mic": mic,
+        "currency": currency,
+        "tradable": tradable,
+        "sorting": sorting,
+        "limit": limit,
+        "page": page,
+    }
+
+
+def _instruments_response(
+    resp: Any,
+    client: Union[Client, AsyncClient],
+    headers: Optional[Dict[str, str]],
+) -> GetInstrumentsResponse:
+    if resp.status_code == HTTPStatus.NOT_MODIFIED:
+        data = {
+            "status": "ok",
+            "time": datetime.now(tz=timezone.utc).isoformat(timespec="milliseconds"),
+            "results": [],
+            "previous": None,
+            "next": None,
+            "total": 0,
+            "page": 0,
+            "pages": 0,
+        }
+    else:
+        data = client.decode(resp)
+    return GetInstrumentsResponse._from_data(
+        dict(data, _client=client, _headers=headers)
+    )
+
+
 class Instruments:
     def __init__(self, client: Client):
         self._client = client
@@ -24,43 +84,40 @@ class Instruments:
         page: Optional[int] = None,
         modified_since: Optional[datetime] = None,
     ) -> GetInstrumentsResponse:
-        headers = None
-        if modified_since:
-            headers = {}
-            modified_since = modified_since.astimezone(timezone.utc)
-            headers["if-modified-since"] = datetime.strftime(
-                modified_since, "%a, %d %b %Y %H:%M:%S GMT"
-            )
+        headers = _modified_since_headers(modified_since)
         resp = self._client.get(
             "instruments",
-            params={
-                "isin": isin,
-                "search": search,
-                "type": type,
-                "mic": mic,
-                "currency": currency,
-                "tradable": tradable,
-                "sorting": sorting,
-                "limit": limit,
-                "page": page,
-            },
+            params=_instruments_params(
+                isin, search, type, mic, currency, tradable, sorting, limit, page
+            ),
             headers=headers,
         )
-        if resp.status_code == HTTPStatus.NOT_MODIFIED:
-            data = {
-                "status": "ok",
-                "time": datetime.now(tz=timezone.utc).isoformat(
-                    timespec="milliseconds"
-                ),
-                "results": [],
-                "previous": None,
-                "next": None,
-                "total": 0,
-                "page": 0,
-                "pages": 0,
-            }
-        else:
-            data = resp.json()
-        return GetInstrumentsResponse._from_data(
-            dict(data, _client=self._client, _headers=headers)
+        return _instruments_response(resp, self._client, headers)
+
+
+class AsyncInstruments:
+    def __init__(self, client: AsyncClient):
+        self._client = client
+
+    async def get(
+        self,
+        isin: Optional[List[str]] = None,
+        search: Optional[str] = None,
+        type: Optional[List[InstrumentType]] = None,
+        mic: Optional[List[str]] = None,
+        currency: Optional[List[str]] = None,
+        tradable: Optional[bool] = None,
+        sorting: Optional[Sorting] = None,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        modified_since: Optional[datetime] = None,
+    ) -> GetInstrumentsResponse:
+        headers = _modified_since_headers(modified_since)
+        resp = await self._client.get(
+            "instruments",
+            params=_instruments_params(
+                isin, search, type, mic, currency, tradable, sorting, limit, page
+            ),
+            headers=headers,
         )
+        return _instruments_response(resp, self._client, headers)
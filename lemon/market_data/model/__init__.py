@@ -4,23 +4,29 @@ from .instrument import (
     InstrumentType,
     InstrumentVenue,
 )
-from .ohlc import GetOhlcResponse, OhlcData
-from .quote import GetQuotesResponse, Quote
-from .trade import GetTradesResponse, Trade
+from .ohlc import GetOhlcColumnsResponse, GetOhlcResponse, OhlcColumns, OhlcData
+from .quote import GetQuotesColumnsResponse, GetQuotesResponse, Quote, QuoteColumns
+from .trade import GetTradesColumnsResponse, GetTradesResponse, Trade, TradeColumns
 from .venue import GetVenuesResponse, OpeningHours, Venue
 
 __all__ = [
     "GetInstrumentsResponse",
+    "GetOhlcColumnsResponse",
     "GetOhlcResponse",
+    "GetQuotesColumnsResponse",
     "GetQuotesResponse",
+    "GetTradesColumnsResponse",
     "GetTradesResponse",
     "GetVenuesResponse",
     "Instrument",
     "InstrumentType",
     "InstrumentVenue",
+    "OhlcColumns",
     "OhlcData",
     "OpeningHours",
     "Quote",
+    "QuoteColumns",
     "Trade",
+    "TradeColumns",
     "Venue",
 ]
@@ -0,0 +1,177 @@
+import sys
+from array import array
+from dataclasses import fields
+from datetime import datetime
+from importlib import import_module
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from lemon.types import BaseIterableModel, BaseModel, from_isoformat
+
+TBaseColumns = TypeVar("TBaseColumns", bound="BaseColumns")
+
+if TYPE_CHECKING:
+    Column = array[Any]
+else:
+    # `array` is only subscriptable at runtime since Python 3.12
+    Column = array
+
+
+def string_column(rows: List[Dict[str, Any]], key: str) -> List[str]:
+    # ISINs and MICs repeat on every row, interning keeps a single copy of each
+    return [sys.intern(row[key]) for row in rows]
+
+
+def number_column(rows: List[Dict[str, Any]], key: str, typecode: str) -> Column:
+    values = [row[key] for row in rows]
+    try:
+        return array(typecode, values)
+    except TypeError:
+        # integer column with values encoded as floats, e.g. `274.0`
+        return array(typecode, map(int, values))
+
+
+def epoch_column(rows: List[Dict[str, Any]], key: str) -> Column:
+    values = [row[key] for row in rows]
+    if values and isinstance(values[0], str):
+        values = [round(from_isoformat(value).timestamp() * 1000) for value in values]
+    return array("q", values)
+
+
+def _import_optional(module: str, extra: str) -> Any:
+    try:
+        return import_module(module)
+    except ImportError as exc:
+        raise ImportError(
+            f"'{module}' package is required, install it with: pip install lemon[{extra}]"
+        ) from exc
+
+
+def _values_column(values: List[Any]) -> Column:
+    if values and isinstance(values[0], datetime):
+        return array("q", [round(value.timestamp() * 1000) for value in values])
+    if values and isinstance(values[0], float):
+        return array("d", values)
+    return array("q", values)
+
+
+class BaseColumns(BaseModel):
+    """Rows of a response stored as parallel columns.
+
+    Numeric columns are `array.array` instances, which support the buffer
+    protocol, e.g. `numpy.frombuffer(columns.c, dtype=columns.c.typecode)`
+    gives a NumPy view without copying. Timestamps are always epoch milliseconds.
+    """
+
+    def __len__(self) -> int:
+        return len(getattr(self, fields(self)[0].name))  # type: ignore
+
+    def __iter__(self) -> Iterator[Tuple[Any, ...]]:
+        return zip(*self._columns())
+
+    def _columns(self) -> List[Any]:
+        return [getattr(self, field.name) for field in fields(self)]  # type: ignore
+
+    def copy(self: TBaseColumns) -> TBaseColumns:
+        return type(self)(*(column[:] for column in self._columns()))
+
+    def extend(self: TBaseColumns, other: TBaseColumns) -> None:
+        for column, other_column in zip(self._columns(), other._columns()):
+            column.extend(other_column)
+
+    @classmethod
+    def _from_rows(cls: Type[TBaseColumns], rows: Iterable[Any]) -> TBaseColumns:
+        rows = list(rows)
+        return cls(
+            *(
+                _values_column([getattr(row, field.name) for row in rows])
+                if field.type is array
+                else [sys.intern(getattr(row, field.name)) for row in rows]
+                for field in fields(cls)  # type: ignore
+            )
+        )
+
+    def to_pandas(self) -> Any:
+        """Convert to `pandas.DataFrame` without creating per-row objects.
+
+        Numeric columns are NumPy views of the underlying arrays, `t` becomes
+        a UTC `datetime64[ms]` column and string columns become categoricals.
+        """
+        np = _import_optional("numpy", "pandas")
+        pd = _import_optional("pandas", "pandas")
+
+        data = {}
+        for field in fields(self):  # type: ignore
+            column = getattr(self, field.name)
+            if field.type is not array:
+                data[field.name] = pd.Categorical(column)
+            elif field.name == "t":
+                epoch = np.frombuffer(column, dtype=np.int64)
+                data[field.name] = pd.to_datetime(epoch, unit="ms", utc=True)
+            else:
+                data[field.name] = np.frombuffer(column, dtype=column.typecode)
+        return pd.DataFrame(data, copy=False)
+
+    def to_arrow(self) -> Any:
+        """Convert to `pyarrow.Table` without creating per-row objects.
+
+        `t` becomes a UTC timestamp column and string columns are dictionary
+        encoded.
+        """
+        pa = _import_optional("pyarrow", "arrow")
+        types = {"q": pa.int64(), "d": pa.float64()}
+
+        data = {}
+        for field in fields(self):  # type: ignore
+            column = getattr(self, field.name)
+            if field.type is not array:
+                data[field.name] = pa.array(
+                    column, type=pa.string()
+                ).dictionary_encode()
+                continue
+            type_ = (
+                pa.timestamp("ms", tz="UTC")
+                if field.name == "t"
+                else types[column.typecode]
+            )
+            # arrow array backed by the memory of the column, without numpy
+            data[field.name] = pa.Array.from_buffers(
+                type_, len(column), [None, pa.py_buffer(column)]
+            )
+        return pa.table(data)
+
+
+class DataFrameExportMixin:
+    """Export of market data responses, requires the response to define `to_columns`."""
+
+    __slots__ = ()
+
+    def to_pandas(self, all_pages: bool = False, prefetch: int = 0) -> Any:
+        """Convert results (of all pages with `all_pages`) to `pandas.DataFrame`."""
+        return self.to_columns(all_pages, prefetch).to_pandas()  # type: ignore
+
+    def to_arrow(self, all_pages: bool = False, prefetch: int = 0) -> Any:
+        """Convert results (of all pages with `all_pages`) to `pyarrow.Table`."""
+        return self.to_columns(all_pages, prefetch).to_arrow()  # type: ignore
+
+
+class BaseColumnsResponse(BaseIterableModel, DataFrameExportMixin):
+    def auto_concat(self, prefetch: int = 0) -> Any:
+        """Return columns of this and all following pages concatenated."""
+        pages = self._iter_pages(prefetch)
+        columns = next(pages).results.copy()
+        for page in pages:
+            columns.extend(page.results)
+        return columns
+
+    def to_columns(self, all_pages: bool = False, prefetch: int = 0) -> Any:
+        return self.auto_concat(prefetch) if all_pages else self.results
@@ -1,8 +1,25 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Union
 
-from lemon.types import BaseIterableModel, BaseModel
+from lemon.market_data.model.columns import (
+    BaseColumns,
+    BaseColumnsResponse,
+    Column,
+    DataFrameExportMixin,
+    epoch_column,
+    number_column,
+    string_column,
+)
+from lemon.types import (
+    BaseIterableModel,
+    BaseModel,
+    cached_from_isoformat,
+    from_isoformat,
+)
+
+if TYPE_CHECKING:
+    from lemon.base import AsyncClient, Client
 
 
 @dataclass
@@ -37,7 +54,10 @@ class OhlcData(BaseModel):
 
 
 @dataclass
-class GetOhlcResponse(BaseIterableModel):
+class GetOhlcResponse(BaseIterableModel, DataFrameExportMixin):
+    # converters passed to `_from_data`, reused for the following pages
+    __slots__ = ("_t_type", "_k_type")
+
     time: datetime
     results: List[OhlcData]
     total: int
@@ -49,10 +69,10 @@ class GetOhlcResponse(BaseIterableModel):
         data: Dict[str, Any],
         t_type: Callable[[Any], Union[int, float]],
         k_type: Callable[[Any], Union[datetime, int]],
-        client: "Client",
+        client: Union["Client", "AsyncClient"],
     ) -> "GetOhlcResponse":
-        return GetOhlcResponse(
-            time=datetime.fromisoformat(data["time"]),
+        response = GetOhlcResponse(
+            time=cached_from_isoformat(data["time"]),
             results=[
                 OhlcData._from_data(entry, t_type, k_type) for entry in data["results"]
             ],
@@ -63,3 +83,77 @@ class GetOhlcResponse(BaseIterableModel):
             _headers=None,
             next=data["next"],
         )
+        response._t_type = t_type  # type: ignore
+        response._k_type = k_type  # type: ignore
+        return response
+
+    def _parse_page(self, data: Dict[str, Any]) -> "GetOhlcResponse":
+        return GetOhlcResponse._from_data(
+            data=data,
+            t_type=getattr(self, "_t_type", int),
+            k_type=getattr(self, "_k_type", from_isoformat),
+            client=self._page_client(),
+        )
+
+    def to_columns(self, all_pages: bool = False, prefetch: int = 0) -> "OhlcColumns":
+        pages = self._iter_pages(prefetch) if all_pages else [self]
+        return OhlcColumns._from_rows(row for page in pages for row in page.results)
+
+
+@dataclass
+class OhlcColumns(BaseColumns):
+    isin: List[str]
+    o: Column
+    h: Column
+    l: Column
+    c: Column
+    v: Column
+    pbv: Column
+    t: Column
+    mic: List[str]
+
+    @staticmethod
+    def _from_data(  # type: ignore # pylint: disable=W0221
+        data: List[Dict[str, Any]], decimals: bool
+    ) -> "OhlcColumns":
+        typecode = "d" if decimals else "q"
+        return OhlcColumns(
+            isin=string_column(data, "isin"),
+            o=number_column(data, "o", typecode),
+            h=number_column(data, "h", typecode),
+            l=number_column(data, "l", typecode),
+            c=number_column(data, "c", typecode),
+            v=number_column(data, "v", "q"),
+            pbv=number_column(data, "pbv", typecode),
+            t=epoch_column(data, "t"),
+            mic=string_column(data, "mic"),
+        )
+
+
+@dataclass
+class GetOhlcColumnsResponse(BaseColumnsResponse):
+    time: datetime
+    results: OhlcColumns
+    total: int
+    page: int
+    pages: int
+
+    @staticmethod
+    def _from_data(  # type: ignore # pylint: disable=W0221
+        data: Dict[str, Any], decimals: bool, client: Union["Client", "AsyncClient"]
+    ) -> "GetOhlcColumnsResponse":
+        return GetOhlcColumnsResponse(
+            time=cached_from_isoformat(data["time"]),
+            results=OhlcColumns._from_data(data["results"], decimals),
+            total=int(data["total"]),
+            page=int(data["page"]),
+            pages=int(data["pages"]),
+            _client=client,
+            _headers=None,
+            next=data["next"],
+        )
+
+    def _parse_page(self, data: Dict[str, Any]) -> "GetOhlcColumnsResponse":
+        return GetOhlcColumnsResponse._from_data(
+            data, decimals=self.results.o.typecode == "d", client=self._page_client()
+        )
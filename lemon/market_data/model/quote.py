@@ -1,8 +1,25 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Union
 
-from lemon.types import BaseIterableModel, BaseModel
+from lemon.market_data.model.columns import (
+    BaseColumns,
+    BaseColumnsResponse,
+    Column,
+    DataFrameExportMixin,
+    epoch_column,
+    number_column,
+    string_column,
+)
+from lemon.types import (
+    BaseIterableModel,
+    BaseModel,
+    cached_from_isoformat,
+    from_isoformat,
+)
+
+if TYPE_CHECKING:
+    from lemon.base import AsyncClient, Client
 
 
 @dataclass
@@ -33,7 +50,9 @@ class Quote(BaseModel):
 
 
 @dataclass
-class GetQuotesResponse(BaseIterableModel):
+class GetQuotesResponse(BaseIterableModel, DataFrameExportMixin):
+    __slots__ = ("_t_type", "_k_type")
+
     time: datetime
     results: List[Quote]
     total: int
@@ -45,10 +64,10 @@ class GetQuotesResponse(BaseIterableModel):
         data: Dict[str, Any],
         t_type: Callable[[Any], Union[int, float]],
         k_type: Callable[[Any], Union[datetime, int]],
-        client: "Client",
+        client: Union["Client", "AsyncClient"],
     ) -> "GetQuotesResponse":
-        return GetQuotesResponse(
-            time=datetime.fromisoformat(data["time"]),
+        response = GetQuotesResponse(
+            time=cached_from_isoformat(data["time"]),
             results=[
                 Quote._from_data(entry, t_type, k_type) for entry in data["results"]
             ],
@@ -59,3 +78,73 @@ class GetQuotesResponse(BaseIterableModel):
             _headers=None,
             next=data["next"],
         )
+        response._t_type = t_type  # type: ignore
+        response._k_type = k_type  # type: ignore
+        return response
+
+    def _parse_page(self, data: Dict[str, Any]) -> "GetQuotesResponse":
+        return GetQuotesResponse._from_data(
+            data=data,
+            t_type=getattr(self, "_t_type", int),
+            k_type=getattr(self, "_k_type", from_isoformat),
+            client=self._page_client(),
+        )
+
+    def to_columns(self, all_pages: bool = False, prefetch: int = 0) -> "QuoteColumns":
+        pages = self._iter_pages(prefetch) if all_pages else [self]
+        return QuoteColumns._from_rows(row for page in pages for row in page.results)
+
+
+@dataclass
+class QuoteColumns(BaseColumns):
+    isin: List[str]
+    b_v: Column
+    a_v: Column
+    b: Column
+    a: Column
+    t: Column
+    mic: List[str]
+
+    @staticmethod
+    def _from_data(  # type: ignore # pylint: disable=W0221
+        data: List[Dict[str, Any]], decimals: bool
+    ) -> "QuoteColumns":
+        typecode = "d" if decimals else "q"
+        return QuoteColumns(
+            isin=string_column(data, "isin"),
+            b_v=number_column(data, "b_v", "q"),
+            a_v=number_column(data, "a_v", "q"),
+            b=number_column(data, "b", typecode),
+            a=number_column(data, "a", typecode),
+            t=epoch_column(data, "t"),
+            mic=string_column(data, "mic"),
+        )
+
+
+@dataclass
+class GetQuotesColumnsResponse(BaseColumnsResponse):
+    time: datetime
+    results: QuoteColumns
+    total: int
+    page: int
+    pages: int
+
+    @staticmethod
+    def _from_data(  # type: ignore # pylint: disable=W0221
+        data: Dict[str, Any], decimals: bool, client: Union["Client", "AsyncClient"]
+    ) -> "GetQuotesColumnsResponse":
+        return GetQuotesColumnsResponse(
+            time=cached_from_isoformat(data["time"]),
+            results=QuoteColumns._from_data(data["results"], decimals),
+            total=int(data["total"]),
+            page=int(data["page"]),
+            pages=int(data["pages"]),
+            _client=client,
+            _headers=None,
+            next=data["next"],
+        )
+
+    def _parse_page(self, data: Dict[str, Any]) -> "GetQuotesColumnsResponse":
+        return GetQuotesColumnsResponse._from_data(
+            data, decimals=self.results.b.typecode == "d", client=self._page_client()
+        )
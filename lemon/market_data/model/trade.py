@@ -1,8 +1,25 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Callable, Dict, List, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Union
 
-from lemon.types import BaseIterableModel, BaseModel
+from lemon.market_data.model.columns import (
+    BaseColumns,
+    BaseColumnsResponse,
+    Column,
+    DataFrameExportMixin,
+    epoch_column,
+    number_column,
+    string_column,
+)
+from lemon.types import (
+    BaseIterableModel,
+    BaseModel,
+    cached_from_isoformat,
+    from_isoformat,
+)
+
+if TYPE_CHECKING:
+    from lemon.base import AsyncClient, Client
 
 
 @dataclass
@@ -31,7 +48,9 @@ class Trade(BaseModel):
 
 
 @dataclass
-class GetTradesResponse(BaseIterableModel):
+class GetTradesResponse(BaseIterableModel, DataFrameExportMixin):
+    __slots__ = ("_t_type", "_k_type")
+
     time: datetime
     results: List[Trade]
     total: int
@@ -43,10 +62,10 @@ class GetTradesResponse(BaseIterableModel):
         data: Dict[str, Any],
         t_type: Callable[[Any], Union[int, float]],
         k_type: Callable[[Any], Union[datetime, int]],
-        client: "Client",
+        client: Union["Client", "AsyncClient"],
     ) -> "GetTradesResponse":
-        return GetTradesResponse(
-            time=datetime.fromisoformat(data["time"]),
+        response = GetTradesResponse(
+            time=cached_from_isoformat(data["time"]),
             results=[
                 Trade._from_data(entry, t_type, k_type) for entry in data["results"]
             ],
@@ -57,3 +76,71 @@ class GetTradesResponse(BaseIterableModel):
             _headers=None,
             next=data["next"],
         )
+        response._t_type = t_type  # type: ignore
+        response._k_type = k_type  # type: ignore
+        return response
+
+    def _parse_page(self, data: Dict[str, Any]) -> "GetTradesResponse":
+        return GetTradesResponse._from_data(
+            data=data,
+            t_type=getattr(self, "_t_type", int),
+            k_type=getattr(self, "_k_type", from_isoformat),
+            client=self._page_client(),
+        )
+
+    def to_columns(self, all_pages: bool = False, prefetch: int = 0) -> "TradeColumns":
+        pages = self._iter_pages(prefetch) if all_pages else [self]
+        return TradeColumns._from_rows(row for page in pages for row in page.results)
+
+
+@dataclass
+class TradeColumns(BaseColumns):
+    isin: List[str]
+    p: Column
+    pbv: Column
+    v: Column
+    t: Column
+    mic: List[str]
+
+    @staticmethod
+    def _from_data(  # type: ignore # pylint: disable=W0221
+        data: List[Dict[str, Any]], decimals: bool
+    ) -> "TradeColumns":
+        typecode = "d" if decimals else "q"
+        return TradeColumns(
+            isin=string_column(data, "isin"),
+            p=number_column(data, "p", typecode),
+            pbv=number_column(data, "pbv", typecode),
+            v=number_column(data, "v", "q"),
+            t=epoch_column(data, "t"),
+            mic=string_column(data, "mic"),
+        )
+
+
+@dataclass
+class GetTradesColumnsResponse(BaseColumnsResponse):
+    time: datetime
+    results: TradeColumns
+    total: int
+    page: int
+    pages: int
+
+    @staticmethod
+    def _from_data(  # type: ignore # pylint: disable=W0221
+        data: Dict[str, Any], decimals: bool, client: Union["Client", "AsyncClient"]
+    ) -> "GetTradesColumnsResponse":
+        return GetTradesColumnsResponse(
+            time=cached_from_isoformat(data["time"]),
+            results=TradeColumns._from_data(data["results"], decimals),
+            total=int(data["total"]),
+            page=int(data["page"]),
+            pages=int(data["pages"]),
+            _client=client,
+            _headers=None,
+            next=data["next"],
+        )
+
+    def _parse_page(self, data: Dict[str, Any]) -> "GetTradesColumnsResponse":
+        return GetTradesColumnsResponse._from_data(
+            data, decimals=self.results.p.typecode == "d", client=self._page_client()
+        )
@@ -1,17 +1,53 @@
 from datetime import datetime
-from typing import List, Optional, Union
+from typing import List, Optional, Union, overload
 
 from typing_extensions import Literal
 
-from lemon.base import Client
-from lemon.market_data.model import GetOhlcResponse
-from lemon.types import Days, Sorting
+from lemon.base import AsyncClient, Client
+from lemon.market_data.batching import aget_batched, get_batched
+from lemon.market_data.model import GetOhlcColumnsResponse, GetOhlcResponse
+from lemon.types import Days, Sorting, from_isoformat
 
 
 class Ohlc:
     def __init__(self, client: Client):
         self._client = client
 
+    @overload
+    def get(
+        self,
+        period: Literal["m1", "h1", "d1"],
+        isin: List[str],
+        mic: Optional[str] = ...,
+        from_: Union[datetime, Literal["latest"], None] = ...,
+        to: Union[datetime, Days, None] = ...,
+        decimals: Optional[bool] = ...,
+        epoch: Optional[bool] = ...,
+        sorting: Optional[Sorting] = ...,
+        limit: Optional[int] = ...,
+        page: Optional[int] = ...,
+        columnar: Literal[False] = ...,
+    ) -> GetOhlcResponse:
+        ...
+
+    @overload
+    def get(
+        self,
+        period: Literal["m1", "h1", "d1"],
+        isin: List[str],
+        mic: Optional[str] = ...,
+        from_: Union[datetime, Literal["latest"], None] = ...,
+        to: Union[datetime, Days, None] = ...,
+        decimals: Optional[bool] = ...,
+        epoch: Optional[bool] = ...,
+        sorting: Optional[Sorting] = ...,
+        limit: Optional[int] = ...,
+        page: Optional[int] = ...,
+        *,
+        columnar: Literal[True],
+    ) -> GetOhlcColumnsResponse:
+        ...
+
     def get(
         self,
         period: Literal["m1", "h1", "d1"],
@@ -24,12 +60,100 @@ class Ohlc:
         sorting: Optional[Sorting] = None,
         limit: Optional[int] = None,
         page: Optional[int] = None,
+        columnar: bool = False,
+    ) -> Union[GetOhlcResponse, GetOhlcColumnsResponse]:
+        period = period.strip().lower()  # type: ignore
+        if not period:
+            raise ValueError("Invalid period value")
+
+        data = get_batched(
+            self._client,
+            f"ohlc/{period}",
+            params={
+                "isin": isin,
+                "mic": mic,
+                "from": from_,
+                "to": f"P{to}D" if isinstance(to, Days) else to,
+                "decimals": decimals,
+                "epoch": epoch,
+                "sorting": sorting,
+                "limit": limit,
+                "page": page,
+            },
+        )
+        if columnar:
+            return GetOhlcColumnsResponse._from_data(
+                data=data,
+                decimals=bool(decimals),
+                client=self._client,
+            )
+        return GetOhlcResponse._from_data(
+            data=data,
+            t_type=float if decimals else int,
+            k_type=int if epoch else from_isoformat,
+            client=self._client,
+        )
+
+
+class AsyncOhlc:
+    def __init__(self, client: AsyncClient):
+        self._client = client
+
+    @overload
+    async def get(
+        self,
+        period: Literal["m1", "h1", "d1"],
+        isin: List[str],
+        mic: Optional[str] = ...,
+        from_: Union[datetime, Literal["latest"], None] = ...,
+        to: Union[datetime, Days, None] = ...,
+        decimals: Optional[bool] = ...,
+        epoch: Optional[bool] = ...,
+        sorting: Optional[Sorting] = ...,
+        limit: Optional[int] = ...,
+        page: Optional[int] = ...,
+        columnar: Literal[False] = ...,
     ) -> GetOhlcResponse:
+        ...
+
+    @overload
+    async def get(
+        self,
+        period: Literal["m1", "h1", "d1"],
+        isin: List[str],
+        mic: Optional[str] = ...,
+        from_: Union[datetime, Literal["latest"], None] = ...,
+        to: Union[datetime, Days, None] = ...,
+        decimals: Optional[bool] = ...,
+        epoch: Optional[bool] = ...,
+        sorting: Optional[Sorting] = ...,
+        limit: Optional[int] = ...,
+        page: Optional[int] = ...,
+        *,
+        columnar: Literal[True],
+    ) -> GetOhlcColumnsResponse:
+        ...
+
+    async def get(
+        self,
+        period: Literal["m1", "h1", "d1"],
+        isin: List[str],
+        mic: Optional[str] = None,
+        from_: Union[datetime, Literal["latest"], None] = None,
+        to: Union[datetime, Days, None] = None,
+        decimals: Optional[bool] = None,
+        epoch: Optional[bool] = None,
+        sorting: Optional[Sorting] = None,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        columnar: bool = False,
+    ) -> Union[GetOhlcResponse, GetOhlcColumnsResponse]:
         period = period.strip().lower()  # type: ignore
         if not period:
             raise ValueError("Invalid period value")
 
-        resp = self._client.get(
+        data = await aget_batched(
+            self._client,
             f"ohlc/{period}",
             params={
                 "isin": isin,
@@ -43,9 +167,15 @@ class Ohlc:
                 "page": page,
             },
         )
+        if columnar:
+            return GetOhlcColumnsResponse._from_data(
+                data=data,
+                decimals=bool(decimals),
+                client=self._client,
+            )
         return GetOhlcResponse._from_data(
-            data=resp.json(),
+            data=data,
             t_type=float if decimals else int,
-            k_type=int if epoch else datetime.fromisoformat,  # type: ignore
+            k_type=int if epoch else from_isoformat,
             client=self._client,
         )
@@ -0,0 +1,116 @@
+import time
+from concurrent.futures import Future
+from threading import Lock
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from lemon.market_data.model import Quote
+from lemon.market_data.quotes import Quotes
+
+
+class _Batch:
+    def __init__(self) -> None:
+        self.isins: Set[str] = set()
+        self.future: "Future[Dict[str, Quote]]" = Future()
+
+
+class QuoteCache:
+    """Latest quotes by ISIN and venue, refreshed when older than allowed.
+
+    Callers pass the maximal age of quotes they accept (`max_staleness`
+    seconds since the quote was received, `max_staleness` of the cache by
+    default). Quotes missing or too old, requested by any callers within
+    `batch_window` seconds, are fetched with a single `quotes/latest`
+    request.
+    """
+
+    def __init__(
+        self,
+        quotes: Quotes,
+        max_staleness: float = 1.0,
+        batch_window: float = 0.005,
+        decimals: Optional[bool] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._quotes = quotes
+        self._max_staleness = max_staleness
+        self._batch_window = batch_window
+        self._decimals = decimals
+        self._clock = clock
+        self._lock = Lock()
+        # (isin, mic) -> (received at, quote)
+        self._entries: Dict[Tuple[str, Optional[str]], Tuple[float, Quote]] = {}
+        # batches collecting ISINs to fetch, by venue
+        self._batches: Dict[Optional[str], _Batch] = {}
+
+    def get(
+        self,
+        isin: str,
+        mic: Optional[str] = None,
+        max_staleness: Optional[float] = None,
+    ) -> Optional[Quote]:
+        """Latest quote of the instrument, `None` if there is none."""
+        return self.get_many([isin], mic, max_staleness).get(isin)
+
+    def get_many(
+        self,
+        isin: List[str],
+        mic: Optional[str] = None,
+        max_staleness: Optional[float] = None,
+    ) -> Dict[str, Quote]:
+        if max_staleness is None:
+            max_staleness = self._max_staleness
+
+        quotes, batch, leader = {}, None, False
+        with self._lock:
+            now = self._clock()
+            for isin_ in isin:
+                entry = self._entries.get((isin_, mic))
+                if entry is not None and now - entry[0] <= max_staleness:
+                    quotes[isin_] = entry[1]
+
+            missing = [isin_ for isin_ in isin if isin_ not in quotes]
+            if missing:
+                batch = self._batches.get(mic)
+                if batch is None:
+                    leader, batch = True, _Batch()
+                    self._batches[mic] = batch
+                batch.isins.update(missing)
+
+        if batch is None:
+            return quotes
+        if leader:
+            self._fetch(batch, mic)
+        fetched = batch.future.result()
+        quotes.update((isin_, fetched[isin_]) for isin_ in missing if isin_ in fetched)
+        return quotes
+
+    def invalidate(self, isin: Optional[str] = None) -> None:
+        """Drop quotes of the instrument, or all of them."""
+        with self._lock:
+            if isin is None:
+                self._entries.clear()
+            else:
+                for key in [key for key in self._entries if key[0] == isin]:
+                    del self._entries[key]
+
+    def _fetch(self, batch: _Batch, mic: Optional[str]) -> None:
+        # wait for other callers to add their ISINs to the batch
+        if self._batch_window > 0:
+            time.sleep(self._batch_window)
+        with self._lock:
+            del self._batches[mic]
+
+        try:
+            response = self._quotes.get_latest(
+                isin=sorted(batch.isins), mic=mic, decimals=self._decimals
+            )
+            fetched = {quote.isin: quote for quote in response.auto_iter()}
+        except BaseException as exc:
+            batch.future.set_exception(exc)
+            return
+
+        with self._lock:
+            now = self._clock()
+            for isin, quote in fetched.items():
+                self._entries[(isin, mic)] = (now, quote)
+        batch.future.set_result(fetched)
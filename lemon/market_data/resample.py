@@ -0,0 +1,222 @@
+from array import array
+from datetime import date, datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from lemon.market_data.model import OhlcColumns, OhlcData, OpeningHours
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None  # type: ignore
+
+DAY_MS = 86_400_000
+
+Session = Tuple[int, int]
+
+
+class _Sessions:
+    """Trading sessions of a venue in epoch milliseconds, cached by UTC day."""
+
+    def __init__(self, opening_hours: OpeningHours):
+        self._start = opening_hours.start
+        self._end = opening_hours.end
+        self._by_day: Dict[int, List[Session]] = {}
+
+    def _session(self, day: date) -> Session:
+        def epoch(value: Any) -> int:
+            naive = datetime.combine(day, value.replace(tzinfo=None))
+            tz = value.tzinfo
+            # `pytz` timezones have to localize, `replace` would use LMT offsets
+            local = (
+                tz.localize(naive)
+                if hasattr(tz, "localize")
+                else naive.replace(tzinfo=tz)
+            )
+            return round(local.timestamp() * 1000)
+
+        return epoch(self._start), epoch(self._end)
+
+    def of_day(self, day: int) -> List[Session]:
+        """Sessions which may contain times of the UTC day (days since epoch)."""
+        sessions = self._by_day.get(day)
+        if sessions is None:
+            # local dates may differ from the UTC date by a day
+            utc_date = date(1970, 1, 1) + timedelta(days=day)
+            sessions = self._by_day[day] = [
+                self._session(utc_date + timedelta(days=offset))
+                for offset in (-1, 0, 1)
+            ]
+        return sessions
+
+    def find(self, t: int) -> Optional[Session]:
+        for start, end in self.of_day(t // DAY_MS):
+            if start <= t < end:
+                return start, end
+        return None
+
+
+def resample(
+    columns: OhlcColumns,
+    minutes: int,
+    opening_hours: Optional[OpeningHours] = None,
+) -> OhlcColumns:
+    """Combine (e.g. `m1`) candles into candles of the given number of minutes.
+
+    Open is taken from the first and close from the last candle, high/low
+    are the extremes, volume and `pbv` (turnover) are summed. With
+    `opening_hours` of the venue (`Venue.opening_hours`) candles start at
+    the opening of each session and rows outside of the sessions are
+    dropped, otherwise candles are aligned to the UTC midnight. Rows are
+    processed with numpy when it is installed (e.g. with `lemon[pandas]`).
+    """
+    if minutes <= 0:
+        raise ValueError("Number of minutes has to be positive")
+    size = minutes * 60_000
+    sessions = _Sessions(opening_hours) if opening_hours is not None else None
+    if np is None:
+        return _resample_rows(columns, size, sessions)
+    return _resample_arrays(columns, size, sessions)
+
+
+def _factorize(values: List[str]) -> Tuple[List[str], Any]:
+    # sorted distinct values and the index of every value among them
+    names = sorted(dict.fromkeys(values))
+    if len(names) == 1:
+        return names, np.zeros(len(values), dtype=np.int64)
+    codes = {name: code for code, name in enumerate(names)}
+    return names, np.fromiter(
+        map(codes.__getitem__, values), dtype=np.int64, count=len(values)
+    )
+
+
+def _resample_arrays(
+    columns: OhlcColumns, size: int, sessions: Optional[_Sessions]
+) -> OhlcColumns:
+    # numpy: sort rows by candle and reduce the runs of each candle
+    t = np.frombuffer(columns.t, dtype=np.int64)
+    if sessions is None:
+        start = t - t % size
+        keep = np.ones(len(t), dtype=bool)
+    else:
+        bounds = np.array(
+            sorted(
+                {
+                    session
+                    for day in np.unique(t // DAY_MS).tolist()
+                    for session in sessions.of_day(day)
+                }
+            ),
+            dtype=np.int64,
+        ).reshape(-1, 2)
+        index = np.searchsorted(bounds[:, 0], t, side="right") - 1
+        opening = bounds[index.clip(0), 0]
+        keep = (index >= 0) & (t < bounds[index.clip(0), 1])
+        start = t - (t - opening) % size
+
+    isins, isin_codes = _factorize(columns.isin)
+    mics, mic_codes = _factorize(columns.mic)
+    instrument = isin_codes * len(mics) + mic_codes
+    rows = np.flatnonzero(keep)
+    # stable, so rows with equal `t` keep their order
+    rows = rows[np.lexsort((t[rows], instrument[rows], start[rows]))]
+    start, instrument = start[rows], instrument[rows]
+    new_candle = np.ones(len(rows), dtype=bool)
+    new_candle[1:] = (start[1:] != start[:-1]) | (instrument[1:] != instrument[:-1])
+    first = np.flatnonzero(new_candle)
+    last = np.append(first[1:], len(rows))[: len(first)] - 1
+
+    def values(column: "array[Any]") -> Any:
+        return np.frombuffer(column, dtype=column.typecode)[rows]
+
+    def to_array(typecode: str, data: Any) -> "array[Any]":
+        return array(typecode, data.tobytes())
+
+    return OhlcColumns(
+        isin=[isins[code] for code in isin_codes[rows[first]].tolist()],
+        o=to_array(columns.o.typecode, values(columns.o)[first]),
+        h=to_array(columns.h.typecode, np.maximum.reduceat(values(columns.h), first)),
+        l=to_array(columns.l.typecode, np.minimum.reduceat(values(columns.l), first)),
+        c=to_array(columns.c.typecode, values(columns.c)[last]),
+        v=to_array(columns.v.typecode, np.add.reduceat(values(columns.v), first)),
+        pbv=to_array(columns.pbv.typecode, np.add.reduceat(values(columns.pbv), first)),
+        t=to_array("q", start[first]),
+        mic=[mics[code] for code in mic_codes[rows[first]].tolist()],
+    )
+
+
+def _resample_rows(
+    columns: OhlcColumns, size: int, sessions: Optional[_Sessions]
+) -> OhlcColumns:
+    # (isin, mic, start) -> [o, h, l, c, v, pbv, first t, last t]
+    candles: Dict[Tuple[str, str, int], List[Any]] = {}
+    for isin, o, h, l, c, v, pbv, t, mic in zip(
+        columns.isin,
+        columns.o,
+        columns.h,
+        columns.l,
+        columns.c,
+        columns.v,
+        columns.pbv,
+        columns.t,
+        columns.mic,
+    ):
+        if sessions is None:
+            start = t - t % size
+        else:
+            session = sessions.find(t)
+            if session is None:
+                continue
+            start = t - (t - session[0]) % size
+
+        key = (isin, mic, start)
+        candle = candles.get(key)
+        if candle is None:
+            candles[key] = [o, h, l, c, v, pbv, t, t]
+            continue
+        if h > candle[1]:
+            candle[1] = h
+        if l < candle[2]:
+            candle[2] = l
+        candle[4] += v
+        candle[5] += pbv
+        if t < candle[6]:
+            candle[0], candle[6] = o, t
+        if t >= candle[7]:
+            candle[3], candle[7] = c, t
+
+    keys = sorted(candles, key=lambda key: (key[2], key[0], key[1]))
+    rows = [candles[key] for key in keys]
+    return OhlcColumns(
+        isin=[key[0] for key in keys],
+        o=array(columns.o.typecode, [row[0] for row in rows]),
+        h=array(columns.h.typecode, [row[1] for row in rows]),
+        l=array(columns.l.typecode, [row[2] for row in rows]),
+        c=array(columns.c.typecode, [row[3] for row in rows]),
+        v=array(columns.v.typecode, [row[4] for row in rows]),
+        pbv=array(columns.pbv.typecode, [row[5] for row in rows]),
+        t=array("q", [key[2] for key in keys]),
+        mic=[key[1] for key in keys],
+    )
+
+
+def resample_rows(
+    rows: Iterable[OhlcData],
+    minutes: int,
+    opening_hours: Optional[OpeningHours] = None,
+) -> List[OhlcData]:
+    """`resample` for rows of `Ohlc.get` responses."""
+    columns = resample(OhlcColumns._from_rows(rows), minutes, opening_hours)
+    return [
+        OhlcData(
+            isin=isin,
+            o=o,
+            h=h,
+            l=l,
+            c=c,
+            v=v,
+            pbv=pbv,
+            t=datetime.fromtimestamp(t / 1000, tz=timezone.utc),
+            mic=mic,
+        )
+        for isin, o, h, l, c, v, pbv, t, mic in columns
+    ]
@@ -0,0 +1,168 @@
+import sqlite3
+from datetime import datetime, timezone
+from threading import Lock
+from typing import List, Tuple
+
+from typing_extensions import Literal
+
+from lemon.market_data.model import OhlcData
+from lemon.market_data.ohlc import Ohlc
+
+Period = Literal["m1", "h1", "d1"]
+
+PERIOD_MS = {"m1": 60_000, "h1": 3_600_000, "d1": 86_400_000}
+
+
+def _to_ms(value: datetime) -> int:
+    return int(value.timestamp() * 1000)
+
+
+def _from_ms(value: int) -> datetime:
+    return datetime.fromtimestamp(value / 1000, tz=timezone.utc)
+
+
+def _gaps(
+    covered: List[Tuple[int, int]], start: int, end: int
+) -> List[Tuple[int, int]]:
+    """Parts of [start, end) not covered by the sorted ranges."""
+    gaps, cursor = [], start
+    for covered_start, covered_end in covered:
+        if covered_start >= end:
+            break
+        if covered_start > cursor:
+            gaps.append((cursor, covered_start))
+        cursor = max(cursor, covered_end)
+    if cursor < end:
+        gaps.append((cursor, end))
+    return gaps
+
+
+class OhlcStore:
+    """Ohlc rows stored in a SQLite database, fetched from the API only once.
+
+    The store remembers which time ranges of an ISIN, venue and period it
+    holds, `get` requests only the missing ones and reads the rest from disk.
+    The database is read through a memory map of up to `mmap_size` bytes.
+
+    Rows are stored with decimal prices. Candles still in progress (by server
+    time) are returned, but not stored.
+    """
+
+    def __init__(self, ohlc: Ohlc, path: str, mmap_size: int = 256 * 1024**2):
+        self._ohlc = ohlc
+        self._lock = Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(f"PRAGMA mmap_size = {int(mmap_size)}")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS ohlc ("
+                "isin TEXT, mic TEXT, period TEXT, t INTEGER, "
+                "o REAL, h REAL, l REAL, c REAL, v INTEGER, pbv REAL, "
+                "PRIMARY KEY (isin, mic, period, t)) WITHOUT ROWID"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS coverage ("
+                "isin TEXT, mic TEXT, period TEXT, start INTEGER, end INTEGER, "
+                "PRIMARY KEY (isin, mic, period, start))"
+            )
+
+    def get(
+        self, period: Period, isin: str, mic: str, from_: datetime, to: datetime
+    ) -> List[OhlcData]:
+        """Rows of [from_, to) ordered by time."""
+        start, end = _to_ms(from_), _to_ms(to)
+        in_progress = []
+        for gap_start, gap_end in _gaps(self.coverage(period, isin, mic), start, end):
+            in_progress.extend(self._fetch(period, isin, mic, gap_start, gap_end))
+
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT t, o, h, l, c, v, pbv FROM ohlc "
+                "WHERE isin = ? AND mic = ? AND period = ? AND t >= ? AND t < ? "
+                "ORDER BY t",
+                (isin, mic, period, start, end),
+            ).fetchall()
+        stored = [
+            OhlcData(
+                isin=isin, o=o, h=h, l=l, c=c, v=v, pbv=pbv, t=_from_ms(t), mic=mic
+            )
+            for t, o, h, l, c, v, pbv in rows
+        ]
+        return stored + sorted(in_progress, key=lambda row: row.t)
+
+    def coverage(self, period: Period, isin: str, mic: str) -> List[Tuple[int, int]]:
+        """Sorted [start, end) ranges in epoch milliseconds held by the store."""
+        with self._lock:
+            return self._connection.execute(
+                "SELECT start, end FROM coverage "
+                "WHERE isin = ? AND mic = ? AND period = ? ORDER BY start",
+                (isin, mic, period),
+            ).fetchall()
+
+    def _fetch(
+        self, period: Period, isin: str, mic: str, start: int, end: int
+    ) -> List[OhlcData]:
+        response = self._ohlc.get(
+            period,
+            isin=[isin],
+            mic=mic,
+            from_=_from_ms(start),
+            to=_from_ms(end),
+            decimals=True,
+            epoch=True,
+            sorting="asc",
+        )
+        rows = [row for row in response.auto_iter() if start <= row.t < end]
+
+        # candles starting before the last full period may still change
+        step = PERIOD_MS[period]
+        complete_until = max(start, min(end, _to_ms(response.time) // step * step))
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO ohlc VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        isin,
+                        mic,
+                        period,
+                        row.t,
+                        row.o,
+                        row.h,
+                        row.l,
+                        row.c,
+                        row.v,
+                        row.pbv,
+                    )
+                    for row in rows
+                    if row.t < complete_until
+                ],
+            )
+            if complete_until > start:
+                self._cover(period, isin, mic, start, complete_until)
+
+        in_progress = [row for row in rows if row.t >= complete_until]
+        for row in in_progress:
+            row.t = _from_ms(row.t)
+        return in_progress
+
+    def _cover(self, period: Period, isin: str, mic: str, start: int, end: int) -> None:
+        # merge with overlapping and adjacent ranges
+        key = (isin, mic, period)
+        ranges = self._connection.execute(
+            "SELECT start, end FROM coverage WHERE isin = ? AND mic = ? "
+            "AND period = ? AND start <= ? AND end >= ?",
+            (*key, end, start),
+        ).fetchall()
+        for range_start, range_end in ranges:
+            start, end = min(start, range_start), max(end, range_end)
+        self._connection.execute(
+            "DELETE FROM coverage WHERE isin = ? AND mic = ? AND period = ? "
+            "AND start >= ? AND end <= ?",
+            (*key, start, end),
+        )
+        self._connection.execute(
+            "INSERT INTO coverage VALUES (?, ?, ?, ?, ?)", (*key, start, end)
+        )
+
+    def close(self) -> None:
+        self._connection.close()
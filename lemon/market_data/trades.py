@@ -1,15 +1,47 @@
 from datetime import datetime
-from typing import List, Optional, Union
+from typing import List, Optional, Union, overload
 
-from lemon.base import Client
-from lemon.market_data.model import GetTradesResponse
-from lemon.types import Days, Sorting
+from typing_extensions import Literal
+
+from lemon.base import AsyncClient, Client
+from lemon.market_data.batching import aget_batched, get_batched
+from lemon.market_data.model import GetTradesColumnsResponse, GetTradesResponse
+from lemon.types import Days, Sorting, from_isoformat
 
 
 class Trades:
     def __init__(self, client: Client):
         self._client = client
 
+    @overload
+    def get_latest(
+        self,
+        isin: List[str],
+        mic: Optional[str] = ...,
+        decimals: Optional[bool] = ...,
+        epoch: Optional[bool] = ...,
+        sorting: Optional[Sorting] = ...,
+        limit: Optional[int] = ...,
+        page: Optional[int] = ...,
+        columnar: Literal[False] = ...,
+    ) -> GetTradesResponse:
+        ...
+
+    @overload
+    def get_latest(
+        self,
+        isin: List[str],
+        mic: Optional[str] = ...,
+        decimals: Optional[bool] = ...,
+        epoch: Optional[bool] = ...,
+        sorting: Optional[Sorting] = ...,
+        limit: Optional[int] = ...,
+        page: Optional[int] = ...,
+        *,
+        columnar: Literal[True],
+    ) -> GetTradesColumnsResponse:
+        ...
+
     def get_latest(
         self,
         isin: List[str],
@@ -19,8 +51,10 @@ class Trades:
         sorting: Optional[Sorting] = None,
         limit: Optional[int] = None,
         page: Optional[int] = None,
-    ) -> GetTradesResponse:
-        resp = self._client.get(
+        columnar: bool = False,
+    ) -> Union[GetTradesResponse, GetTradesColumnsResponse]:
+        data = get_batched(
+            self._client,
             "trades/latest",
             params={
                 "isin": isin,
@@ -32,13 +66,52 @@ class Trades:
                 "page": page,
             },
         )
+        if columnar:
+            return GetTradesColumnsResponse._from_data(
+                data=data,
+                decimals=bool(decimals),
+                client=self._client,
+            )
         return GetTradesResponse._from_data(
-            data=resp.json(),
+            data=data,
             t_type=float if decimals else int,
-            k_type=int if epoch else datetime.fromisoformat,  # type: ignore
+            k_type=int if epoch else from_isoformat,
             client=self._client,
         )
 
+    @overload
+    def get(
+        self,
+        isin: str,
+        mic: Optional[str] = ...,
+        from_: Optional[datetime] = ...,
+        to: Optional[Union[datetime, Days]] = ...,
+        decimals: Optional[bool] = ...,
+        epoch: Optional[bool] = ...,
+        sorting: Optional[Sorting] = ...,
+        limit: Optional[int] = ...,
+        page: Optional[int] = ...,
+        columnar: Literal[False] = ...,
+    ) -> GetTradesResponse:
+        ...
+
+    @overload
+    def get(
+        self,
+        isin: str,
+        mic: Optional[str] = ...,
+        from_: Optional[datetime] = ...,
+        to: Optional[Union[datetime, Days]] = ...,
+        decimals: Optional[bool] = ...,
+        epoch: Optional[bool] = ...,
+        sorting: Optional[Sorting] = ...,
+        limit: Optional[int] = ...,
+        page: Optional[int] = ...,
+        *,
+        columnar: Literal[True],
+    ) -> GetTradesColumnsResponse:
+        ...
+
     def get(
         self,
         isin: str,
@@ -50,7 +123,8 @@ class Trades:
         sorting: Optional[Sorting] = None,
         limit: Optional[int] = None,
         page: Optional[int] = None,
-    ):
+        columnar: bool = False,
+    ) -> Union[GetTradesResponse, GetTradesColumnsResponse]:
         resp = self._client.get(
             "trades",
             params={
@@ -65,9 +139,159 @@ class Trades:
                 "page": page,
             },
         )
+        if columnar:
+            return GetTradesColumnsResponse._from_data(
+                data=self._client.decode(resp),
+                decimals=bool(decimals),
+                client=self._client,
+            )
+        return GetTradesResponse._from_data(
+            data=self._client.decode(resp),
+            t_type=float if decimals else int,
+            k_type=int if epoch else from_isoformat,
+            client=self._client,
+        )
+
+
+class AsyncTrades:
+    def __init__(self, client: AsyncClient):
+        self._client = client
+
+    @overload
+    async def get_latest(
+        self,
+        isin: List[str],
+        mic: Optional[str] = ...,
+        decimals: Optional[bool] = ...,
+        epoch: Optional[bool] = ...,
+        sorting: Optional[Sorting] = ...,
+        limit: Optional[int] = ...,
+        page: Optional[int] = ...,
+        columnar: Literal[False] = ...,
+    ) -> GetTradesResponse:
+        ...
+
+    @overload
+    async def get_latest(
+        self,
+        isin: List[str],
+        mic: Optional[str] = ...,
+        decimals: Optional[bool] = ...,
+        epoch: Optional[bool] = ...,
+        sorting: Optional[Sorting] = ...,
+        limit: Optional[int] = ...,
+        page: Optional[int] = ...,
+        *,
+        columnar: Literal[True],
+    ) -> GetTradesColumnsResponse:
+        ...
+
+    async def get_latest(
+        self,
+        isin: List[str],
+        mic: Optional[str] = None,
+        decimals: Optional[bool] = None,
+        epoch: Optional[bool] = None,
+        sorting: Optional[Sorting] = None,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        columnar: bool = False,
+    ) -> Union[GetTradesResponse, GetTradesColumnsResponse]:
+        data = await aget_batched(
+            self._client,
+            "trades/latest",
+            params={
+                "isin": isin,
+                "mic": mic,
+                "decimals": decimals,
+                "epoch": epoch,
+                "sorting": sorting,
+                "limit": limit,
+                "page": page,
+            },
+        )
+        if columnar:
+            return GetTradesColumnsResponse._from_data(
+                data=data,
+                decimals=bool(decimals),
+                client=self._client,
+            )
+        return GetTradesResponse._from_data(
+            data=data,
+            t_type=float if decimals else int,
+            k_type=int if epoch else from_isoformat,
+            client=self._client,
+        )
+
+    @overload
+    async def get(
+        self,
+        isin: str,
+        mic: Optional[str] = ...,
+        from_: Optional[datetime] = ...,
+        to: Optional[Union[datetime, Days]] = ...,
+        decimals: Optional[bool] = ...,
+        epoch: Optional[bool] = ...,
+        sorting: Optional[Sorting] = ...,
+        limit: Optional[int] = ...,
+        page: Optional[int] = ...,
+        columnar: Literal[False] = ...,
+    ) -> GetTradesResponse:
+        ...
+
+    @overload
+    async def get(
+        self,
+        isin: str,
+        mic: Optional[str] = ...,
+        from_: Optional[datetime] = ...,
+        to: Optional[Union[datetime, Days]] = ...,
+        decimals: Optional[bool] = ...,
+        epoch: Optional[bool] = ...,
+        sorting: Optional[Sorting] = ...,
+        limit: Optional[int] = ...,
+        page: Optional[int] = ...,
+        *,
+        columnar: Literal[True],
+    ) -> GetTradesColumnsResponse:
+        ...
+
+    async def get(
+        self,
+        isin: str,
+        mic: Optional[str] = None,
+        from_: Optional[datetime] = None,
+        to: Optional[Union[datetime, Days]] = None,
+        decimals: Optional[bool] = None,
+        epoch: Optional[bool] = None,
+        sorting: Optional[Sorting] = None,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+        columnar: bool = False,
+    ) -> Union[GetTradesResponse, GetTradesColumnsResponse]:
+        resp = await self._client.get(
+            "trades",
+            params={
+                "isin": isin,
+                "mic": mic,
+                "from": from_,
+                "to": f"P{to}D" if isinstance(to, Days) else to,
+                "decimals": decimals,
+                "epoch": epoch,
+                "sorting": sorting,
+                "limit": limit,
+                "page": page,
+            },
+        )
+        if columnar:
+            return GetTradesColumnsResponse._from_data(
+                data=self._client.decode(resp),
+                decimals=bool(decimals),
+                client=self._client,
+            )
         return GetTradesResponse._from_data(
-            data=resp.json(),
+            data=self._client.decode(resp),
             t_type=float if decimals else int,
-            k_type=int if epoch else datetime.fromisoformat,  # type: ignore
+            k_type=int if epoch else from_isoformat,
             client=self._client,
         )
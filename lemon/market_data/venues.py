@@ -1,6 +1,6 @@
 from typing import List, Optional
 
-from lemon.base import Client
+from lemon.base import AsyncClient, Client
 from lemon.market_data.model import GetVenuesResponse
 from lemon.types import Sorting
 
@@ -25,4 +25,27 @@ class Venues:
                 "page": page,
             },
         )
-        return GetVenuesResponse._from_data(resp.json())
+        return GetVenuesResponse._from_data(self._client.decode(resp))
+
+
+class AsyncVenues:
+    def __init__(self, client: AsyncClient):
+        self._client = client
+
+    async def get(
+        self,
+        mic: Optional[List[str]] = None,
+        sorting: Optional[Sorting] = None,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+    ) -> GetVenuesResponse:
+        resp = await self._client.get(
+            "venues",
+            params={
+                "mic": mic,
+                "sorting": sorting,
+                "limit": limit,
+                "page": page,
+            },
+        )
+        return GetVenuesResponse._from_data(self._client.decode(resp))
@@ -0,0 +1,179 @@
+from collections import deque
+from concurrent.futures import Future
+from threading import Condition, Thread
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple, TypeVar
+
+from typing_extensions import Literal
+
+from lemon.api import Api, create
+from lemon.transport import Transport
+
+T = TypeVar("T")
+
+Task = Tuple["Future[Any]", Callable[..., Any], Tuple[Any, ...], Dict[str, Any]]
+
+
+class _Account:
+    __slots__ = ("api", "pending", "in_flight")
+
+    def __init__(self, api: Api):
+        self.api = api
+        self.pending: Deque[Task] = deque()
+        self.in_flight = 0
+
+
+class ApiPool:
+    """Clients of many accounts sharing one transport and one set of workers.
+
+    Calls are submitted per account and executed on `workers` threads. At most
+    `max_concurrency_per_account` calls of a single account run at the same
+    time and accounts with pending calls are served in turns, so a bulk job of
+    one account cannot starve calls of the other accounts.
+    """
+
+    def __init__(
+        self,
+        transport: Optional[Transport] = None,
+        workers: int = 8,
+        max_concurrency_per_account: int = 2,
+        env: Literal["paper", "money", "live"] = "paper",
+        timeout: float = 5,
+    ):
+        self._owns_transport = transport is None
+        self._transport = transport or Transport(pool_maxsize=workers)
+        self._max_concurrency_per_account = max_concurrency_per_account
+        self._env = env
+        self._timeout = timeout
+        self._accounts: Dict[str, _Account] = {}
+        # accounts with pending calls which may start another one, in turn order
+        self._ready: Deque[str] = deque()
+        self._scheduled: Set[str] = set()
+        self._condition = Condition()
+        self._shutdown = False
+        self._workers: List[Thread] = [
+            Thread(target=self._work, daemon=True) for _ in range(workers)
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    @property
+    def transport(self) -> Transport:
+        return self._transport
+
+    def add_account(
+        self, name: str, market_data_api_token: str, trading_api_token: str
+    ) -> Api:
+        api = create(
+            market_data_api_token=market_data_api_token,
+            trading_api_token=trading_api_token,
+            env=self._env,
+            timeout=self._timeout,
+            transport=self._transport,
+        )
+        with self._condition:
+            if name in self._accounts:
+                raise ValueError(f"Account {name!r} already exists")
+            self._accounts[name] = _Account(api)
+        return api
+
+    def remove_account(self, name: str) -> None:
+        """Remove the account, its pending calls are cancelled."""
+        with self._condition:
+            account = self._accounts.pop(name)
+            if name in self._scheduled:
+                self._scheduled.remove(name)
+                self._ready.remove(name)
+        for future, *_ in account.pending:
+            future.cancel()
+
+    def __getitem__(self, name: str) -> Api:
+        return self._accounts[name].api
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._accounts
+
+    def __len__(self) -> int:
+        return len(self._accounts)
+
+    def submit(
+        self, name: str, fn: Callable[..., T], *args: Any, **kwargs: Any
+    ) -> "Future[T]":
+        """Schedule `fn(api, *args, **kwargs)` with the `Api` of given account."""
+        future: "Future[T]" = Future()
+        with self._condition:
+            if self._shutdown:
+                raise RuntimeError("Cannot submit calls after shutdown")
+            account = self._accounts[name]
+            account.pending.append((future, fn, args, kwargs))
+            self._schedule(name, account)
+        return future
+
+    def shutdown(self, wait: bool = True, cancel_pending: bool = False) -> None:
+        with self._condition:
+            self._shutdown = True
+            if cancel_pending:
+                for account in self._accounts.values():
+                    while account.pending:
+                        account.pending.popleft()[0].cancel()
+            self._condition.notify_all()
+        if wait:
+            for worker in self._workers:
+                worker.join()
+        if self._owns_transport:
+            self._transport.close()
+
+    def __enter__(self) -> "ApiPool":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.shutdown()
+
+    def _schedule(self, name: str, account: _Account) -> None:
+        # has to be called with the condition held
+        if (
+            name not in self._scheduled
+            and account.pending
+            and account.in_flight < self._max_concurrency_per_account
+        ):
+            self._scheduled.add(name)
+            self._ready.append(name)
+            self._condition.notify()
+
+    def _next_task(self) -> Optional[Tuple[str, _Account, Task]]:
+        with self._condition:
+            while not self._ready:
+                if self._shutdown and not any(
+                    account.pending for account in self._accounts.values()
+                ):
+                    return None
+                self._condition.wait()
+
+            name = self._ready.popleft()
+            self._scheduled.remove(name)
+            account = self._accounts[name]
+            account.in_flight += 1
+            task = account.pending.popleft()
+            # back to the end of the queue - other accounts go first
+            self._schedule(name, account)
+            return name, account, task
+
+    def _work(self) -> None:
+        while True:
+            next_task = self._next_task()
+            if next_task is None:
+                return
+            name, account, (future, fn, args, kwargs) = next_task
+
+            if future.set_running_or_notify_cancel():
+                try:
+                    result = fn(account.api, *args, **kwargs)
+                except BaseException as exc:  # pylint: disable=W0703
+                    future.set_exception(exc)
+                else:
+                    future.set_result(result)
+
+            with self._condition:
+                account.in_flight -= 1
+                if self._accounts.get(name) is account:
+                    self._schedule(name, account)
+                self._condition.notify_all()
@@ -0,0 +1,148 @@
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from typing import Callable, Mapping, Optional
+
+
+def _parse_int(value: Optional[str]) -> Optional[int]:
+    try:
+        return int(value)  # type: ignore
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_retry_after(value: Optional[str], now: datetime) -> Optional[float]:
+    # either number of seconds or HTTP date
+    if value is None:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - now).total_seconds())
+
+
+def _parse_reset(value: Optional[str], now: datetime) -> Optional[datetime]:
+    # either epoch seconds or number of seconds until the reset
+    try:
+        reset = float(value)  # type: ignore
+    except (TypeError, ValueError):
+        return None
+    if reset > 10**9:
+        return datetime.fromtimestamp(reset, tz=timezone.utc)
+    return now + timedelta(seconds=reset)
+
+
+@dataclass
+class RateLimitStatus:
+    """Rate limit budget reported by the API with the last response."""
+
+    limit: Optional[int]
+    remaining: Optional[int]
+    reset_at: Optional[datetime]
+    retry_after: Optional[float]
+
+    @classmethod
+    def from_headers(
+        cls, headers: Mapping[str, str], now: Optional[datetime] = None
+    ) -> Optional["RateLimitStatus"]:
+        """Parse `Retry-After` and `X-RateLimit-*` headers, if there are any."""
+        now = now or datetime.now(timezone.utc)
+        status = cls(
+            limit=_parse_int(headers.get("X-RateLimit-Limit")),
+            remaining=_parse_int(headers.get("X-RateLimit-Remaining")),
+            reset_at=_parse_reset(headers.get("X-RateLimit-Reset"), now),
+            retry_after=_parse_retry_after(headers.get("Retry-After"), now),
+        )
+        if status == cls(limit=None, remaining=None, reset_at=None, retry_after=None):
+            return None
+        return status
+
+    def wait_time(self, now: Optional[datetime] = None) -> float:
+        """Seconds to wait before sending another request."""
+        if self.retry_after is not None:
+            return self.retry_after
+        if self.remaining == 0 and self.reset_at is not None:
+            now = now or datetime.now(timezone.utc)
+            return max(0.0, (self.reset_at - now).total_seconds())
+        return 0.0
+
+
+class RateLimiter:
+    """Token bucket limiting the rate of requests sent by the clients using it.
+
+    The bucket holds up to `burst` tokens and is refilled with `rate` tokens per
+    second, every request takes one token. Requests exceeding the budget wait
+    until their token is available instead of being rejected by the API with
+    HTTP 429. A single instance can be shared by several clients and threads.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate <= 0:
+            raise ValueError("rate has to be positive")
+        self._rate = rate
+        self._burst = burst if burst is not None else max(1, int(rate))
+        self._clock = clock
+        self._lock = Lock()
+        self._tokens = float(self._burst)
+        self._updated = clock()
+
+    @property
+    def rate(self) -> float:
+        return self._rate
+
+    @property
+    def burst(self) -> int:
+        return self._burst
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(
+            self._burst, self._tokens + (now - self._updated) * self._rate
+        )
+        self._updated = now
+
+    def _reserve(self) -> float:
+        # take a token, possibly borrowing it from the future - the caller has
+        # to wait the returned number of seconds until it is really available
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            return -self._tokens / self._rate if self._tokens < 0 else 0.0
+
+    def pause(self, seconds: float) -> None:
+        """Do not let any request through for the given number of seconds."""
+        with self._lock:
+            self._refill()
+            # the next token becomes available after `seconds`
+            self._tokens = min(self._tokens, 1 - seconds * self._rate)
+
+    def update(self, status: RateLimitStatus) -> None:
+        """Adjust to the budget reported by the API."""
+        wait_time = status.wait_time()
+        if wait_time > 0:
+            self.pause(wait_time)
+
+    def acquire(self) -> None:
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
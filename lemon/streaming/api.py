@@ -1,4 +1,10 @@
-from lemon.base import Client
+from typing import Any, Optional
+
+import requests
+
+from lemon.base import AsyncClient, Client, JSONLoads
+from lemon.cache import ResponseCache
+from lemon.rate_limit import RateLimiter
 from lemon.streaming.model import Token
 
 
@@ -10,6 +16,11 @@ class StreamingAPI(Client):
         timeout: float,
         retry_count: int,
         retry_backoff_factor: float,
+        json_loads: Optional[JSONLoads] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        session: Optional[requests.Session] = None,
+        coalesce_requests: bool = False,
+        cache: Optional[ResponseCache] = None,
     ):
         super().__init__(
             base_url=streaming_api_url,
@@ -17,8 +28,45 @@ class StreamingAPI(Client):
             timeout=timeout,
             retry_count=retry_count,
             retry_backoff_factor=retry_backoff_factor,
+            json_loads=json_loads,
+            rate_limiter=rate_limiter,
+            session=session,
+            coalesce_requests=coalesce_requests,
+            cache=cache,
         )
 
     def authenticate(self) -> Token:
         resp = self.post("auth", json={})
-        return Token._from_data(data=resp.json())
+        return Token._from_data(data=self.decode(resp))
+
+
+class AsyncStreamingAPI(AsyncClient):
+    def __init__(
+        self,
+        api_token: str,
+        streaming_api_url: str,
+        timeout: float,
+        retry_count: int,
+        retry_backoff_factor: float,
+        json_loads: Optional[JSONLoads] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        session: Any = None,
+        coalesce_requests: bool = False,
+        cache: Optional[ResponseCache] = None,
+    ):
+        super().__init__(
+            base_url=streaming_api_url,
+            api_token=api_token,
+            timeout=timeout,
+            retry_count=retry_count,
+            retry_backoff_factor=retry_backoff_factor,
+            json_loads=json_loads,
+            rate_limiter=rate_limiter,
+            session=session,
+            coalesce_requests=coalesce_requests,
+            cache=cache,
+        )
+
+    async def authenticate(self) -> Token:
+        resp = await self.post("auth", json={})
+        return Token._from_data(data=self.decode(resp))
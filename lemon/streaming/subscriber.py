@@ -0,0 +1,312 @@
+import asyncio
+import logging
+from abc import ABC, abstractmethod
+from collections import deque
+from threading import Condition
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+)
+
+from lemon.market_data.model import Quote, QuoteColumns
+from lemon.streaming.api import StreamingAPI
+from lemon.streaming.model import Token
+from lemon.streaming.tokens import TokenManager
+from lemon.types import convert_datetime
+
+try:
+    import paho.mqtt.client as mqtt
+except ImportError:  # pragma: no cover
+    mqtt = None  # type: ignore
+
+OnMessage = Callable[[bytes], None]
+
+logger = logging.getLogger(__name__)
+
+_CLOSED = object()
+
+
+class _AsyncConsumer:
+    """Queue of an `async for` loop over a `QuoteStream`."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, maxsize: int):
+        self.loop = loop
+        self.queue: "asyncio.Queue[Any]" = asyncio.Queue()
+        self.maxsize = maxsize
+        self.active = True
+
+
+class StreamTransport(ABC):
+    """Connection delivering raw messages of the streaming service."""
+
+    @abstractmethod
+    def connect(self, token: Token, on_message: OnMessage) -> None:
+        """Connect and start calling `on_message` with every message received."""
+
+    @abstractmethod
+    def subscribe(self, isins: List[str]) -> None:
+        """Replace the set of ISINs to receive quotes of."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Disconnect, no messages are delivered afterwards."""
+
+    def update_token(self, token: Token) -> None:
+        """Use the token for following reconnects."""
+
+
+class MqttTransport(StreamTransport):
+    """Transport of the lemon.markets streaming service (`pip install lemon[streaming]`).
+
+    Quotes are published on the topic of the user, the subscribed ISINs are
+    published on the `<user_id>.subscriptions` topic, also after reconnects.
+    """
+
+    def __init__(self, host: str = "mqtt.ably.io", port: int = 8883):
+        if mqtt is None:
+            raise ImportError(
+                "Streaming requires 'paho-mqtt' package, "
+                "install it with: pip install lemon[streaming]"
+            )
+        self._host = host
+        self._port = port
+        self._client: Any = None
+        self._user_id = ""
+        self._isins: List[str] = []
+
+    def connect(self, token: Token, on_message: OnMessage) -> None:
+        self._user_id = token.user_id
+        # paho-mqtt>=2 asks for the version of the callbacks API
+        version = getattr(mqtt, "CallbackAPIVersion", None)
+        kwargs: Dict[str, Any] = {}
+        if version is not None:
+            kwargs["callback_api_version"] = version.VERSION1
+        client = mqtt.Client(client_id=token.user_id, **kwargs)
+        client.username_pw_set(username=token.token)
+        client.tls_set()
+        client.on_connect = lambda *_: self._on_connect()
+        client.on_message = lambda _client, _userdata, message: on_message(
+            bytes(message.payload)
+        )
+        self._client = client
+        client.connect(self._host, self._port)
+        client.loop_start()
+
+    def _on_connect(self) -> None:
+        self._client.subscribe(self._user_id)
+        self._publish_subscriptions()
+
+    def _publish_subscriptions(self) -> None:
+        self._client.publish(f"{self._user_id}.subscriptions", ",".join(self._isins))
+
+    def subscribe(self, isins: List[str]) -> None:
+        self._isins = isins
+        if self._client is not None and self._client.is_connected():
+            self._publish_subscriptions()
+
+    def update_token(self, token: Token) -> None:
+        if self._client is not None:
+            self._client.username_pw_set(username=token.token)
+
+    def close(self) -> None:
+        if self._client is not None:
+            self._client.disconnect()
+            self._client.loop_stop()
+
+
+class QuoteStream:
+    """Real-time quotes of a set of instruments.
+
+    Quotes are passed to the `on_quote` callbacks on the thread of the
+    transport. Every running `async for` loop receives all the following
+    quotes, without any of them the quotes are buffered for `for` loops and
+    `drain`. When more than `buffer_size` quotes wait for a consumer the
+    oldest ones are dropped, so a stream used with callbacks only never grows.
+
+    Messages which cannot be decoded and exceptions raised by `on_quote`
+    callbacks are passed to `on_error` (logged without it), they never stop
+    the transport.
+    """
+
+    def __init__(
+        self,
+        streaming: StreamingAPI,
+        isin: Iterable[str],
+        transport: Optional[StreamTransport] = None,
+        on_quote: Optional[Callable[[Quote], None]] = None,
+        decimals: bool = False,
+        buffer_size: int = 10_000,
+        tokens: Optional[TokenManager] = None,
+        on_error: Optional[Callable[[Exception], None]] = None,
+    ):
+        self._streaming = streaming
+        self._tokens = tokens
+        self._isins: Set[str] = set(isin)
+        self._transport = transport if transport is not None else MqttTransport()
+        if tokens is not None:
+            tokens.add_callback(self._transport.update_token)
+        self._callbacks = [on_quote] if on_quote is not None else []
+        self._on_error = on_error
+        self._price_type = float if decimals else int
+        self._json_loads = streaming._json_loads
+        self._buffer_size = buffer_size
+        self._buffer: Deque[Quote] = deque(maxlen=buffer_size)
+        self._consumers: List[_AsyncConsumer] = []
+        self._condition = Condition()
+        self._started = self._closed = False
+
+    def __enter__(self) -> "QuoteStream":
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """Authenticate and connect.
+
+        With `tokens` the token of the manager is used and refreshed tokens are
+        passed to the transport for reconnects, otherwise a new token is
+        requested on every call.
+        """
+        self._started = True
+        token = (
+            self._tokens.token
+            if self._tokens is not None
+            else self._streaming.authenticate()
+        )
+        self._transport.connect(token, self._on_message)
+        self._transport.subscribe(sorted(self._isins))
+
+    def close(self) -> None:
+        """Disconnect and end the iterations after the buffered quotes."""
+        self._transport.close()
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+            for consumer in self._consumers:
+                consumer.loop.call_soon_threadsafe(self._deliver, consumer, _CLOSED)
+
+    def add_callback(self, on_quote: Callable[[Quote], None]) -> None:
+        self._callbacks.append(on_quote)
+
+    def subscribe(self, isin: Iterable[str]) -> None:
+        self._update_subscriptions(self._isins | set(isin))
+
+    def unsubscribe(self, isin: Iterable[str]) -> None:
+        self._update_subscriptions(self._isins - set(isin))
+
+    def _update_subscriptions(self, isins: Set[str]) -> None:
+        self._isins = isins
+        if self._started:
+            self._transport.subscribe(sorted(isins))
+
+    def _on_message(self, payload: bytes) -> None:
+        if self._closed:
+            return
+        # called on the thread of the transport, exceptions must not escape
+        try:
+            quote = Quote._from_data(
+                self._json_loads(payload),
+                t_type=self._price_type,
+                k_type=convert_datetime,
+            )
+        except Exception as exc:  # pylint: disable=W0703
+            self._report(exc, "Invalid quote message %r", payload)
+            return
+        for callback in self._callbacks:
+            try:
+                callback(quote)
+            except Exception as exc:  # pylint: disable=W0703
+                self._report(exc, "Quote callback %r failed", callback)
+        self._put(quote)
+
+    def _report(self, exc: Exception, message: str, *args: Any) -> None:
+        if self._on_error is None:
+            logger.error(message, *args, exc_info=exc)
+            return
+        try:
+            self._on_error(exc)
+        except Exception:  # pylint: disable=W0703
+            logger.exception("Error callback failed")
+
+    def _put(self, quote: Quote) -> None:
+        with self._condition:
+            if not self._consumers:
+                self._buffer.append(quote)
+                self._condition.notify()
+                return
+            for consumer in self._consumers:
+                consumer.loop.call_soon_threadsafe(self._deliver, consumer, quote)
+
+    def _deliver(self, consumer: _AsyncConsumer, item: Any) -> None:
+        # runs in the event loop of the consumer
+        if consumer.active:
+            if consumer.queue.qsize() >= consumer.maxsize and item is not _CLOSED:
+                consumer.queue.get_nowait()
+            consumer.queue.put_nowait(item)
+        elif item is not _CLOSED:
+            with self._condition:
+                # the iteration ended in the meantime
+                if not self._consumers:
+                    self._buffer.append(item)
+                    self._condition.notify()
+
+    def __iter__(self) -> Iterator[Quote]:
+        while True:
+            with self._condition:
+                self._condition.wait_for(lambda: self._buffer or self._closed)
+                if not self._buffer:
+                    return
+                quote = self._buffer.popleft()
+            yield quote
+
+    async def __aiter__(self) -> AsyncIterator[Quote]:
+        consumer = _AsyncConsumer(asyncio.get_running_loop(), self._buffer_size)
+        with self._condition:
+            # quotes received before the iteration started come first
+            for quote in self._buffer:
+                consumer.queue.put_nowait(quote)
+            self._buffer.clear()
+            if self._closed:
+                consumer.queue.put_nowait(_CLOSED)
+            self._consumers.append(consumer)
+
+        try:
+            while True:
+                item = await consumer.queue.get()
+                if item is _CLOSED:
+                    return
+                yield item
+        finally:
+            # e.g. cancelled, quotes not taken yet are kept for other consumers
+            with self._condition:
+                consumer.active = False
+                self._consumers.remove(consumer)
+                if not self._consumers:
+                    left = []
+                    while not consumer.queue.empty():
+                        item = consumer.queue.get_nowait()
+                        if item is not _CLOSED:
+                            left.append(item)
+                    self._buffer.extendleft(reversed(left))
+                    self._condition.notify_all()
+
+    def drain(self) -> List[Quote]:
+        """Take the buffered quotes without waiting for new ones."""
+        with self._condition:
+            quotes = list(self._buffer)
+            self._buffer.clear()
+        return quotes
+
+    def drain_columns(self) -> QuoteColumns:
+        """`drain` into columns, timestamps as epoch milliseconds."""
+        return QuoteColumns._from_rows(self.drain())
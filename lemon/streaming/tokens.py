@@ -0,0 +1,109 @@
+from datetime import datetime, timedelta, timezone
+from threading import Event, Lock, Thread
+from typing import Any, Callable, List, Optional
+
+from lemon.streaming.api import StreamingAPI
+from lemon.streaming.model import Token
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class TokenManager:
+    """Streaming token, refreshed in the background before it expires.
+
+    `token` returns the cached token without waiting as long as it is valid,
+    only the first call (or a call after all refreshes failed until expiry)
+    authenticates on the calling thread. After `start` a background thread
+    requests a new token `refresh_margin` before `expires_at` of the current
+    one, retrying failed requests every `retry_interval` seconds. `on_refresh`
+    callbacks are called with every new token.
+    """
+
+    def __init__(
+        self,
+        streaming: StreamingAPI,
+        refresh_margin: timedelta = timedelta(minutes=5),
+        retry_interval: float = 5.0,
+        on_refresh: Optional[Callable[[Token], None]] = None,
+        clock: Callable[[], datetime] = _utc_now,
+    ):
+        self._streaming = streaming
+        self._refresh_margin = refresh_margin
+        self._retry_interval = retry_interval
+        self._callbacks: List[Callable[[Token], None]] = (
+            [on_refresh] if on_refresh is not None else []
+        )
+        self._clock = clock
+        self._lock = Lock()
+        self._token: Optional[Token] = None
+        self._stopped = Event()
+        self._thread: Optional[Thread] = None
+
+    def __enter__(self) -> "TokenManager":
+        self.start()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @property
+    def token(self) -> Token:
+        token = self._token
+        if token is not None and self._clock() < token.expires_at:
+            return token
+        with self._lock:
+            # another thread may have refreshed it in the meantime
+            token = self._token
+            if token is not None and self._clock() < token.expires_at:
+                return token
+            return self._refresh()
+
+    def add_callback(self, on_refresh: Callable[[Token], None]) -> None:
+        self._callbacks.append(on_refresh)
+
+    def refresh(self) -> Token:
+        """Request a new token right away."""
+        with self._lock:
+            return self._refresh()
+
+    def _refresh(self) -> Token:
+        token = self._streaming.authenticate()
+        self._token = token
+        for callback in self._callbacks:
+            callback(token)
+        return token
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stopped.clear()
+        self._thread = Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def _run(self) -> None:
+        # consecutive attempts are at least `retry_interval` apart, also when
+        # tokens are valid for less than `refresh_margin`
+        minimal_delay = 0.0
+        while True:
+            token = self._token
+            delay = 0.0
+            if token is not None:
+                refresh_at = token.expires_at - self._refresh_margin
+                delay = (refresh_at - self._clock()).total_seconds()
+            if self._stopped.wait(max(delay, minimal_delay)):
+                return
+            try:
+                self.refresh()
+            except Exception:  # pylint: disable=W0703
+                # keep the current token, it may still be valid for a while,
+                # the next attempt follows after `retry_interval`
+                pass
+            minimal_delay = self._retry_interval
@@ -3,7 +3,7 @@ from typing import Optional, Union
 
 from typing_extensions import Literal
 
-from lemon.base import Client
+from lemon.base import AsyncClient, Client
 from lemon.trading.model import (
     BankStatementType,
     GetAccountResponse,
@@ -22,7 +22,7 @@ class Account:
 
     def get(self) -> GetAccountResponse:
         resp = self._client.get("account")
-        return GetAccountResponse._from_data(resp.json())
+        return GetAccountResponse._from_data(self._client.decode(resp))
 
     def update(
         self,
@@ -42,7 +42,7 @@ class Account:
                 "address_country": address_country,
             },
         )
-        return GetAccountResponse._from_data(resp.json())
+        return GetAccountResponse._from_data(self._client.decode(resp))
 
     def get_withdrawals(
         self, limit: Optional[int] = None, page: Optional[int] = None
@@ -55,7 +55,7 @@ class Account:
             },
         )
         return GetWithdrawalsResponse._from_data(
-            dict(resp.json(), _client=self._client)
+            dict(self._client.decode(resp), _client=self._client)
         )
 
     def withdraw(
@@ -72,7 +72,7 @@ class Account:
                 "idempotency": idempotency,
             },
         )
-        return WithdrawResponse._from_data(resp.json())
+        return WithdrawResponse._from_data(self._client.decode(resp))
 
     def get_bank_statements(
         self,
@@ -95,7 +95,7 @@ class Account:
             },
         )
         return GetBankStatementsResponse._from_data(
-            dict(resp.json(), _client=self._client)
+            dict(self._client.decode(resp), _client=self._client)
         )
 
     def get_documents(
@@ -112,7 +112,9 @@ class Account:
                 "page": page,
             },
         )
-        return GetDocumentsResponse._from_data(dict(resp.json(), _client=self._client))
+        return GetDocumentsResponse._from_data(
+            dict(self._client.decode(resp), _client=self._client)
+        )
 
     def get_document(
         self, document_id: str, no_redirect: Optional[bool] = None
@@ -124,4 +126,117 @@ class Account:
         resp = self._client.get(
             f"account/documents/{document_id}", params={"no_redirect": no_redirect}
         )
-        return GetDocumentResponse._from_data(resp.json())
+        return GetDocumentResponse._from_data(self._client.decode(resp))
+
+
+class AsyncAccount:
+    def __init__(self, client: AsyncClient):
+        self._client = client
+
+    async def get(self) -> GetAccountResponse:
+        resp = await self._client.get("account")
+        return GetAccountResponse._from_data(self._client.decode(resp))
+
+    async def update(
+        self,
+        address_street: Optional[str] = None,
+        address_street_number: Optional[str] = None,
+        address_city: Optional[str] = None,
+        address_postal_code: Optional[str] = None,
+        address_country: Optional[str] = None,
+    ) -> GetAccountResponse:
+        resp = await self._client.put(
+            "account",
+            json={
+                "address_street": address_street,
+                "address_street_number": address_street_number,
+                "address_city": address_city,
+                "address_postal_code": address_postal_code,
+                "address_country": address_country,
+            },
+        )
+        return GetAccountResponse._from_data(self._client.decode(resp))
+
+    async def get_withdrawals(
+        self, limit: Optional[int] = None, page: Optional[int] = None
+    ) -> GetWithdrawalsResponse:
+        resp = await self._client.get(
+            "account/withdrawals",
+            params={
+                "limit": limit,
+                "page": page,
+            },
+        )
+        return GetWithdrawalsResponse._from_data(
+            dict(self._client.decode(resp), _client=self._client)
+        )
+
+    async def withdraw(
+        self,
+        amount: int,
+        pin: str,
+        idempotency: Optional[str] = None,
+    ) -> WithdrawResponse:
+        resp = await self._client.post(
+            "account/withdrawals",
+            json={
+                "amount": amount,
+                "pin": pin,
+                "idempotency": idempotency,
+            },
+        )
+        return WithdrawResponse._from_data(self._client.decode(resp))
+
+    async def get_bank_statements(
+        self,
+        type: Optional[BankStatementType] = None,
+        from_: Union[date, Literal["beginning"], None] = None,
+        to: Optional[date] = None,
+        sorting: Optional[Sorting] = None,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+    ) -> GetBankStatementsResponse:
+        resp = await self._client.get(
+            "account/bankstatements",
+            params={
+                "type": type,
+                "from": from_,
+                "to": to,
+                "sorting": sorting,
+                "limit": limit,
+                "page": page,
+            },
+        )
+        return GetBankStatementsResponse._from_data(
+            dict(self._client.decode(resp), _client=self._client)
+        )
+
+    async def get_documents(
+        self,
+        sorting: Optional[Sorting] = None,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+    ) -> GetDocumentsResponse:
+        resp = await self._client.get(
+            "account/documents",
+            params={
+                "sorting": sorting,
+                "limit": limit,
+                "page": page,
+            },
+        )
+        return GetDocumentsResponse._from_data(
+            dict(self._client.decode(resp), _client=self._client)
+        )
+
+    async def get_document(
+        self, document_id: str, no_redirect: Optional[bool] = None
+    ) -> GetDocumentResponse:
+        document_id = document_id.strip()
+        if not document_id:
+            raise ValueError("document_id is empty string")
+
+        resp = await self._client.get(
+            f"account/documents/{document_id}", params={"no_redirect": no_redirect}
+        )
+        return GetDocumentResponse._from_data(self._client.decode(resp))
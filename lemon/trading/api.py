@@ -1,8 +1,14 @@
-from lemon.base import Client
-from lemon.trading.account import Account
-from lemon.trading.orders import Orders
-from lemon.trading.positions import Positions
-from lemon.trading.user import User
+from typing import Any, Optional
+
+import requests
+
+from lemon.base import AsyncClient, Client, JSONLoads
+from lemon.cache import ResponseCache
+from lemon.rate_limit import RateLimiter
+from lemon.trading.account import Account, AsyncAccount
+from lemon.trading.orders import AsyncOrders, Orders
+from lemon.trading.positions import AsyncPositions, Positions
+from lemon.trading.user import AsyncUser, User
 
 
 class TradingAPI(Client):
@@ -13,6 +19,11 @@ class TradingAPI(Client):
         timeout: float,
         retry_count: int,
         retry_backoff_factor: float,
+        json_loads: Optional[JSONLoads] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        session: Optional[requests.Session] = None,
+        coalesce_requests: bool = False,
+        cache: Optional[ResponseCache] = None,
     ):
         super().__init__(
             base_url=trading_api_url,
@@ -20,6 +31,11 @@ class TradingAPI(Client):
             timeout=timeout,
             retry_count=retry_count,
             retry_backoff_factor=retry_backoff_factor,
+            json_loads=json_loads,
+            rate_limiter=rate_limiter,
+            session=session,
+            coalesce_requests=coalesce_requests,
+            cache=cache,
         )
         self._account = Account(self)
         self._orders = Orders(self)
@@ -41,3 +57,51 @@ class TradingAPI(Client):
     @property
     def user(self) -> User:
         return self._user
+
+
+class AsyncTradingAPI(AsyncClient):
+    def __init__(
+        self,
+        api_token: str,
+        trading_api_url: str,
+        timeout: float,
+        retry_count: int,
+        retry_backoff_factor: float,
+        json_loads: Optional[JSONLoads] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        session: Any = None,
+        coalesce_requests: bool = False,
+        cache: Optional[ResponseCache] = None,
+    ):
+        super().__init__(
+            base_url=trading_api_url,
+            api_token=api_token,
+            timeout=timeout,
+            retry_count=retry_count,
+            retry_backoff_factor=retry_backoff_factor,
+            json_loads=json_loads,
+            rate_limiter=rate_limiter,
+            session=session,
+            coalesce_requests=coalesce_requests,
+            cache=cache,
+        )
+        self._account = AsyncAccount(self)
+        self._orders = AsyncOrders(self)
+        self._positions = AsyncPositions(self)
+        self._user = AsyncUser(self)
+
+    @property
+    def account(self) -> AsyncAccount:
+        return self._account
+
+    @property
+    def orders(self) -> AsyncOrders:
+        return self._orders
+
+    @property
+    def positions(self) -> AsyncPositions:
+        return self._positions
+
+    @property
+    def user(self) -> AsyncUser:
+        return self._user
@@ -2,7 +2,7 @@ import re
 from datetime import date
 from typing import List, Optional, Union
 
-from lemon.base import Client
+from lemon.base import AsyncClient, Client
 from lemon.trading.model import (
     ActivateOrderResponse,
     CreateOrderResponse,
@@ -17,6 +17,21 @@ from lemon.trading.model import (
 from lemon.types import Days
 
 
+def _format_expires_at(expires_at: Union[date, Days, str, None]) -> Optional[str]:
+    if isinstance(expires_at, date):
+        return expires_at.isoformat()
+    if isinstance(expires_at, int):
+        return f"P{expires_at}D"
+    if isinstance(expires_at, str):
+        expires_at_str = expires_at.strip().upper()
+        if re.match(r"^P?\d+D$", expires_at_str) is None:
+            raise ValueError(
+                "Invalid 'expires_at' format ('pXd' or 'Xd' are allowed where X is a non-negative integer)"
+            )
+        return expires_at_str
+    return None
+
+
 class Orders:
     def __init__(self, client: Client):
         self._client = client
@@ -47,7 +62,9 @@ class Orders:
                 "page": page,
             },
         )
-        return GetOrdersResponse._from_data(dict(resp.json(), _client=self._client))
+        return GetOrdersResponse._from_data(
+            dict(self._client.decode(resp), _client=self._client)
+        )
 
     def create(
         self,
@@ -61,18 +78,7 @@ class Orders:
         notes: Optional[str] = None,
         idempotency: Optional[str] = None,
     ) -> CreateOrderResponse:
-        if isinstance(expires_at, date):
-            expires_at_str = expires_at.isoformat()
-        elif isinstance(expires_at, int):
-            expires_at_str = f"P{expires_at}D"
-        elif isinstance(expires_at, str):
-            expires_at_str = expires_at.strip().upper()
-            if re.match(r"^P?\d+D$", expires_at_str) is None:
-                raise ValueError(
-                    "Invalid 'expires_at' format ('pXd' or 'Xd' are allowed where X is a non-negative integer)"
-                )
-        else:
-            expires_at_str = None
+        expires_at_str = _format_expires_at(expires_at)
 
         resp = self._client.post(
             "orders",
@@ -88,7 +94,7 @@ class Orders:
                 "idempotency": idempotency,
             },
         )
-        return CreateOrderResponse._from_data(resp.json())
+        return CreateOrderResponse._from_data(self._client.decode(resp))
 
     def activate(
         self, order_id: str, pin: Optional[str] = None
@@ -101,7 +107,7 @@ class Orders:
             f"orders/{order_id}/activate",
             json={"pin": pin},
         )
-        return ActivateOrderResponse._from_data(resp.json())
+        return ActivateOrderResponse._from_data(self._client.decode(resp))
 
     def get_order(self, order_id: str) -> GetOrderResponse:
         order_id = order_id.strip()
@@ -109,7 +115,7 @@ class Orders:
             raise ValueError("order_id is empty string")
 
         resp = self._client.get(f"orders/{order_id}")
-        return GetOrderResponse._from_data(resp.json())
+        return GetOrderResponse._from_data(self._client.decode(resp))
 
     def cancel(self, order_id: str) -> DeleteOrderResponse:
         order_id = order_id.strip()
@@ -117,4 +123,98 @@ class Orders:
             raise ValueError("order_id is empty string")
 
         resp = self._client.delete(f"orders/{order_id}")
-        return DeleteOrderResponse._from_data(resp.json())
+        return DeleteOrderResponse._from_data(self._client.decode(resp))
+
+
+class AsyncOrders:
+    def __init__(self, client: AsyncClient):
+        self._client = client
+
+    async def get(
+        self,
+        from_: Optional[date] = None,
+        to: Optional[date] = None,
+        isin: Optional[str] = None,
+        side: Optional[OrderSide] = None,
+        status: Optional[Union[OrderStatus, List[OrderStatus]]] = None,
+        type: Optional[OrderType] = None,
+        key_creation_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+    ) -> GetOrdersResponse:
+        resp = await self._client.get(
+            "orders",
+            params={
+                "from": from_,
+                "to": to,
+                "isin": isin,
+                "side": side,
+                "status": status,
+                "type": type,
+                "key_creation_id": key_creation_id,
+                "limit": limit,
+                "page": page,
+            },
+        )
+        return GetOrdersResponse._from_data(
+            dict(self._client.decode(resp), _client=self._client)
+        )
+
+    async def create(
+        self,
+        isin: str,
+        side: OrderSide,
+        quantity: int,
+        expires_at: Union[date, Days, str, None] = None,
+        stop_price: Optional[int] = None,
+        limit_price: Optional[int] = None,
+        venue: Optional[Venue] = None,
+        notes: Optional[str] = None,
+        idempotency: Optional[str] = None,
+    ) -> CreateOrderResponse:
+        expires_at_str = _format_expires_at(expires_at)
+
+        resp = await self._client.post(
+            "orders",
+            json={
+                "isin": isin,
+                "side": side,
+                "quantity": quantity,
+                "expires_at": expires_at_str,
+                "venue": venue,
+                "stop_price": stop_price,
+                "limit_price": limit_price,
+                "notes": notes,
+                "idempotency": idempotency,
+            },
+        )
+        return CreateOrderResponse._from_data(self._client.decode(resp))
+
+    async def activate(
+        self, order_id: str, pin: Optional[str] = None
+    ) -> ActivateOrderResponse:
+        order_id = order_id.strip()
+        if not order_id:
+            raise ValueError("order_id is empty string")
+
+        resp = await self._client.post(
+            f"orders/{order_id}/activate",
+            json={"pin": pin},
+        )
+        return ActivateOrderResponse._from_data(self._client.decode(resp))
+
+    async def get_order(self, order_id: str) -> GetOrderResponse:
+        order_id = order_id.strip()
+        if not order_id:
+            raise ValueError("order_id is empty string")
+
+        resp = await self._client.get(f"orders/{order_id}")
+        return GetOrderResponse._from_data(self._client.decode(resp))
+
+    async def cancel(self, order_id: str) -> DeleteOrderResponse:
+        order_id = order_id.strip()
+        if not order_id:
+            raise ValueError("order_id is empty string")
+
+        resp = await self._client.delete(f"orders/{order_id}")
+        return DeleteOrderResponse._from_data(self._client.decode(resp))
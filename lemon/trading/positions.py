@@ -1,7 +1,7 @@
 from datetime import datetime
 from typing import List, Optional
 
-from lemon.base import Client
+from lemon.base import AsyncClient, Client
 from lemon.trading.model import (
     GetPerformanceResponse,
     GetPositionsResponse,
@@ -29,7 +29,9 @@ class Positions:
                 "page": page,
             },
         )
-        return GetPositionsResponse._from_data(dict(resp.json(), _client=self._client))
+        return GetPositionsResponse._from_data(
+            dict(self._client.decode(resp), _client=self._client)
+        )
 
     def get_statements(
         self,
@@ -53,7 +55,9 @@ class Positions:
                 "page": page,
             },
         )
-        return GetStatementsResponse._from_data(dict(resp.json(), _client=self._client))
+        return GetStatementsResponse._from_data(
+            dict(self._client.decode(resp), _client=self._client)
+        )
 
     def get_performance(
         self,
@@ -76,5 +80,78 @@ class Positions:
             },
         )
         return GetPerformanceResponse._from_data(
-            dict(resp.json(), _client=self._client)
+            dict(self._client.decode(resp), _client=self._client)
+        )
+
+
+class AsyncPositions:
+    def __init__(self, client: AsyncClient):
+        self._client = client
+
+    async def get(
+        self,
+        isin: Optional[str] = None,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+    ) -> GetPositionsResponse:
+        resp = await self._client.get(
+            "positions",
+            params={
+                "isin": isin,
+                "limit": limit,
+                "page": page,
+            },
+        )
+        return GetPositionsResponse._from_data(
+            dict(self._client.decode(resp), _client=self._client)
+        )
+
+    async def get_statements(
+        self,
+        isin: Optional[str] = None,
+        from_: Optional[datetime] = None,
+        to: Optional[datetime] = None,
+        types: Optional[List[StatementType]] = None,
+        sorting: Optional[Sorting] = None,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+    ) -> GetStatementsResponse:
+        resp = await self._client.get(
+            "positions/statements",
+            params={
+                "isin": isin,
+                "from": from_,
+                "to": to,
+                "types": types,
+                "sorting": sorting,
+                "limit": limit,
+                "page": page,
+            },
+        )
+        return GetStatementsResponse._from_data(
+            dict(self._client.decode(resp), _client=self._client)
+        )
+
+    async def get_performance(
+        self,
+        isin: Optional[str] = None,
+        from_: Optional[datetime] = None,
+        to: Optional[datetime] = None,
+        sorting: Optional[Sorting] = None,
+        limit: Optional[int] = None,
+        page: Optional[int] = None,
+    ) -> GetPerformanceResponse:
+        resp = await self._client.get(
+            "positions/performance",
+            params={
+                "isin": isin,
+                "from": from_,
+                "to": to,
+                "sorting": sorting,
+                "limit": limit,
+                "page": page,
+            },
+        )
+        return GetPerformanceResponse._from_data(
+            dict(self._client.decode(resp), _client=self._client)
         )
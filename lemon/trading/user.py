@@ -1,4 +1,4 @@
-from lemon.base import Client
+from lemon.base import AsyncClient, Client
 from lemon.trading.model import GetUserResponse
 
 
@@ -8,4 +8,13 @@ class User:
 
     def get(self) -> GetUserResponse:
         resp = self._client.get("user")
-        return GetUserResponse._from_data(resp.json())
+        return GetUserResponse._from_data(self._client.decode(resp))
+
+
+class AsyncUser:
+    def __init__(self, client: AsyncClient):
+        self._client = client
+
+    async def get(self) -> GetUserResponse:
+        resp = await self._client.get("user")
+        return GetUserResponse._from_data(self._client.decode(resp))
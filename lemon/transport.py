@@ -0,0 +1,78 @@
+from typing import Any, Optional
+
+import requests
+from urllib3.util.ssl_ import create_urllib3_context
+
+from lemon.base import make_async_session, make_session
+
+
+class Transport:
+    """Connection pools shared by any number of `Api` instances.
+
+    Clients of all the `Api` instances created with the same transport use a
+    single session, so connections (and their TLS handshakes) to each host are
+    reused across accounts instead of being opened for every client.
+    """
+
+    def __init__(
+        self,
+        retry_count: int = 3,
+        retry_backoff_factor: float = 0.1,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        tcp_keepalive: Optional[float] = None,
+    ):
+        self._session = make_session(
+            retry_count=retry_count,
+            retry_backoff_factor=retry_backoff_factor,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            tcp_keepalive=tcp_keepalive,
+            ssl_context=create_urllib3_context(),  # type: ignore
+        )
+
+    @property
+    def session(self) -> requests.Session:
+        return self._session
+
+    def close(self) -> None:
+        self._session.close()
+
+    def __enter__(self) -> "Transport":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class AsyncTransport:
+    """Asynchronous counterpart of `Transport`, shared by `AsyncApi` instances."""
+
+    def __init__(
+        self,
+        timeout: float = 5,
+        retry_count: int = 3,
+        pool_maxsize: int = 10,
+        tcp_keepalive: Optional[float] = None,
+    ):
+        self._session = make_async_session(
+            timeout=timeout,
+            retry_count=retry_count,
+            pool_maxsize=pool_maxsize,
+            tcp_keepalive=tcp_keepalive,
+        )
+
+    @property
+    def session(self) -> Any:
+        return self._session
+
+    async def aclose(self) -> None:
+        await self._session.aclose()
+
+    async def __aenter__(self) -> "AsyncTransport":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.aclose()
@@ -1,7 +1,32 @@
+import asyncio
 import json
+import sys
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from datetime import date, datetime, time, timezone
-from typing import Any, Callable, Dict, Iterator, Optional, Tuple, Type, TypeVar, Union
+from functools import lru_cache, partial
+from inspect import iscoroutinefunction
+from queue import Queue
+from threading import BoundedSemaphore, Event, Thread
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Generator,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+)
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 from typing_extensions import Literal
 
@@ -16,6 +41,8 @@ class JSONEncoder(json.JSONEncoder):
     def default(self, o: Any) -> Any:
         if isinstance(o, (datetime, date, time)):
             return o.isoformat()
+        if isinstance(o, array):
+            return o.tolist()
         return super().default(o)
 
 
@@ -23,14 +50,39 @@ def filter_out_optionals(data: Dict[str, Any]) -> Dict[str, Any]:
     return {k: v for k, v in data.items() if v is not None}
 
 
+def _with_page(url: str, page: int) -> str:
+    parts = urlsplit(url)
+    query = [
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key != "page"
+    ]
+    query.append(("page", str(page)))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+if sys.version_info >= (3, 11):
+    from_isoformat = datetime.fromisoformat
+else:
+
+    def from_isoformat(value: str) -> datetime:
+        # `fromisoformat` accepts the `Z` suffix only since python 3.11
+        if value.endswith(("Z", "z")):
+            value = f"{value[:-1]}+00:00"
+        return datetime.fromisoformat(value)
+
+
+# responses repeat the same timestamps (e.g. `time` of the response) a lot
+cached_from_isoformat = lru_cache(maxsize=1024)(from_isoformat)
+
+
 def convert_datetime(value: Union[str, int]) -> datetime:
     try:
-        return datetime.fromisoformat(value)
-    except:
-        try:
-            return datetime.fromtimestamp(value / 1000, tz=timezone.utc)
-        except Exception as exc:
-            raise APIError(exc) from exc
+        if isinstance(value, str):
+            return cached_from_isoformat(value)
+        return datetime.fromtimestamp(value / 1000, tz=timezone.utc)
+    except Exception as exc:
+        raise APIError(exc) from exc
 
 
 BASIC_PARSERS = {
@@ -73,6 +125,48 @@ def _make_parser(type_: Type[Any]) -> Callable[[Any], Any]:
     raise ValueError(f"Unsupported type {type_}")
 
 
+_GENERIC_FROM_DATA: Set[Callable[..., Any]] = set()
+
+
+def _compile_from_data(
+    name: str, attr_names: Tuple[str, ...], parsers: Dict[str, Callable[[Any], Any]]
+) -> Callable[..., Any]:
+    """Generate `_from_data` for a model with the given attributes.
+
+    The generated function is the unrolled equivalent of
+    `BaseModel._from_data`: one `data.get` per attribute, parsers bound as
+    closure variables and private attributes passed through as they are.
+    """
+    body, kwargs = ["        get = data.get"], []
+    for i, attr_name in enumerate(attr_names):
+        body.append(f"        value_{i} = get({attr_name!r})")
+        if attr_name in parsers:
+            kwargs.append(
+                f"{attr_name}=None if value_{i} is None else parse_{i}(value_{i})"
+            )
+        else:
+            # private attribute
+            kwargs.append(f"{attr_name}=value_{i}")
+
+    source = "\n".join(
+        [
+            f"def make({', '.join(f'parse_{i}' for i in range(len(attr_names)))}):",
+            "    def _from_data(cls, data):",
+            *body,
+            f"        return cls({', '.join(kwargs)})",
+            "    return _from_data",
+        ]
+    )
+    code = compile(source, f"<{name}._from_data>", "exec")
+    namespace: Dict[str, Any] = {}
+    exec(code, namespace)  # pylint: disable=W0122
+    from_data: Callable[..., Any] = namespace["make"](
+        *(parsers.get(attr_name) for attr_name in attr_names)
+    )
+    from_data.__qualname__ = f"{name}._from_data"
+    return from_data
+
+
 class BaseModelMeta(type):
     def __new__(
         cls, name: str, bases: Tuple[Any], dct: Dict[str, Any]
@@ -91,7 +185,21 @@ class BaseModelMeta(type):
                 parsers.update(cls.make_parsers(annotations))
 
         dct["_parsers"] = parsers
-        dct["__slots__"] = tuple(sorted(slots))
+        fields = tuple(sorted(slots))
+        # explicitly declared slots hold private state which is not a field
+        dct["__slots__"] = fields + tuple(dct.get("__slots__", ()))
+
+        # models with a hand-written `_from_data` keep it, all others get one
+        # generated for their exact set of attributes
+        if "_from_data" not in dct and all(
+            getattr(getattr(base, "_from_data", None), "__func__", None)
+            in _GENERIC_FROM_DATA
+            for base in bases
+            if isinstance(base, BaseModelMeta)
+        ):
+            from_data = _compile_from_data(name, fields, parsers)
+            _GENERIC_FROM_DATA.add(from_data)
+            dct["_from_data"] = classmethod(from_data)
 
         return super().__new__(cls, name, bases, dct)
 
@@ -131,24 +239,187 @@ class BaseModel(metaclass=BaseModelMeta):
         return cls(**kwargs)
 
 
+_GENERIC_FROM_DATA.add(BaseModel._from_data.__func__)  # type: ignore
+
+_END_OF_PAGES = object()
+
+TBaseIterableModel = TypeVar("TBaseIterableModel", bound="BaseIterableModel")
+
+
 @dataclass
 class BaseIterableModel(BaseModel):
     next: Optional[str]
     _client: Optional["Client"]
     _headers: Optional[dict]
 
-    def auto_iter(self) -> Iterator:
+    if TYPE_CHECKING:
+        # fields of all list responses, declared by each of them
+        results: Any
+        page: int
+        pages: int
+
+    def auto_iter(self, prefetch: int = 0) -> Iterator:
+        """Iterate over rows of all pages.
+
+        With `prefetch` > 0 up to that many following pages are fetched on a
+        background thread while rows of the current page are consumed.
+        """
+        pages = self._iter_pages(prefetch)
+        try:
+            for page in pages:
+                yield from page.results
+        finally:
+            pages.close()
+
+    def _iter_pages(
+        self: TBaseIterableModel, prefetch: int = 0
+    ) -> Generator[TBaseIterableModel, None, None]:
+        if prefetch > 0:
+            yield from self._prefetched_pages(prefetch)
+            return
+
         data = self
-        headers = self._headers or {}
         while True:
-            for el in data.results:
-                yield el
+            yield data
 
             if not data.next:
                 break
 
-            response = self._client.get(data.next, headers=headers).json()
-            data = self._from_data(response)
+            data = data._fetch_next()
+
+    def _prefetched_pages(
+        self: TBaseIterableModel, depth: int
+    ) -> Iterator[TBaseIterableModel]:
+        pages: "Queue[Any]" = Queue()
+        # every slot stands for a page fetched, but not yet taken by consumer
+        slots, stopped = BoundedSemaphore(depth), Event()
+
+        def produce() -> None:
+            data = self
+            try:
+                while data.next:
+                    while not slots.acquire(timeout=0.1):
+                        if stopped.is_set():
+                            return
+                    if stopped.is_set():
+                        return
+                    data = data._fetch_next()
+                    pages.put(data)
+            except Exception as exc:  # pylint: disable=W0703
+                pages.put(exc)
+            finally:
+                pages.put(_END_OF_PAGES)
+
+        Thread(target=produce, daemon=True).start()
+        try:
+            yield self
+            while True:
+                page = pages.get()
+                if page is _END_OF_PAGES:
+                    break
+                if isinstance(page, Exception):
+                    raise page
+                slots.release()
+                yield page
+        finally:
+            stopped.set()
+
+    async def auto_aiter(self) -> AsyncIterator[Any]:
+        """Asynchronously iterate over rows of all pages.
+
+        The next page is requested as soon as the current one is received, so
+        the network round-trip overlaps with consumption of the current rows.
+        """
+        data = self
+        while True:
+            next_page = (
+                asyncio.ensure_future(data._afetch_next()) if data.next else None
+            )
+            try:
+                for el in data.results:
+                    yield el
+            except BaseException:
+                if next_page is not None:
+                    next_page.cancel()
+                raise
+
+            if next_page is None:
+                break
+
+            data = await next_page
+
+    def _parse_page(
+        self: TBaseIterableModel, data: Dict[str, Any]
+    ) -> TBaseIterableModel:
+        return self._from_data(dict(data, _client=self._client, _headers=self._headers))
+
+    def fetch_all(self, concurrency: int = 4) -> List[Any]:
+        """Return rows of this and all following pages.
+
+        Remaining pages are requested concurrently, with at most `concurrency`
+        requests in flight, and are returned in page order.
+        """
+        pages = [self]
+        if self.next:
+            with ThreadPoolExecutor(max_workers=concurrency) as executor:
+                pages.extend(executor.map(self._fetch_page, self._remaining_urls()))
+        return [el for page in pages for el in page.results]
+
+    async def afetch_all(self, concurrency: int = 4) -> List[Any]:
+        """Asynchronous counterpart of `fetch_all`."""
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(url: str) -> "BaseIterableModel":
+            async with semaphore:
+                return await self._afetch_page(url)
+
+        pages = [self]
+        if self.next:
+            pages.extend(
+                await asyncio.gather(*(fetch(url) for url in self._remaining_urls()))
+            )
+        return [el for page in pages for el in page.results]
+
+    def _remaining_urls(self) -> List[str]:
+        # `next` carries all the query parameters of the original request,
+        # only the page number has to be replaced
+        next_url = self.next
+        if not next_url:
+            return []
+        return [
+            _with_page(next_url, page) for page in range(self.page + 1, self.pages + 1)
+        ]
+
+    def _fetch_next(self: TBaseIterableModel) -> TBaseIterableModel:
+        # only called when there is a next page
+        return self._fetch_page(cast(str, self.next))
+
+    async def _afetch_next(self: TBaseIterableModel) -> TBaseIterableModel:
+        return await self._afetch_page(cast(str, self.next))
+
+    def _page_client(self) -> Any:
+        if self._client is None:
+            raise TypeError("Following pages can only be fetched by API responses")
+        return self._client
+
+    def _fetch_page(self: TBaseIterableModel, url: str) -> TBaseIterableModel:
+        client = self._page_client()
+        if iscoroutinefunction(client.get):
+            raise TypeError("Use auto_aiter()/afetch_all() with asynchronous responses")
+        response = client.get(url, headers=self._headers or {})
+        return self._parse_page(client.decode(response))
+
+    async def _afetch_page(self: TBaseIterableModel, url: str) -> TBaseIterableModel:
+        client = self._page_client()
+        get, headers = client.get, self._headers or {}
+        if iscoroutinefunction(get):
+            response = await get(url, headers=headers)
+        else:
+            # synchronous client - do not block the event loop
+            response = await asyncio.get_running_loop().run_in_executor(
+                None, partial(get, url, headers=headers)
+            )
+        return self._parse_page(client.decode(response))
 
     def json(self) -> str:
         dict_ = self.dict()
@@ -1,10 +1,10 @@
 import abc
-from typing import Dict, Generator
+from typing import Callable, Dict, Generator
 
 import pytest
 from pytest_httpserver import HTTPServer
 
-from lemon.api import Api
+from lemon.api import Api, AsyncApi
 from lemon.errors import (
     APIError,
     AuthenticationError,
@@ -51,7 +51,9 @@ def streaming_httpserver() -> Generator[HTTPServer, None, None]:
 
 @pytest.fixture(autouse=True)
 def clear_stubs_queue(
-    market_data_httpserver: HTTPServer, trading_httpserver: HTTPServer
+    market_data_httpserver: HTTPServer,
+    trading_httpserver: HTTPServer,
+    streaming_httpserver: HTTPServer,
 ):
     yield
 
@@ -63,6 +65,10 @@ def clear_stubs_queue(
     trading_httpserver.check_assertions()
     trading_httpserver.clear()
 
+    assert len(streaming_httpserver.oneshot_handlers) == 0
+    streaming_httpserver.check_assertions()
+    streaming_httpserver.clear()
+
 
 @pytest.fixture
 def client(
@@ -82,6 +88,25 @@ def client(
     )
 
 
+@pytest.fixture
+def async_client(
+    market_data_httpserver: HTTPServer,
+    streaming_httpserver: HTTPServer,
+    trading_httpserver: HTTPServer,
+) -> Callable[[], AsyncApi]:
+    # asynchronous client has to be created inside the running event loop
+    return lambda: AsyncApi(
+        market_data_api_token="foobar",
+        trading_api_token="barbaz",
+        market_data_api_url=market_data_httpserver.url_for(""),
+        streaming_api_url=streaming_httpserver.url_for(""),
+        trading_api_url=trading_httpserver.url_for(""),
+        timeout=1,
+        retry_count=1,
+        retry_backoff_factor=1,
+    )
+
+
 class CommonApiTests:
     @abc.abstractmethod
     def make_api_call(self, client: Api, **params) -> None:
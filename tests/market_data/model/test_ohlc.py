@@ -1,6 +1,12 @@
-from datetime import datetime
+import json
+import sys
+from array import array
+from datetime import datetime, timezone
+from unittest import mock
 
-from lemon.market_data.model import GetOhlcResponse, OhlcData
+import pytest
+
+from lemon.market_data.model import GetOhlcResponse, OhlcColumns, OhlcData
 
 RESPONSE = GetOhlcResponse(
     time=datetime.fromisoformat("2022-02-14T20:44:03.759+00:00"),
@@ -52,3 +58,65 @@ DICT_RESPONSE = {
 def test_get_ohlc_response_is_serializable():
     assert RESPONSE.dict() == DICT_RESPONSE
     assert RESPONSE.json()
+
+
+def test_ohlc_columns_are_serializable():
+    columns = OhlcColumns(
+        isin=["US88160R1014"],
+        o=array("q", [777]),
+        h=array("q", [777]),
+        l=array("q", [762]),
+        c=array("q", [768]),
+        v=array("q", [433]),
+        pbv=array("q", [333645]),
+        t=array("q", [1630540800000]),
+        mic=["XMUN"],
+    )
+
+    assert json.loads(columns.json()) == {
+        "isin": ["US88160R1014"],
+        "o": [777],
+        "h": [777],
+        "l": [762],
+        "c": [768],
+        "v": [433],
+        "pbv": [333645],
+        "t": [1630540800000],
+        "mic": ["XMUN"],
+    }
+
+
+def test_ohlc_response_to_pandas():
+    pd = pytest.importorskip("pandas")
+
+    df = RESPONSE.to_pandas()
+
+    assert list(df.columns) == ["isin", "o", "h", "l", "c", "v", "pbv", "t", "mic"]
+    assert df["c"].tolist() == [768]
+    assert df["c"].dtype == "int64"
+    assert df["t"].tolist() == [pd.Timestamp("2021-09-02", tz="UTC")]
+    assert df["isin"].dtype == "category"
+
+
+def test_ohlc_response_to_arrow():
+    pa = pytest.importorskip("pyarrow")
+
+    table = RESPONSE.to_arrow()
+
+    assert table.column("o").to_pylist() == [777]
+    assert table.schema.field("t").type == pa.timestamp("ms", tz="UTC")
+    assert table.column("t").to_pylist() == [datetime(2021, 9, 2, tzinfo=timezone.utc)]
+    assert table.column("mic").to_pylist() == ["XMUN"]
+
+
+def test_ohlc_columns_to_arrow_without_numpy():
+    pa = pytest.importorskip("pyarrow")
+    columns = OhlcColumns._from_rows(RESPONSE.results * 2)
+    columns.o = array("d", [1.5, 2.5])
+
+    with mock.patch.dict(sys.modules, {"numpy": None}):
+        table = columns.to_arrow()
+
+    assert table.schema.field("o").type == pa.float64()
+    assert table.column("o").to_pylist() == [1.5, 2.5]
+    assert table.column("v").to_pylist() == [433, 433]
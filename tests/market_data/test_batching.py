@@ -0,0 +1,147 @@
+import asyncio
+from typing import List
+from urllib.parse import urlencode
+
+import pytest
+from pytest_httpserver import HTTPServer
+
+from lemon.api import Api
+from tests.market_data.test_ohlc import DUMMY_PAYLOAD as OHLC_PAYLOAD
+from tests.market_data.test_ohlc import DUMMY_PAYLOAD_WITH_EPOCH as OHLC_EPOCH_PAYLOAD
+from tests.market_data.test_quotes import DUMMY_PAYLOAD as QUOTES_PAYLOAD
+from tests.market_data.test_trades import DUMMY_PAYLOAD as TRADES_PAYLOAD
+
+ISINS = [f"ISIN{i:02}" for i in range(23)]
+
+
+def page(payload, isins: List[str], **kwargs):
+    results = [dict(payload["results"][0], isin=isin) for isin in isins]
+    return dict(payload, results=results, total=len(results), **kwargs)
+
+
+def expect_chunks(httpserver: HTTPServer, uri: str, payload, **params):
+    for start in range(0, len(ISINS), 10):
+        chunk = ISINS[start : start + 10]
+        httpserver.expect_oneshot_request(
+            uri, query_string=urlencode({"isin": chunk, **params}, doseq=True)
+        ).respond_with_json(page(payload, chunk))
+
+
+def test_short_isin_lists_are_not_split(client: Api, market_data_httpserver):
+    market_data_httpserver.expect_oneshot_request(
+        "/quotes/latest", query_string=urlencode({"isin": ISINS[:10]}, doseq=True)
+    ).respond_with_json(page(QUOTES_PAYLOAD, ISINS[:10]))
+
+    response = client.market_data.quotes.get_latest(isin=ISINS[:10])
+
+    assert len(response.results) == 10
+
+
+def test_quotes(client: Api, market_data_httpserver: HTTPServer):
+    expect_chunks(market_data_httpserver, "/quotes/latest", QUOTES_PAYLOAD, mic="XMUN")
+
+    response = client.market_data.quotes.get_latest(isin=ISINS, mic="XMUN")
+
+    assert [quote.isin for quote in response.results] == ISINS
+    assert (response.total, response.page, response.pages) == (23, 1, 1)
+    assert response.next is None
+    assert list(response.auto_iter()) == response.results
+
+
+def test_ohlc_columnar(client: Api, market_data_httpserver: HTTPServer):
+    expect_chunks(market_data_httpserver, "/ohlc/d1", OHLC_PAYLOAD)
+
+    response = client.market_data.ohlc.get("d1", isin=ISINS, columnar=True)
+
+    assert list(response.results.isin) == ISINS
+
+
+def test_all_pages_of_chunks_are_fetched(
+    client: Api, market_data_httpserver: HTTPServer
+):
+    second_page = urlencode({"isin": ISINS[:10], "page": 2}, doseq=True)
+    market_data_httpserver.expect_oneshot_request(
+        "/trades/latest", query_string=second_page
+    ).respond_with_json(page(TRADES_PAYLOAD, ISINS[5:10], page=2, pages=2))
+    market_data_httpserver.expect_oneshot_request(
+        "/trades/latest", query_string=urlencode({"isin": ISINS[:10]}, doseq=True)
+    ).respond_with_json(
+        page(
+            TRADES_PAYLOAD,
+            ISINS[:5],
+            next=market_data_httpserver.url_for(f"/trades/latest?{second_page}"),
+            pages=2,
+        )
+    )
+    for isins in [ISINS[10:20], ISINS[20:]]:
+        market_data_httpserver.expect_oneshot_request(
+            "/trades/latest", query_string=urlencode({"isin": isins}, doseq=True)
+        ).respond_with_json(page(TRADES_PAYLOAD, isins))
+
+    response = client.market_data.trades.get_latest(isin=ISINS)
+
+    assert [trade.isin for trade in response.results] == ISINS
+
+
+def test_quotes_async(async_client, market_data_httpserver: HTTPServer):
+    expect_chunks(market_data_httpserver, "/quotes/latest", QUOTES_PAYLOAD)
+
+    async def call():
+        async with async_client() as client:
+            return await client.market_data.quotes.get_latest(isin=ISINS)
+
+    response = asyncio.run(call())
+
+    assert [quote.isin for quote in response.results] == ISINS
+    assert response.next is None
+
+
+def expect_timed_chunks(httpserver: HTTPServer, **params):
+    # the n-th ISIN of every chunk has the n-th timestamp of the response
+    for start in range(0, len(ISINS), 10):
+        chunk = ISINS[start : start + 10]
+        results = [
+            dict(OHLC_EPOCH_PAYLOAD["results"][0], isin=isin, t=i * 1000)
+            for i, isin in enumerate(chunk)
+        ]
+        httpserver.expect_oneshot_request(
+            "/ohlc/d1", query_string=urlencode({"isin": chunk, **params}, doseq=True)
+        ).respond_with_json(dict(OHLC_EPOCH_PAYLOAD, results=results))
+
+
+def test_rows_are_merged_in_time_order(client: Api, market_data_httpserver):
+    expect_timed_chunks(market_data_httpserver, epoch=True, sorting="asc", limit=10)
+
+    response = client.market_data.ohlc.get(
+        "d1", isin=ISINS, epoch=True, sorting="asc", limit=10
+    )
+
+    assert [row.t for row in response.results] == sorted(
+        i * 1000 for i in [*range(10), *range(10), *range(3)]
+    )
+    assert [row.isin for row in response.results[:3]] == ["ISIN00", "ISIN10", "ISIN20"]
+
+
+def test_rows_are_merged_in_time_order_async(
+    async_client, market_data_httpserver: HTTPServer
+):
+    expect_timed_chunks(market_data_httpserver, epoch=True, sorting="desc")
+
+    async def call():
+        async with async_client() as client:
+            return await client.market_data.ohlc.get(
+                "d1", isin=ISINS, epoch=True, sorting="desc"
+            )
+
+    response = asyncio.run(call())
+
+    times = [row.t for row in response.results]
+    assert times == sorted(times, reverse=True)
+    assert [row.isin for row in response.results[-3:]] == ["ISIN00", "ISIN10", "ISIN20"]
+
+
+def test_page_is_rejected(client: Api, market_data_httpserver: HTTPServer):
+    with pytest.raises(ValueError):
+        client.market_data.ohlc.get("d1", isin=ISINS, page=2)
+
+    assert market_data_httpserver.log == []
@@ -0,0 +1,104 @@
+import json
+
+from pytest_httpserver import HTTPServer
+
+from lemon.api import Api
+from lemon.market_data.catalog import InstrumentCatalog
+from tests.market_data.test_instruments import DUMMY_PAYLOAD
+
+MODIFIED_SINCE = "Mon, 14 Feb 2022 20:44:03 GMT"
+
+
+def instrument(isin: str, name: str = "COINBASE GLB.CL.A -,00001"):
+    return dict(DUMMY_PAYLOAD["results"][0], isin=isin, name=name)
+
+
+def expect_full_download(httpserver: HTTPServer):
+    httpserver.expect_oneshot_request(
+        "/instruments", query_string="limit=100&page=2"
+    ).respond_with_json(
+        dict(DUMMY_PAYLOAD, results=[instrument("ISIN2")], next=None, pages=2)
+    )
+    httpserver.expect_oneshot_request(
+        "/instruments", query_string="limit=100"
+    ).respond_with_json(
+        dict(
+            DUMMY_PAYLOAD,
+            results=[instrument("ISIN1")],
+            next=httpserver.url_for("/instruments?limit=100&page=2"),
+            page=1,
+            pages=2,
+        )
+    )
+
+
+def test_full_sync(client: Api, market_data_httpserver: HTTPServer):
+    expect_full_download(market_data_httpserver)
+    catalog = InstrumentCatalog(client.market_data.instruments)
+
+    changed = catalog.sync()
+
+    assert [instrument.isin for instrument in changed] == ["ISIN1", "ISIN2"]
+    assert len(catalog) == 2
+    assert "ISIN1" in catalog
+    assert catalog["ISIN2"].isin == "ISIN2"
+    assert catalog.synced_at.isoformat() == "2022-02-14T20:44:03.759000+00:00"
+
+
+def test_incremental_sync(client: Api, market_data_httpserver: HTTPServer):
+    expect_full_download(market_data_httpserver)
+    catalog = InstrumentCatalog(client.market_data.instruments)
+    catalog.sync()
+    market_data_httpserver.expect_oneshot_request(
+        "/instruments",
+        query_string="limit=100",
+        headers={"if-modified-since": MODIFIED_SINCE},
+    ).respond_with_json(
+        dict(
+            DUMMY_PAYLOAD,
+            time="2022-02-15T20:00:00.000+00:00",
+            results=[instrument("ISIN2", name="RENAMED"), instrument("ISIN3")],
+            next=None,
+            pages=1,
+        )
+    )
+
+    changed = catalog.sync()
+
+    assert [instrument.isin for instrument in changed] == ["ISIN2", "ISIN3"]
+    assert [instrument.isin for instrument in catalog] == ["ISIN1", "ISIN2", "ISIN3"]
+    assert catalog["ISIN2"].name == "RENAMED"
+    assert catalog.synced_at.isoformat() == "2022-02-15T20:00:00+00:00"
+
+
+def test_incremental_sync_not_modified(client: Api, market_data_httpserver: HTTPServer):
+    expect_full_download(market_data_httpserver)
+    catalog = InstrumentCatalog(client.market_data.instruments)
+    catalog.sync()
+    market_data_httpserver.expect_oneshot_request(
+        "/instruments",
+        query_string="limit=100",
+        headers={"if-modified-since": MODIFIED_SINCE},
+    ).respond_with_data(status=304)
+
+    assert catalog.sync() == []
+    assert len(catalog) == 2
+
+
+def test_persistence(client: Api, market_data_httpserver: HTTPServer, tmp_path):
+    path = str(tmp_path / "instruments.json")
+    expect_full_download(market_data_httpserver)
+    InstrumentCatalog(client.market_data.instruments, path=path).sync()
+    market_data_httpserver.expect_oneshot_request(
+        "/instruments",
+        query_string="limit=100",
+        headers={"if-modified-since": MODIFIED_SINCE},
+    ).respond_with_data(status=304)
+
+    catalog = InstrumentCatalog(client.market_data.instruments, path=path)
+    assert [instrument.isin for instrument in catalog] == ["ISIN1", "ISIN2"]
+    assert catalog["ISIN1"].venues[0].mic == "XMUN"
+
+    catalog.sync()
+    with open(path, encoding="utf-8") as file:
+        assert len(json.load(file)["instruments"]) == 2
@@ -0,0 +1,74 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+from lemon.api import Api
+from lemon.market_data.history import HistoryDownloader, shards
+from tests.market_data.test_ohlc import DUMMY_PAYLOAD as OHLC_PAYLOAD
+from tests.market_data.test_trades import DUMMY_PAYLOAD as TRADES_PAYLOAD
+
+START = datetime(2022, 1, 1, tzinfo=timezone.utc)
+ISIN = "US88160R1014"
+
+
+def hourly_rows(payload):
+    """Respond with a row for each full hour of the requested range, inclusive."""
+
+    def handler(request: Request) -> Response:
+        from_ = datetime.fromisoformat(request.args["from"])
+        to = datetime.fromisoformat(request.args["to"])
+        assert request.args["sorting"] == "asc"
+        rows, t = [], from_
+        while t <= to:
+            rows.append(dict(payload["results"][0], t=t.isoformat()))
+            t += timedelta(hours=1)
+        data = dict(payload, results=rows, total=len(rows))
+        return Response(json.dumps(data), content_type="application/json")
+
+    return handler
+
+
+def test_shards():
+    assert shards(START, START + timedelta(hours=5), timedelta(hours=2)) == [
+        (START, START + timedelta(hours=2)),
+        (START + timedelta(hours=2), START + timedelta(hours=4)),
+        (START + timedelta(hours=4), START + timedelta(hours=5)),
+    ]
+    assert shards(START, START, timedelta(hours=2)) == []
+    with pytest.raises(ValueError):
+        shards(START, START, timedelta(0))
+
+
+@pytest.mark.parametrize("concurrency", [1, 3])
+def test_ohlc(client: Api, market_data_httpserver: HTTPServer, concurrency):
+    market_data_httpserver.expect_request("/ohlc/h1").respond_with_handler(
+        hourly_rows(OHLC_PAYLOAD)
+    )
+    downloader = HistoryDownloader(
+        client.market_data, shard=timedelta(hours=4), concurrency=concurrency
+    )
+
+    rows = list(downloader.ohlc("h1", [ISIN], START, START + timedelta(hours=10)))
+
+    assert [row.t for row in rows] == [START + timedelta(hours=i) for i in range(11)]
+    assert len(market_data_httpserver.log) == 3
+    assert all(
+        request.args.getlist("isin") == [ISIN]
+        for request, _ in market_data_httpserver.log
+    )
+
+
+def test_trades_stopped_early(client: Api, market_data_httpserver: HTTPServer):
+    market_data_httpserver.expect_request("/trades").respond_with_handler(
+        hourly_rows(TRADES_PAYLOAD)
+    )
+    downloader = HistoryDownloader(client.market_data, shard=timedelta(hours=1))
+
+    rows = downloader.trades(ISIN, START, START + timedelta(days=1))
+
+    assert next(rows).t == START
+    rows.close()
+    assert len(market_data_httpserver.log) <= 5
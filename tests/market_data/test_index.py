@@ -0,0 +1,105 @@
+import pytest
+
+from lemon.market_data.index import InstrumentIndex
+from lemon.market_data.model import Instrument, InstrumentVenue
+
+
+def venue(mic: str, currency: str = "EUR", tradable: bool = True) -> InstrumentVenue:
+    return InstrumentVenue(
+        name=mic,
+        title=mic,
+        mic=mic,
+        is_open=True,
+        tradable=tradable,
+        currency=currency,
+    )
+
+
+TESLA = Instrument(
+    isin="US88160R1014",
+    wkn="A1CX3T",
+    name="TESLA INC. DL -,001",
+    title="TESLA INC",
+    symbol="TL0",
+    type="stock",
+    venues=[venue("XMUN")],
+)
+TESLA_ETF = Instrument(
+    isin="IE000XXXXXXX",
+    wkn="A3XXXX",
+    name="LEVERAGED TESLA ETF",
+    title=None,
+    symbol="TSL3",
+    type="etf",
+    venues=[venue("XMUN", tradable=False), venue("XFRA", currency="USD")],
+)
+COINBASE = Instrument(
+    isin="US19260Q1076",
+    wkn="A2QP7J",
+    name="COINBASE GLB.CL.A -,00001",
+    title="COINBASE GLOBAL INC",
+    symbol="1QZ",
+    type="stock",
+    venues=[venue("XMUN")],
+)
+
+
+@pytest.fixture
+def index():
+    return InstrumentIndex([TESLA, TESLA_ETF, COINBASE])
+
+
+def test_lookups(index: InstrumentIndex):
+    assert len(index) == 3
+    assert index.by_isin("us88160r1014") is TESLA
+    assert index.by_wkn("A2QP7J") is COINBASE
+    assert index.by_symbol("tsl3") == [TESLA_ETF]
+    assert index.by_isin("unknown") is None
+    assert index.by_symbol("unknown") == []
+
+
+@pytest.mark.parametrize(
+    "query,expected",
+    [
+        ("US19260Q1076", [COINBASE]),
+        ("1qz", [COINBASE]),
+        ("tes", [TESLA, TESLA_ETF]),
+        ("global", [COINBASE]),
+        ("co", [COINBASE]),
+        ("inc", [TESLA, COINBASE]),
+        ("verag", [TESLA_ETF]),
+        ("tesla etf", [TESLA_ETF]),
+        ("nothing", []),
+        ("", []),
+    ],
+)
+def test_search(index: InstrumentIndex, query, expected):
+    assert index.search(query) == expected
+
+
+def test_search_ranks_identifiers_first(index: InstrumentIndex):
+    assert index.search("TSL3") == [TESLA_ETF]
+    assert index.search("tesla", limit=1) == [TESLA]
+
+
+@pytest.mark.parametrize(
+    "filters,expected",
+    [
+        ({}, [TESLA, TESLA_ETF, COINBASE]),
+        ({"type": ["etf"]}, [TESLA_ETF]),
+        ({"type": ["stock", "etf"]}, [TESLA, TESLA_ETF, COINBASE]),
+        ({"mic": ["XFRA"]}, [TESLA_ETF]),
+        ({"currency": ["usd"]}, [TESLA_ETF]),
+        ({"tradable": False}, [TESLA_ETF]),
+        ({"mic": ["XMUN"], "tradable": True}, [TESLA, COINBASE]),
+        ({"mic": ["XMUN"], "currency": ["USD"]}, []),
+        ({"type": ["bond"]}, []),
+    ],
+)
+def test_filters(index: InstrumentIndex, filters, expected):
+    assert index.search(**filters) == expected
+
+
+def test_search_with_filters(index: InstrumentIndex):
+    assert index.search("tesla", type=["etf"]) == [TESLA_ETF]
+    assert index.search("tesla", mic=["XMUN"], tradable=True) == [TESLA]
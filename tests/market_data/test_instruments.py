@@ -1,4 +1,5 @@
-from datetime import datetime
+import asyncio
+from datetime import datetime, timezone
 from unittest import mock
 
 import pytest
@@ -158,3 +159,116 @@ class TestInstrumentsApi(CommonMarketDataApiTests):
 
         response = client.market_data.instruments.get()
         assert isinstance(response.json(), str)
+
+    def test_json_property_async(self, async_client, httpserver: HTTPServer):
+        httpserver.expect_oneshot_request(
+            "/instruments",
+            method="GET",
+        ).respond_with_json(DUMMY_PAYLOAD)
+
+        async def call():
+            async with async_client() as client:
+                return await client.market_data.instruments.get()
+
+        response = asyncio.run(call())
+        assert isinstance(response.json(), str)
+        assert response.dict()["results"] == DUMMY_RESPONSE.dict()["results"]
+
+    def test_get_instruments_async(self, async_client, httpserver: HTTPServer):
+        httpserver.expect_oneshot_request(
+            "/instruments",
+            query_string="type=stock&type=etf&tradable=True",
+            method="GET",
+        ).respond_with_json(DUMMY_PAYLOAD)
+
+        async def call():
+            async with async_client() as client:
+                return await client.market_data.instruments.get(
+                    type=["stock", "etf"], tradable=True
+                )
+
+        assert asyncio.run(call()).results == DUMMY_RESPONSE.results
+
+    def test_return_empty_list_on_304_async(self, async_client, httpserver: HTTPServer):
+        httpserver.expect_oneshot_request(
+            "/instruments",
+            method="GET",
+            headers={"if-modified-since": "Sun, 07 Nov 2021 22:59:00 GMT"},
+        ).respond_with_data(status=304)
+
+        async def call():
+            async with async_client() as client:
+                return await client.market_data.instruments.get(
+                    modified_since=datetime(2021, 11, 7, 22, 59, tzinfo=timezone.utc)
+                )
+
+        response = asyncio.run(call())
+
+        assert response.results == []
+        assert response.next is None
+
+    def _expect_pages(self, httpserver: HTTPServer):
+        for page in [3, 2]:
+            httpserver.expect_oneshot_request(
+                "/instruments",
+                query_string=f"tradable=True&page={page}",
+                method="GET",
+            ).respond_with_json(
+                dict(
+                    DUMMY_PAYLOAD,
+                    results=[dict(DUMMY_PAYLOAD["results"][0], isin=f"ISIN{page}")],
+                    next=None if page == 3 else "ignored",
+                    page=page,
+                    pages=3,
+                )
+            )
+        httpserver.expect_oneshot_request(
+            "/instruments",
+            query_string="tradable=True",
+            method="GET",
+        ).respond_with_json(
+            dict(
+                DUMMY_PAYLOAD,
+                results=[dict(DUMMY_PAYLOAD["results"][0], isin="ISIN1")],
+                next=httpserver.url_for("/instruments?tradable=True&page=2"),
+                page=1,
+                pages=3,
+            )
+        )
+
+    def test_fetch_all(self, client: Api, httpserver: HTTPServer):
+        self._expect_pages(httpserver)
+
+        results = client.market_data.instruments.get(tradable=True).fetch_all(
+            concurrency=2
+        )
+
+        assert [instrument.isin for instrument in results] == [
+            "ISIN1",
+            "ISIN2",
+            "ISIN3",
+        ]
+
+    def test_afetch_all(self, async_client, httpserver: HTTPServer):
+        self._expect_pages(httpserver)
+
+        async def call():
+            async with async_client() as client:
+                response = await client.market_data.instruments.get(tradable=True)
+                return await response.afetch_all(concurrency=2)
+
+        assert [instrument.isin for instrument in asyncio.run(call())] == [
+            "ISIN1",
+            "ISIN2",
+            "ISIN3",
+        ]
+
+    def test_fetch_all_single_page(self, client: Api, httpserver: HTTPServer):
+        httpserver.expect_oneshot_request(
+            "/instruments",
+            method="GET",
+        ).respond_with_json(dict(DUMMY_PAYLOAD, next=None))
+
+        assert (
+            client.market_data.instruments.get().fetch_all() == DUMMY_RESPONSE.results
+        )
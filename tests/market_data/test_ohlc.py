@@ -1,10 +1,12 @@
+import asyncio
+from array import array
 from datetime import datetime
 
 import pytest
 from pytest_httpserver import HTTPServer
 
 from lemon.api import Api
-from lemon.market_data.model import GetOhlcResponse, OhlcData
+from lemon.market_data.model import GetOhlcResponse, OhlcColumns, OhlcData
 from tests.market_data.conftest import CommonMarketDataApiTests
 
 DUMMY_PAYLOAD = {
@@ -226,3 +228,235 @@ class TestGetOhlcApi(CommonMarketDataApiTests):
         results = client.market_data.ohlc.get(period="m1", isin=["XMUN"]).auto_iter()
 
         assert list(results) == DUMMY_RESPONSE.results
+
+    def test_iterator_over_multiple_pages(self, client: Api, httpserver):
+        httpserver.expect_oneshot_request(
+            "/ohlc/m1",
+            query_string="isin=XMUN&decimals=True&epoch=True",
+            method="GET",
+        ).respond_with_json(
+            dict(
+                DUMMY_PAYLOAD_WITH_EPOCH,
+                next=httpserver.url_for("/ohlc/m1?isin=XMUN&page=2"),
+                pages=2,
+            )
+        )
+        httpserver.expect_oneshot_request(
+            "/ohlc/m1",
+            query_string="isin=XMUN&page=2",
+            method="GET",
+        ).respond_with_json(dict(DUMMY_PAYLOAD_WITH_EPOCH, page=2, pages=2))
+
+        results = list(
+            client.market_data.ohlc.get(
+                period="m1", isin=["XMUN"], epoch=True, decimals=True
+            ).auto_iter()
+        )
+
+        assert len(results) == 2
+        assert all(isinstance(ohlc.t, int) for ohlc in results)
+        assert all(isinstance(ohlc.o, float) for ohlc in results)
+
+    def test_iterator_after_empty_first_page(self, client: Api, httpserver):
+        httpserver.expect_oneshot_request(
+            "/ohlc/m1",
+            query_string="isin=US88160R1014&decimals=True&epoch=True",
+            method="GET",
+        ).respond_with_json(
+            dict(
+                DUMMY_PAYLOAD_WITH_EPOCH,
+                results=[],
+                next=httpserver.url_for("/ohlc/m1?isin=US88160R1014&page=2"),
+                pages=2,
+            )
+        )
+        httpserver.expect_oneshot_request(
+            "/ohlc/m1",
+            query_string="isin=US88160R1014&page=2",
+            method="GET",
+        ).respond_with_json(
+            dict(
+                DUMMY_PAYLOAD_WITH_EPOCH,
+                results=[dict(DUMMY_PAYLOAD_WITH_EPOCH["results"][0], o=777.5)],
+                page=2,
+                pages=2,
+            )
+        )
+
+        (ohlc,) = client.market_data.ohlc.get(
+            period="m1", isin=["US88160R1014"], epoch=True, decimals=True
+        ).auto_iter()
+
+        assert ohlc.t == 1045643
+        assert ohlc.o == 777.5
+
+    def test_async_iterator(self, async_client, httpserver: HTTPServer):
+        httpserver.expect_oneshot_request(
+            "/ohlc/m1",
+            query_string="isin=XMUN",
+            method="GET",
+        ).respond_with_json(
+            dict(DUMMY_PAYLOAD, next=httpserver.url_for("/ohlc/m1?isin=XMUN&page=2"))
+        )
+        httpserver.expect_oneshot_request(
+            "/ohlc/m1",
+            query_string="isin=XMUN&page=2",
+            method="GET",
+        ).respond_with_json(DUMMY_PAYLOAD)
+
+        async def consume():
+            async with async_client() as client:
+                response = await client.market_data.ohlc.get(period="m1", isin=["XMUN"])
+                return [ohlc async for ohlc in response.auto_aiter()]
+
+        assert asyncio.run(consume()) == DUMMY_RESPONSE.results * 2
+
+    def test_sync_iterator_rejects_async_client(
+        self, async_client, httpserver: HTTPServer
+    ):
+        httpserver.expect_oneshot_request(
+            "/ohlc/m1",
+            query_string="isin=XMUN",
+            method="GET",
+        ).respond_with_json(dict(DUMMY_PAYLOAD, next="ohlc/m1?isin=XMUN&page=2"))
+
+        async def consume():
+            async with async_client() as client:
+                response = await client.market_data.ohlc.get(period="m1", isin=["XMUN"])
+                return list(response.auto_iter())
+
+        with pytest.raises(TypeError):
+            asyncio.run(consume())
+
+    def test_get_ohlc_columnar(self, client: Api, httpserver: HTTPServer):
+        httpserver.expect_oneshot_request(
+            "/ohlc/m1",
+            query_string="isin=XMUN&decimals=True",
+            method="GET",
+        ).respond_with_json(DUMMY_PAYLOAD)
+
+        columns = client.market_data.ohlc.get(
+            "m1", isin=["XMUN"], decimals=True, columnar=True
+        ).results
+
+        assert columns == OhlcColumns(
+            isin=["US88160R1014"],
+            o=array("d", [777]),
+            h=array("d", [777]),
+            l=array("d", [762]),
+            c=array("d", [768]),
+            v=array("q", [433]),
+            pbv=array("d", [333645]),
+            t=array("q", [1630540800000]),
+            mic=["XMUN"],
+        )
+        assert list(columns) == [
+            ("US88160R1014", 777, 777, 762, 768, 433, 333645, 1630540800000, "XMUN")
+        ]
+
+    def test_concat_columnar_pages(self, client: Api, httpserver: HTTPServer):
+        httpserver.expect_oneshot_request(
+            "/ohlc/m1",
+            query_string="isin=XMUN&page=2",
+            method="GET",
+        ).respond_with_json(
+            dict(
+                DUMMY_PAYLOAD_WITH_EPOCH,
+                results=[dict(DUMMY_PAYLOAD_WITH_EPOCH["results"][0], c=770)],
+                page=2,
+                pages=2,
+            )
+        )
+        httpserver.expect_oneshot_request(
+            "/ohlc/m1",
+            query_string="isin=XMUN&epoch=True",
+            method="GET",
+        ).respond_with_json(
+            dict(
+                DUMMY_PAYLOAD_WITH_EPOCH,
+                next=httpserver.url_for("/ohlc/m1?isin=XMUN&page=2"),
+                pages=2,
+            )
+        )
+
+        response = client.market_data.ohlc.get(
+            "m1", isin=["XMUN"], epoch=True, columnar=True
+        )
+        columns = response.auto_concat()
+
+        assert columns.c == array("q", [768, 770])
+        assert columns.t == array("q", [1045643, 1045643])
+        assert columns.isin[0] is columns.isin[1]
+        assert len(response.results) == 1
+
+    def test_all_pages_to_pandas(self, client: Api, httpserver: HTTPServer):
+        pytest.importorskip("pandas")
+        httpserver.expect_oneshot_request(
+            "/ohlc/m1",
+            query_string="isin=XMUN&page=2",
+            method="GET",
+        ).respond_with_json(
+            dict(
+                DUMMY_PAYLOAD,
+                results=[dict(DUMMY_PAYLOAD["results"][0], o=770.5)],
+                page=2,
+                pages=2,
+            )
+        )
+        httpserver.expect_oneshot_request(
+            "/ohlc/m1",
+            query_string="isin=XMUN&decimals=True",
+            method="GET",
+        ).respond_with_json(
+            dict(DUMMY_PAYLOAD, next=httpserver.url_for("/ohlc/m1?isin=XMUN&page=2"))
+        )
+
+        df = client.market_data.ohlc.get("m1", isin=["XMUN"], decimals=True).to_pandas(
+            all_pages=True
+        )
+
+        assert df["o"].tolist() == [777.0, 770.5]
+        assert df["o"].dtype == "float64"
+        assert str(df["t"].dtype) == "datetime64[ms, UTC]"
+
+    def test_get_ohlc_async(self, async_client, httpserver: HTTPServer):
+        httpserver.expect_oneshot_request(
+            "/ohlc/m1",
+            query_string="isin=XMUN&isin=US88160R1014&from=2021-11-07+22%3A59%3A00%2B00%3A00&"
+            "to=P7D&decimals=True",
+            method="GET",
+        ).respond_with_json(DUMMY_PAYLOAD)
+
+        async def call():
+            async with async_client() as client:
+                return await client.market_data.ohlc.get(
+                    period="m1",
+                    isin=["XMUN", "US88160R1014"],
+                    from_=datetime.fromisoformat("2021-11-07T22:59:00.000+00:00"),
+                    to=7,
+                    decimals=True,
+                )
+
+        response = asyncio.run(call())
+
+        assert response.total == 1
+        assert isinstance(response.results[0].o, float)
+
+    def test_retry_on_error_async(self, async_client, httpserver: HTTPServer):
+        httpserver.expect_oneshot_request(
+            "/ohlc/h1",
+            query_string="isin=XMUN",
+            method="GET",
+        ).respond_with_data(status=500)
+
+        httpserver.expect_oneshot_request(
+            "/ohlc/h1",
+            query_string="isin=XMUN",
+            method="GET",
+        ).respond_with_json(DUMMY_PAYLOAD)
+
+        async def call():
+            async with async_client() as client:
+                return await client.market_data.ohlc.get(period="h1", isin=["XMUN"])
+
+        assert asyncio.run(call()).results == DUMMY_RESPONSE.results
@@ -0,0 +1,104 @@
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlencode
+
+import pytest
+from pytest_httpserver import HTTPServer
+
+from lemon.api import Api
+from lemon.errors import InternalServerError
+from lemon.market_data.quote_cache import QuoteCache
+from tests.conftest import build_error
+from tests.market_data.test_quotes import DUMMY_PAYLOAD
+from tests.test_rate_limit import FakeClock
+
+
+def payload(*isins: str):
+    results = [dict(DUMMY_PAYLOAD["results"][0], isin=isin) for isin in isins]
+    return dict(DUMMY_PAYLOAD, results=results, total=len(results))
+
+
+def expect_latest(httpserver: HTTPServer, *isins: str, mic: str = "XMUN"):
+    httpserver.expect_oneshot_request(
+        "/quotes/latest", query_string=urlencode({"isin": isins, "mic": mic}, True)
+    ).respond_with_json(payload(*isins))
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(client: Api, clock: FakeClock) -> QuoteCache:
+    return QuoteCache(client.market_data.quotes, batch_window=0, clock=clock)
+
+
+def test_fresh_quotes_are_cached(
+    cache: QuoteCache, clock: FakeClock, market_data_httpserver: HTTPServer
+):
+    expect_latest(market_data_httpserver, "A")
+
+    first = cache.get("A", mic="XMUN")
+    clock.now = 1.0
+    second = cache.get("A", mic="XMUN")
+
+    assert first.isin == "A"
+    assert second is first
+
+
+def test_stale_quotes_are_refreshed(
+    cache: QuoteCache, clock: FakeClock, market_data_httpserver: HTTPServer
+):
+    expect_latest(market_data_httpserver, "A")
+    cache.get("A", mic="XMUN")
+    expect_latest(market_data_httpserver, "A")
+
+    clock.now = 0.5
+    cache.get("A", mic="XMUN", max_staleness=0.1)
+
+    assert len(market_data_httpserver.log) == 2
+
+
+def test_only_missing_quotes_are_fetched(
+    cache: QuoteCache, market_data_httpserver: HTTPServer
+):
+    expect_latest(market_data_httpserver, "A")
+    market_data_httpserver.expect_oneshot_request(
+        "/quotes/latest", query_string="isin=B&isin=C&isin=UNKNOWN&mic=XMUN"
+    ).respond_with_json(payload("B", "C"))
+
+    cache.get("A", mic="XMUN")
+    quotes = cache.get_many(["A", "B", "C", "UNKNOWN"], mic="XMUN")
+
+    assert sorted(quotes) == ["A", "B", "C"]
+
+
+def test_invalidate(cache: QuoteCache, market_data_httpserver: HTTPServer):
+    expect_latest(market_data_httpserver, "A")
+    cache.get("A", mic="XMUN")
+    expect_latest(market_data_httpserver, "A")
+
+    cache.invalidate("A")
+    cache.get("A", mic="XMUN")
+
+    assert len(market_data_httpserver.log) == 2
+
+
+def test_concurrent_misses_are_batched(client: Api, market_data_httpserver: HTTPServer):
+    expect_latest(market_data_httpserver, "A", "B", "C", "D")
+    cache = QuoteCache(client.market_data.quotes, batch_window=0.2)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        quotes = list(executor.map(lambda isin: cache.get(isin, mic="XMUN"), "ABCD"))
+
+    assert [quote.isin for quote in quotes] == ["A", "B", "C", "D"]
+    assert len(market_data_httpserver.log) == 1
+
+
+def test_errors_are_raised(cache: QuoteCache, market_data_httpserver: HTTPServer):
+    market_data_httpserver.expect_oneshot_request("/quotes/latest").respond_with_json(
+        build_error("internal_error"), status=400
+    )
+
+    with pytest.raises(InternalServerError):
+        cache.get("A", mic="XMUN")
@@ -1,4 +1,5 @@
 import abc
+from array import array
 from datetime import datetime, timezone
 from urllib.parse import urlencode
 
@@ -6,7 +7,9 @@ import pytest
 from pytest_httpserver import HTTPServer
 
 from lemon.api import Api
-from lemon.market_data.model import GetQuotesResponse, Quote
+from lemon.errors import InternalServerError
+from lemon.market_data.model import GetQuotesResponse, Quote, QuoteColumns
+from tests.conftest import build_error
 from tests.market_data.conftest import CommonMarketDataApiTests
 
 DUMMY_PAYLOAD = {
@@ -150,6 +153,25 @@ class BaseQuotesAPITests(CommonMarketDataApiTests):
         quote = self.make_api_call(client, epoch=True).results[0]
         assert isinstance(quote.t, int)
 
+    def test_get_quotes_columnar(self, client: Api, httpserver: HTTPServer):
+        httpserver.expect_oneshot_request(
+            self.uri,
+            query_string="isin=A&decimals=True",
+            method="GET",
+        ).respond_with_json(DUMMY_PAYLOAD)
+
+        columns = self.make_api_call(client, decimals=True, columnar=True).results
+
+        assert columns == QuoteColumns(
+            isin=["US88160R1014"],
+            b_v=array("q", [87]),
+            a_v=array("q", [87]),
+            b=array("d", [921]),
+            a=array("d", [921]),
+            t=array("q", [1635411063669]),
+            mic=["XMUN"],
+        )
+
     def test_get_quotes_non_epoch_form(self, client: Api, httpserver: HTTPServer):
         httpserver.expect_oneshot_request(
             self.uri,
@@ -220,3 +242,58 @@ class TestGetQuotes(BaseQuotesAPITests):
 
         DUMMY_RESPONSE._client = client.market_data
         assert self.make_api_call(client, **function_kwargs) == DUMMY_RESPONSE
+
+    def _expect_pages(self, httpserver: HTTPServer, pages: int):
+        for page in range(pages, 0, -1):
+            httpserver.expect_oneshot_request(
+                self.uri,
+                query_string=urlencode(
+                    {"isin": "A", "from": DT} if page == 1 else {"page": page}
+                ),
+                method="GET",
+            ).respond_with_json(
+                dict(
+                    DUMMY_PAYLOAD,
+                    results=[dict(DUMMY_PAYLOAD["results"][0], b_v=page)],
+                    next=httpserver.url_for(f"{self.uri}?page={page + 1}")
+                    if page < pages
+                    else None,
+                    page=page,
+                    pages=pages,
+                )
+            )
+
+    @pytest.mark.parametrize("prefetch", [1, 2, 10])
+    def test_prefetching_iterator(
+        self, client: Api, httpserver: HTTPServer, prefetch: int
+    ):
+        self._expect_pages(httpserver, pages=4)
+
+        response = client.market_data.quotes.get(isin="A", from_=DT)
+
+        assert [quote.b_v for quote in response.auto_iter(prefetch=prefetch)] == [
+            1,
+            2,
+            3,
+            4,
+        ]
+
+    def test_prefetching_iterator_raises_error(
+        self, client: Api, httpserver: HTTPServer
+    ):
+        httpserver.expect_oneshot_request(
+            self.uri, query_string="page=2", method="GET"
+        ).respond_with_json(build_error("internal_error"), status=400)
+        httpserver.expect_oneshot_request(
+            self.uri, query_string=urlencode({"isin": "A", "from": DT}), method="GET"
+        ).respond_with_json(
+            dict(DUMMY_PAYLOAD, next=httpserver.url_for(f"{self.uri}?page=2"))
+        )
+
+        iterator = client.market_data.quotes.get(isin="A", from_=DT).auto_iter(
+            prefetch=1
+        )
+
+        assert next(iterator).b_v == 87
+        with pytest.raises(InternalServerError):
+            next(iterator)
@@ -0,0 +1,116 @@
+from array import array
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from lemon.market_data import resample as resample_module
+from lemon.market_data.model import OhlcColumns, OhlcData, OpeningHours
+from lemon.market_data.resample import resample, resample_rows
+
+# 2022-01-03 07:58 UTC, 08:58 in Berlin
+START = datetime(2022, 1, 3, 7, 58, tzinfo=timezone.utc)
+OPENING_HOURS = OpeningHours._from_data(
+    {"start": "09:00", "end": "17:30", "timezone": "Europe/Berlin"}
+)
+
+
+@pytest.fixture(autouse=True, params=["numpy", "loop"])
+def implementation(request, monkeypatch):
+    if request.param == "loop":
+        monkeypatch.setattr(resample_module, "np", None)
+    return request.param
+
+
+def minute(n: int) -> datetime:
+    return START + timedelta(minutes=n)
+
+
+def candle(n: int, isin: str = "US88160R1014") -> OhlcData:
+    return OhlcData(
+        isin=isin,
+        o=100.0 + n,
+        h=110.0 + n,
+        l=90.0 + n,
+        c=101.0 + n,
+        v=10,
+        pbv=1000.0 + n,
+        t=minute(n),
+        mic="XMUN",
+    )
+
+
+def test_aligned_to_utc():
+    rows = resample_rows([candle(n) for n in range(8)], 5)
+
+    assert [row.t for row in rows] == [
+        datetime(2022, 1, 3, 7, 55, tzinfo=timezone.utc),
+        datetime(2022, 1, 3, 8, 0, tzinfo=timezone.utc),
+        datetime(2022, 1, 3, 8, 5, tzinfo=timezone.utc),
+    ]
+    assert rows[1] == OhlcData(
+        isin="US88160R1014",
+        o=102.0,
+        h=116.0,
+        l=92.0,
+        c=107.0,
+        v=50,
+        pbv=5020.0,
+        t=datetime(2022, 1, 3, 8, 0, tzinfo=timezone.utc),
+        mic="XMUN",
+    )
+
+
+def test_aligned_to_opening_hours():
+    # the first two candles are before the opening at 09:00 Berlin time
+    rows = resample_rows(
+        [candle(n) for n in range(2, 20)] + [candle(0), candle(1)],
+        15,
+        opening_hours=OPENING_HOURS,
+    )
+
+    assert [(row.t, row.v, row.o, row.c) for row in rows] == [
+        (minute(2), 150, 102.0, 117.0),
+        (minute(17), 30, 117.0, 120.0),
+    ]
+
+
+def test_after_closing_is_dropped():
+    closing = datetime(2022, 1, 3, 16, 30, tzinfo=timezone.utc)
+    rows = [candle(0)]
+    rows[0].t = closing
+
+    assert resample_rows(rows, 15, opening_hours=OPENING_HOURS) == []
+
+
+def test_columns_of_several_instruments():
+    columns = OhlcColumns._from_rows(
+        [candle(n, isin) for n in range(2, 6) for isin in ["A", "B"]]
+    )
+
+    resampled = resample(columns, 60)
+
+    assert resampled.isin == ["A", "B"]
+    assert resampled.v == array("q", [40, 40])
+    assert resampled.h == array("d", [115.0, 115.0])
+    assert resampled.t.typecode == "q"
+
+
+def test_invalid_minutes():
+    with pytest.raises(ValueError):
+        resample_rows([], 0)
+
+
+def test_unordered_rows_with_equal_times():
+    rows = [candle(n) for n in [4, 3, 4, 3, 20]]
+    # open of the first row of the earliest, close of the last of the latest
+    rows[1].o, rows[3].o = 1.0, 5.0
+    rows[0].c, rows[2].c = 3.0, 2.0
+
+    resampled = resample(OhlcColumns._from_rows(rows), 15)
+
+    assert list(resampled.o) == [1.0, 120.0]
+    assert list(resampled.c) == [2.0, 121.0]
+    assert list(resampled.t) == [
+        int(minute(2).timestamp() * 1000),
+        int(minute(17).timestamp() * 1000),
+    ]
@@ -0,0 +1,120 @@
+import json
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+from lemon.api import Api
+from lemon.market_data.store import OhlcStore, _gaps
+from tests.market_data.test_ohlc import DUMMY_PAYLOAD
+
+START = datetime(2022, 1, 1, tzinfo=timezone.utc)
+
+
+def hours(n: float) -> datetime:
+    return START + timedelta(hours=n)
+
+
+def hourly_candles(server_time: datetime):
+    """Respond with a candle for each full hour of the requested range."""
+
+    def handler(request: Request) -> Response:
+        assert request.args["epoch"] == "True"
+        assert request.args["decimals"] == "True"
+        from_ = datetime.fromisoformat(request.args["from"])
+        to = datetime.fromisoformat(request.args["to"])
+        rows, t = [], from_
+        while t <= min(to, server_time):
+            row = dict(DUMMY_PAYLOAD["results"][0], t=int(t.timestamp() * 1000))
+            rows.append(row)
+            t += timedelta(hours=1)
+        data = dict(
+            DUMMY_PAYLOAD, time=server_time.isoformat(), results=rows, total=len(rows)
+        )
+        return Response(json.dumps(data), content_type="application/json")
+
+    return handler
+
+
+@pytest.fixture
+def store(client: Api, tmp_path):
+    store = OhlcStore(client.market_data.ohlc, str(tmp_path / "ohlc.sqlite"))
+    yield store
+    store.close()
+
+
+def requested_ranges(httpserver: HTTPServer):
+    return [
+        (
+            datetime.fromisoformat(request.args["from"]),
+            datetime.fromisoformat(request.args["to"]),
+        )
+        for request, _ in httpserver.log
+    ]
+
+
+def test_gaps():
+    assert _gaps([], 0, 10) == [(0, 10)]
+    assert _gaps([(2, 4), (6, 8)], 0, 10) == [(0, 2), (4, 6), (8, 10)]
+    assert _gaps([(0, 5), (3, 12)], 1, 10) == []
+    assert _gaps([(5, 20)], 0, 10) == [(0, 5)]
+
+
+def test_only_missing_ranges_are_fetched(
+    store: OhlcStore, market_data_httpserver: HTTPServer
+):
+    market_data_httpserver.expect_request("/ohlc/h1").respond_with_handler(
+        hourly_candles(server_time=hours(100))
+    )
+
+    first = store.get("h1", "US88160R1014", "XMUN", hours(0), hours(10))
+    second = store.get("h1", "US88160R1014", "XMUN", hours(5), hours(15))
+    third = store.get("h1", "US88160R1014", "XMUN", hours(2), hours(12))
+
+    assert [row.t for row in first] == [hours(i) for i in range(10)]
+    assert [row.t for row in second] == [hours(i) for i in range(5, 15)]
+    assert [row.t for row in third] == [hours(i) for i in range(2, 12)]
+    assert third[0].o == 777 and third[0].mic == "XMUN"
+    assert requested_ranges(market_data_httpserver) == [
+        (hours(0), hours(10)),
+        (hours(10), hours(15)),
+    ]
+    assert store.coverage("h1", "US88160R1014", "XMUN") == [
+        (int(hours(0).timestamp() * 1000), int(hours(15).timestamp() * 1000))
+    ]
+
+
+def test_candles_in_progress_are_not_stored(
+    store: OhlcStore, market_data_httpserver: HTTPServer
+):
+    market_data_httpserver.expect_request("/ohlc/h1").respond_with_handler(
+        hourly_candles(server_time=hours(5.5))
+    )
+
+    first = store.get("h1", "US88160R1014", "XMUN", hours(0), hours(10))
+    second = store.get("h1", "US88160R1014", "XMUN", hours(0), hours(10))
+
+    assert [row.t for row in first] == [hours(i) for i in range(6)]
+    assert [row.t for row in second] == [hours(i) for i in range(6)]
+    assert requested_ranges(market_data_httpserver) == [
+        (hours(0), hours(10)),
+        (hours(5), hours(10)),
+    ]
+
+
+def test_persistence(client: Api, market_data_httpserver: HTTPServer, tmp_path):
+    path = str(tmp_path / "ohlc.sqlite")
+    market_data_httpserver.expect_request("/ohlc/d1").respond_with_handler(
+        hourly_candles(server_time=hours(100))
+    )
+    store = OhlcStore(client.market_data.ohlc, path)
+    store.get("d1", "US88160R1014", "XMUN", hours(0), hours(3))
+    store.close()
+
+    store = OhlcStore(client.market_data.ohlc, path)
+    rows = store.get("d1", "US88160R1014", "XMUN", hours(0), hours(3))
+    store.close()
+
+    assert len(rows) == 3
+    assert len(market_data_httpserver.log) == 1
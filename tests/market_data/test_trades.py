@@ -1,4 +1,5 @@
 import abc
+from array import array
 from datetime import datetime, timezone
 from urllib.parse import urlencode
 
@@ -6,7 +7,7 @@ import pytest
 from pytest_httpserver import HTTPServer
 
 from lemon.api import Api
-from lemon.market_data.model import GetTradesResponse, Trade
+from lemon.market_data.model import GetTradesResponse, Trade, TradeColumns
 from tests.market_data.conftest import CommonMarketDataApiTests
 
 DUMMY_PAYLOAD = {
@@ -150,6 +151,24 @@ class BaseTradeTests(CommonMarketDataApiTests):
         trade = self.make_api_call(client, epoch=True).results[0]
         assert isinstance(trade.t, int)
 
+    def test_get_trades_columnar(self, client: Api, httpserver: HTTPServer):
+        httpserver.expect_oneshot_request(
+            self.uri,
+            query_string="isin=A&epoch=True",
+            method="GET",
+        ).respond_with_json(DUMMY_PAYLOAD_WITH_EPOCH)
+
+        columns = self.make_api_call(client, epoch=True, columnar=True).results
+
+        assert columns == TradeColumns(
+            isin=["US19260Q1076"],
+            p=array("q", [274]),
+            pbv=array("q", [35]),
+            v=array("q", [2]),
+            t=array("q", [13344142]),
+            mic=["XMUN"],
+        )
+
     def test_get_trades_non_epoch_form(self, client: Api, httpserver: HTTPServer):
         httpserver.expect_oneshot_request(
             self.uri,
@@ -1,3 +1,5 @@
+import asyncio
+import json
 from datetime import date, datetime, time
 
 import pytest
@@ -105,3 +107,36 @@ class TestVenuesApi(CommonMarketDataApiTests):
         ).respond_with_json(DUMMY_PAYLOAD)
 
         assert client.market_data.venues.get() == DUMMY_RESPONSE
+
+    def test_custom_json_loads(
+        self, client: Api, httpserver: HTTPServer, monkeypatch: pytest.MonkeyPatch
+    ):
+        decoded = []
+
+        def json_loads(content: bytes):
+            decoded.append(content)
+            return json.loads(content)
+
+        monkeypatch.setattr(client.market_data, "_json_loads", json_loads)
+        httpserver.expect_oneshot_request(
+            "/venues",
+            method="GET",
+        ).respond_with_json(DUMMY_PAYLOAD)
+
+        assert client.market_data.venues.get() == DUMMY_RESPONSE
+        assert [json.loads(content) for content in decoded] == [DUMMY_PAYLOAD]
+
+    def test_custom_json_loads_async(self, async_client, httpserver: HTTPServer):
+        httpserver.expect_oneshot_request(
+            "/venues",
+            method="GET",
+        ).respond_with_json(DUMMY_PAYLOAD)
+
+        async def call():
+            async with async_client() as client:
+                client.market_data._json_loads = lambda content: dict(
+                    json.loads(content), results=[]
+                )
+                return await client.market_data.venues.get()
+
+        assert asyncio.run(call()).results == []
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timezone
 
 import pytest
@@ -39,6 +40,17 @@ class TestStreamingApi(CommonStreamingAPITests):
         )
         assert client.streaming.authenticate() == DUMMY_RESPONSE
 
+    def test_authenticate_async(self, async_client, httpserver: HTTPServer):
+        httpserver.expect_oneshot_request(
+            "/auth", method="post", headers={"Authorization": "Bearer foobar"}
+        ).respond_with_json(DUMMY_PAYLOAD)
+
+        async def call():
+            async with async_client() as client:
+                return await client.streaming.authenticate()
+
+        assert asyncio.run(call()) == DUMMY_RESPONSE
+
     def test_fail_auth_on_invalid_datetime_format(
         self, client: Api, httpserver: HTTPServer
     ):
@@ -0,0 +1,192 @@
+import asyncio
+import json
+from datetime import datetime, timezone
+from threading import Thread
+from typing import List, Optional
+
+import pytest
+from pytest_httpserver import HTTPServer
+
+from lemon.api import Api
+from lemon.market_data.model import Quote
+from lemon.streaming.model import Token
+from lemon.streaming.subscriber import OnMessage, QuoteStream, StreamTransport
+from tests.streaming.test_authenticate import DUMMY_PAYLOAD as TOKEN_PAYLOAD
+
+QUOTE = {
+    "isin": "US88160R1014",
+    "mic": "XMUN",
+    "a": 9210,
+    "a_v": 87,
+    "b": 9200,
+    "b_v": 12,
+    "t": 1657929600046,
+}
+
+
+class FakeTransport(StreamTransport):
+    def __init__(self):
+        self.token: Optional[Token] = None
+        self.on_message: Optional[OnMessage] = None
+        self.subscriptions: List[List[str]] = []
+        self.closed = False
+        self.updated_tokens: List[str] = []
+
+    def connect(self, token: Token, on_message: OnMessage) -> None:
+        self.token, self.on_message = token, on_message
+
+    def subscribe(self, isins: List[str]) -> None:
+        self.subscriptions.append(isins)
+
+    def update_token(self, token: Token) -> None:
+        self.updated_tokens.append(token.token)
+
+    def close(self) -> None:
+        self.closed = True
+
+    def send(self, **kwargs) -> None:
+        self.on_message(json.dumps(dict(QUOTE, **kwargs)).encode())
+
+
+@pytest.fixture
+def transport() -> FakeTransport:
+    return FakeTransport()
+
+
+@pytest.fixture
+def stream(client: Api, streaming_httpserver: HTTPServer, transport: FakeTransport):
+    streaming_httpserver.expect_oneshot_request(
+        "/auth", method="POST"
+    ).respond_with_json(TOKEN_PAYLOAD)
+    stream = QuoteStream(client.streaming, ["B", "A"], transport=transport)
+    stream.start()
+    yield stream
+    stream.close()
+
+
+def test_connect_and_subscribe(stream: QuoteStream, transport: FakeTransport):
+    assert transport.token.token == "token123"
+    assert transport.subscriptions == [["A", "B"]]
+
+    stream.subscribe(["C"])
+    stream.unsubscribe(["A"])
+
+    assert transport.subscriptions[1:] == [["A", "B", "C"], ["B", "C"]]
+
+
+def test_callbacks(stream: QuoteStream, transport: FakeTransport):
+    received = []
+    stream.add_callback(received.append)
+
+    transport.send()
+
+    assert received == [
+        Quote(
+            isin="US88160R1014",
+            b_v=12,
+            a_v=87,
+            b=9200,
+            a=9210,
+            t=datetime.fromtimestamp(1657929600046 / 1000, tz=timezone.utc),
+            mic="XMUN",
+        )
+    ]
+
+
+def test_iteration_ends_on_close(stream: QuoteStream, transport: FakeTransport):
+    def produce():
+        for i in range(3):
+            transport.send(a=i)
+        stream.close()
+
+    Thread(target=produce).start()
+
+    assert [quote.a for quote in stream] == [0, 1, 2]
+    assert transport.closed
+
+
+def test_async_iteration(stream: QuoteStream, transport: FakeTransport):
+    async def consume():
+        return [quote.a async for quote in stream]
+
+    for i in range(3):
+        transport.send(a=i)
+    stream.close()
+    transport.send(a=4)
+
+    assert asyncio.run(consume()) == [0, 1, 2]
+
+
+def test_cancelled_async_iteration_loses_no_quotes(
+    stream: QuoteStream, transport: FakeTransport
+):
+    async def consume():
+        with pytest.raises(asyncio.TimeoutError):
+            await asyncio.wait_for(stream.__aiter__().__anext__(), 0.05)
+        for i in range(2):
+            transport.send(a=i)
+        stream.close()
+        return [quote.a async for quote in stream]
+
+    assert asyncio.run(consume()) == [0, 1]
+
+
+def test_async_iterations_receive_all_quotes(
+    stream: QuoteStream, transport: FakeTransport
+):
+    async def consume():
+        iterations = [stream.__aiter__() for _ in range(2)]
+        first = [asyncio.ensure_future(it.__anext__()) for it in iterations]
+        await asyncio.sleep(0.01)
+        await asyncio.get_running_loop().run_in_executor(None, transport.send)
+        return [(await quote).a for quote in first]
+
+    assert asyncio.run(consume()) == [9210, 9210]
+
+
+def test_drain_columns(stream: QuoteStream, transport: FakeTransport):
+    transport.send(isin="A")
+    transport.send(isin="B")
+
+    columns = stream.drain_columns()
+
+    assert columns.isin == ["A", "B"]
+    assert list(columns.t) == [1657929600046, 1657929600046]
+    assert stream.drain() == []
+
+
+def test_oldest_quotes_are_dropped(client: Api, transport: FakeTransport):
+    stream = QuoteStream(client.streaming, [], transport=transport, buffer_size=2)
+
+    for i in range(3):
+        stream._on_message(json.dumps(dict(QUOTE, a=i)).encode())
+
+    assert [quote.a for quote in stream.drain()] == [1, 2]
+
+
+def test_errors_do_not_stop_the_stream(client: Api, transport: FakeTransport):
+    def fail(quote: Quote) -> None:
+        raise RuntimeError("callback failed")
+
+    errors: List[Exception] = []
+    stream = QuoteStream(
+        client.streaming, [], transport=transport, on_quote=fail, on_error=errors.append
+    )
+    transport.on_message = stream._on_message
+
+    transport.on_message(b"not json")
+    transport.send(a=1)
+
+    assert len(errors) == 2
+    assert isinstance(errors[1], RuntimeError)
+    assert [quote.a for quote in stream.drain()] == [1]
+
+
+def test_errors_are_logged_without_on_error(
+    stream: QuoteStream, transport: FakeTransport, caplog: pytest.LogCaptureFixture
+):
+    transport.on_message(b"not json")
+    transport.send(a=1)
+
+    assert "Invalid quote message b'not json'" in caplog.text
+    assert [quote.a for quote in stream.drain()] == [1]
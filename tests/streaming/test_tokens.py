@@ -0,0 +1,125 @@
+import json
+import time
+from datetime import datetime, timedelta, timezone
+from threading import Event
+from typing import List
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+from lemon.api import Api
+from lemon.errors import AuthenticationError
+from lemon.streaming.model import Token
+from lemon.streaming.subscriber import QuoteStream
+from lemon.streaming.tokens import TokenManager
+from tests.conftest import build_error
+from tests.streaming.test_subscriber import FakeTransport
+
+
+def issue_tokens(lifetime: timedelta):
+    """Respond with a new token valid for `lifetime` on every request."""
+    issued: List[str] = []
+
+    def handler(request: Request) -> Response:
+        issued.append(f"token{len(issued)}")
+        expires_at = datetime.now(timezone.utc) + lifetime
+        data = {
+            "token": issued[-1],
+            "user_id": "user_123",
+            "expires_at": int(expires_at.timestamp() * 1000),
+        }
+        return Response(json.dumps(data), content_type="application/json")
+
+    return handler
+
+
+def test_token_is_cached(client: Api, streaming_httpserver: HTTPServer):
+    streaming_httpserver.expect_request("/auth").respond_with_handler(
+        issue_tokens(timedelta(hours=1))
+    )
+    tokens = TokenManager(client.streaming)
+
+    assert tokens.token.token == "token0"
+    assert tokens.token.token == "token0"
+    assert len(streaming_httpserver.log) == 1
+
+
+def test_expired_token_is_replaced(client: Api, streaming_httpserver: HTTPServer):
+    streaming_httpserver.expect_request("/auth").respond_with_handler(
+        issue_tokens(timedelta(hours=1))
+    )
+    now = datetime.now(timezone.utc)
+    tokens = TokenManager(client.streaming, clock=lambda: now)
+    tokens.token
+
+    now += timedelta(hours=2)
+
+    assert tokens.token.token == "token1"
+
+
+def test_background_refresh(client: Api, streaming_httpserver: HTTPServer):
+    streaming_httpserver.expect_request("/auth").respond_with_handler(
+        issue_tokens(timedelta(seconds=1))
+    )
+    refreshed: List[Token] = []
+    second_token = Event()
+
+    def on_refresh(token: Token) -> None:
+        refreshed.append(token)
+        if len(refreshed) == 2:
+            second_token.set()
+
+    with TokenManager(
+        client.streaming,
+        refresh_margin=timedelta(seconds=0.9),
+        retry_interval=0.05,
+        on_refresh=on_refresh,
+    ) as tokens:
+        assert second_token.wait(timeout=5)
+        assert tokens.token.token in {"token1", "token2"}
+
+    assert [token.token for token in refreshed[:2]] == ["token0", "token1"]
+
+
+def test_failed_refresh_keeps_token(client: Api, streaming_httpserver: HTTPServer):
+    streaming_httpserver.expect_oneshot_request("/auth").respond_with_handler(
+        issue_tokens(timedelta(hours=1))
+    )
+    tokens = TokenManager(client.streaming, retry_interval=10)
+    token = tokens.token
+    streaming_httpserver.expect_oneshot_request("/auth").respond_with_json(
+        build_error("token_invalid"), status=400
+    )
+
+    with pytest.raises(AuthenticationError):
+        tokens.refresh()
+
+    assert tokens.token is token
+
+
+def test_stream_uses_managed_token(client: Api, streaming_httpserver: HTTPServer):
+    streaming_httpserver.expect_request("/auth").respond_with_handler(
+        issue_tokens(timedelta(hours=1))
+    )
+    transport = FakeTransport()
+    tokens = TokenManager(client.streaming)
+    tokens.token
+
+    with QuoteStream(client.streaming, ["A"], transport=transport, tokens=tokens):
+        assert transport.token.token == "token0"
+        tokens.refresh()
+
+    assert transport.updated_tokens == ["token1"]
+
+
+def test_failed_refreshes_are_retried(client: Api, streaming_httpserver: HTTPServer):
+    streaming_httpserver.expect_request("/auth").respond_with_json(
+        build_error("token_invalid"), status=400
+    )
+
+    with TokenManager(client.streaming, retry_interval=0.2):
+        time.sleep(0.5)
+
+    # attempts at 0, 0.2 and 0.4 seconds
+    assert len(streaming_httpserver.log) == 3
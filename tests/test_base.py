@@ -0,0 +1,134 @@
+import asyncio
+import socket
+
+import pytest
+from pytest_httpserver import HTTPServer
+
+from lemon.api import Api, AsyncApi
+from lemon.base import PoolAdapter, make_session
+
+
+def make_api(url: str, streaming_api_url: str, **kwargs) -> Api:
+    return Api(
+        market_data_api_token="foobar",
+        trading_api_token="barbaz",
+        market_data_api_url=url,
+        trading_api_url=url,
+        streaming_api_url=streaming_api_url,
+        timeout=1,
+        retry_count=1,
+        retry_backoff_factor=1,
+        **kwargs,
+    )
+
+
+def test_make_session():
+    session = make_session(
+        retry_count=2,
+        retry_backoff_factor=0.5,
+        pool_connections=4,
+        pool_maxsize=32,
+        pool_block=True,
+    )
+    adapter = session.get_adapter("https://data.lemon.markets/v1/")
+
+    assert isinstance(adapter, PoolAdapter)
+    assert adapter.poolmanager.connection_pool_kw["maxsize"] == 32
+    assert adapter.poolmanager.connection_pool_kw["block"] is True
+    assert adapter.max_retries.total == 2
+    assert "socket_options" not in adapter.poolmanager.connection_pool_kw
+
+
+def test_make_session_with_tcp_keepalive():
+    session = make_session(retry_count=1, retry_backoff_factor=1, tcp_keepalive=30)
+    socket_options = session.get_adapter(
+        "https://data.lemon.markets/v1/"
+    ).poolmanager.connection_pool_kw["socket_options"]
+
+    assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options
+    assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in socket_options
+
+
+def test_share_session_on_same_host():
+    client = make_api(
+        "https://data.lemon.markets/v1/", "https://data.lemon.markets/streaming/"
+    )
+
+    assert client.streaming._session is client.market_data._session
+    assert client.trading._session is not client.market_data._session
+
+
+def test_separate_sessions_on_different_hosts():
+    client = make_api(
+        "https://data.lemon.markets/v1/", "https://realtime.lemon.markets/v1/"
+    )
+
+    assert client.streaming._session is not client.market_data._session
+
+
+def test_shared_session_reports_rate_limit_per_client(
+    market_data_httpserver: HTTPServer,
+):
+    client = make_api(
+        market_data_httpserver.url_for("/"),
+        market_data_httpserver.url_for("/"),
+        pool_maxsize=2,
+    )
+    market_data_httpserver.expect_oneshot_request(
+        "/auth", method="POST"
+    ).respond_with_json(
+        {
+            "token": "foo",
+            "user_id": "bar",
+            "expires_at": 1644871443000,
+        },
+        headers={"X-RateLimit-Remaining": "9"},
+    )
+
+    client.streaming.authenticate()
+
+    assert client.streaming.rate_limit.remaining == 9
+    assert client.market_data.rate_limit is None
+
+
+def test_share_async_session_on_same_host():
+    async def call():
+        client = AsyncApi(
+            market_data_api_token="foobar",
+            trading_api_token="barbaz",
+            market_data_api_url="https://data.lemon.markets/v1/",
+            trading_api_url="https://paper-trading.lemon.markets/v1/",
+            streaming_api_url="https://data.lemon.markets/streaming/",
+            timeout=1,
+            retry_count=1,
+            retry_backoff_factor=1,
+            tcp_keepalive=30,
+        )
+        async with client:
+            return client.streaming._session is client.market_data._session
+
+    assert asyncio.run(call())
+
+
+@pytest.mark.parametrize("pool_maxsize", [1, 16])
+def test_pool_block(market_data_httpserver: HTTPServer, pool_maxsize: int):
+    client = make_api(
+        market_data_httpserver.url_for("/"),
+        "https://realtime.lemon.markets/v1/",
+        pool_maxsize=pool_maxsize,
+        pool_block=True,
+    )
+    market_data_httpserver.expect_request("/venues").respond_with_json(
+        {
+            "time": "2022-02-14T20:44:03.759+00:00",
+            "results": [],
+            "previous": None,
+            "next": None,
+            "total": 0,
+            "page": 1,
+            "pages": 1,
+        }
+    )
+
+    for _ in range(3):
+        assert client.market_data.venues.get().results == []
@@ -0,0 +1,87 @@
+"""Micro-benchmarks of hot paths, run with: pytest -s -m benchmark tests/test_benchmarks.py"""
+from datetime import datetime, timezone
+from timeit import repeat
+from typing import Callable
+
+import pytest
+
+from lemon.market_data.model import GetQuotesResponse, Instrument
+from lemon.trading.model import Order
+from lemon.types import BaseModel, convert_datetime, from_isoformat
+from tests.market_data.test_instruments import DUMMY_PAYLOAD as INSTRUMENTS_PAYLOAD
+from tests.market_data.test_quotes import DUMMY_PAYLOAD as QUOTES_PAYLOAD
+from tests.market_data.test_quotes import (
+    DUMMY_PAYLOAD_WITH_EPOCH as QUOTES_PAYLOAD_WITH_EPOCH,
+)
+from tests.trading.test_orders import DUMMY_ORDERS_PAYLOAD
+
+
+def best_of(func: Callable[[], object], number: int = 2000) -> float:
+    """Best time of a single call in microseconds."""
+    return min(repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    "model,data",
+    [
+        (Order, DUMMY_ORDERS_PAYLOAD["results"][0]),
+        (Instrument, INSTRUMENTS_PAYLOAD["results"][0]),
+    ],
+)
+def test_model_parsing(model, data):
+    generic = BaseModel._from_data.__func__  # type: ignore
+    assert model._from_data(data) == generic(model, data)
+
+    before = best_of(lambda: generic(model, data))
+    after = best_of(lambda: model._from_data(data))
+
+    print(
+        f"\n{model.__name__}._from_data: "
+        f"generic {before:.2f}us, compiled {after:.2f}us ({before / after:.2f}x)"
+    )
+
+
+def legacy_convert_datetime(value):
+    try:
+        return datetime.fromisoformat(value)
+    except:  # pylint: disable=W0702
+        return datetime.fromtimestamp(value / 1000, tz=timezone.utc)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize(
+    "value", ["2021-10-28T08:51:03.669+00:00", 1635411063669], ids=["ISO", "epoch"]
+)
+def test_convert_datetime(value):
+    assert convert_datetime(value) == legacy_convert_datetime(value)
+
+    before = best_of(lambda: legacy_convert_datetime(value))
+    after = best_of(lambda: convert_datetime(value))
+
+    print(
+        f"\nconvert_datetime({value!r}): "
+        f"legacy {before:.2f}us, current {after:.2f}us ({before / after:.2f}x)"
+    )
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("epoch", [False, True], ids=["ISO", "epoch"])
+def test_quotes_response_parsing(epoch):
+    payload = QUOTES_PAYLOAD_WITH_EPOCH if epoch else QUOTES_PAYLOAD
+    data = dict(payload, results=payload["results"] * 1000)
+
+    elapsed = best_of(
+        lambda: GetQuotesResponse._from_data(
+            data,
+            t_type=int,
+            k_type=int if epoch else from_isoformat,
+            client=None,
+        ),
+        number=20,
+    )
+
+    print(
+        f"\nGetQuotesResponse._from_data ({'epoch' if epoch else 'ISO'}, "
+        f"1000 rows): {elapsed:.2f}us"
+    )
@@ -0,0 +1,181 @@
+import asyncio
+from unittest import mock
+
+import pytest
+from pytest_httpserver import HTTPServer
+
+from lemon.api import Api
+from lemon.cache import CachedResponse, MemoryCache, SQLiteCache
+from lemon.errors import APIError
+from tests.market_data.test_venues import DUMMY_PAYLOAD as VENUES_PAYLOAD
+from tests.market_data.test_venues import DUMMY_RESPONSE as VENUES_RESPONSE
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def cache(request, tmp_path):
+    if request.param == "memory":
+        yield MemoryCache()
+    else:
+        cache = SQLiteCache(str(tmp_path / "cache.sqlite"))
+        yield cache
+        cache.close()
+
+
+def response(content: bytes = b"{}") -> CachedResponse:
+    return CachedResponse(200, {"Content-Type": "application/json"}, content)
+
+
+def test_get_and_set(cache):
+    assert cache.get("key") is None
+
+    cache.set("key", "venues", response(b'{"foo": 1}'), ttl=10)
+
+    cached = cache.get("key")
+    assert cached.content == b'{"foo": 1}'
+    assert cached.headers == {"Content-Type": "application/json"}
+    assert cached.ok
+
+
+def test_expired_entries_are_not_returned(cache):
+    cache.set("key", "venues", response(), ttl=10)
+
+    with mock.patch("lemon.cache.time") as time:
+        time.monotonic.return_value = time.time.return_value = 10**12
+        assert cache.get("key") is None
+
+
+def test_invalidate(cache):
+    cache.set("venues", "venues", response(), ttl=10)
+    cache.set("instruments", "instruments?isin=A", response(), ttl=10)
+    cache.set("documents", "account/documents", response(), ttl=10)
+
+    cache.invalidate("instruments")
+    assert cache.get("instruments") is None
+    assert cache.get("venues") is not None
+
+    cache.invalidate()
+    assert cache.get("venues") is None
+    assert cache.get("documents") is None
+
+
+def test_ttls():
+    cache = MemoryCache(ttls={"venues": 5, "account/documents": 60})
+
+    assert cache.ttl("venues?mic=XMUN") == 5
+    assert cache.ttl("account/documents/?limit=2&page=3") == 60
+    assert cache.ttl("account/documents/doc_123") is None
+    assert cache.ttl("account") is None
+    assert cache.ttl("quotes/latest") is None
+
+
+def test_lru_eviction():
+    cache = MemoryCache(maxsize=2)
+    cache.set("a", "venues", response(), ttl=10)
+    cache.set("b", "venues", response(), ttl=10)
+    cache.get("a")
+    cache.set("c", "venues", response(), ttl=10)
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+
+
+def test_cached_response_is_decoded_once():
+    cached, json_loads = response(b'{"foo": 1}'), mock.Mock(return_value={"foo": 1})
+
+    assert cached.decode(json_loads) is cached.decode(json_loads)
+    json_loads.assert_called_once_with(b'{"foo": 1}')
+
+
+class TestCachingClient:
+    @pytest.fixture
+    def client(self, client: Api, cache) -> Api:
+        client.market_data._cache = cache
+        return client
+
+    def test_cache_hit(self, client: Api, market_data_httpserver: HTTPServer):
+        market_data_httpserver.expect_oneshot_request(
+            "/venues", query_string="mic=XMUN"
+        ).respond_with_json(VENUES_PAYLOAD)
+
+        assert client.market_data.venues.get(mic="XMUN") == VENUES_RESPONSE
+        assert client.market_data.venues.get(mic="XMUN") == VENUES_RESPONSE
+
+    def test_different_params_are_not_shared(
+        self, client: Api, market_data_httpserver: HTTPServer
+    ):
+        for mic in ["XMUN", "XFRA"]:
+            market_data_httpserver.expect_oneshot_request(
+                "/venues", query_string=f"mic={mic}"
+            ).respond_with_json(VENUES_PAYLOAD)
+
+        client.market_data.venues.get(mic="XMUN")
+        client.market_data.venues.get(mic="XFRA")
+
+    def test_different_accounts_are_not_shared(
+        self, client: Api, market_data_httpserver: HTTPServer
+    ):
+        market_data_httpserver.expect_request("/venues").respond_with_json(
+            VENUES_PAYLOAD
+        )
+        client.market_data.venues.get()
+        client.market_data._api_token = "other-token"
+        client.market_data.venues.get()
+
+        assert len(market_data_httpserver.log) == 2
+
+    def test_not_cached_endpoints(
+        self, client: Api, market_data_httpserver: HTTPServer
+    ):
+        market_data_httpserver.expect_request("/quotes/latest").respond_with_json(
+            {
+                "time": "2022-02-14T20:44:03.759+00:00",
+                "results": [],
+                "previous": None,
+                "next": None,
+                "total": 0,
+                "page": 1,
+                "pages": 1,
+            }
+        )
+        client.market_data.quotes.get_latest(isin=["A"])
+        client.market_data.quotes.get_latest(isin=["A"])
+
+        assert len(market_data_httpserver.log) == 2
+
+    def test_errors_are_not_cached(
+        self, client: Api, market_data_httpserver: HTTPServer
+    ):
+        market_data_httpserver.expect_oneshot_request("/venues").respond_with_json(
+            {"foo": "bar"}, status=400
+        )
+        market_data_httpserver.expect_oneshot_request("/venues").respond_with_json(
+            VENUES_PAYLOAD
+        )
+
+        with pytest.raises(APIError):
+            client.market_data.venues.get()
+        assert client.market_data.venues.get() == VENUES_RESPONSE
+
+    def test_invalidate(self, client: Api, market_data_httpserver: HTTPServer):
+        market_data_httpserver.expect_request("/venues").respond_with_json(
+            VENUES_PAYLOAD
+        )
+        client.market_data.venues.get()
+        client.market_data._cache.invalidate("venues")
+        client.market_data.venues.get()
+
+        assert len(market_data_httpserver.log) == 2
+
+
+def test_cache_hit_async(async_client, market_data_httpserver: HTTPServer):
+    market_data_httpserver.expect_oneshot_request("/venues").respond_with_json(
+        VENUES_PAYLOAD
+    )
+
+    async def call():
+        async with async_client() as client:
+            client.market_data._cache = MemoryCache()
+            return [await client.market_data.venues.get() for _ in range(2)]
+
+    assert asyncio.run(call()) == [VENUES_RESPONSE, VENUES_RESPONSE]
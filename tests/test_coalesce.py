@@ -0,0 +1,136 @@
+import asyncio
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Barrier, Event
+
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+from lemon.api import Api
+from lemon.coalesce import AsyncSingleFlight, SingleFlight
+
+VENUES_PAYLOAD = {
+    "time": "2022-02-14T20:44:03.759+00:00",
+    "results": [],
+    "previous": None,
+    "next": None,
+    "total": 0,
+    "page": 1,
+    "pages": 1,
+}
+
+
+def test_single_flight_shares_result():
+    single_flight, release, calls = SingleFlight(), Event(), []
+
+    def func():
+        calls.append(1)
+        release.wait(timeout=5)
+        return object()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(single_flight.do, "key", func) for _ in range(4)]
+        time.sleep(0.1)
+        release.set()
+        results = [future.result(timeout=5) for future in futures]
+
+    assert len(calls) == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_single_flight_shares_exception():
+    single_flight, release = SingleFlight(), Event()
+
+    def func():
+        release.wait(timeout=5)
+        raise ValueError("boom")
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(single_flight.do, "key", func) for _ in range(2)]
+        time.sleep(0.1)
+        release.set()
+        for future in futures:
+            with pytest.raises(ValueError):
+                future.result(timeout=5)
+
+
+def test_single_flight_does_not_share_finished_calls():
+    single_flight = SingleFlight()
+
+    assert single_flight.do("key", lambda: 1) == 1
+    assert single_flight.do("key", lambda: 2) == 2
+
+
+def test_async_single_flight_shares_result():
+    calls = []
+
+    async def func():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return len(calls)
+
+    async def call():
+        single_flight = AsyncSingleFlight()
+        results = await asyncio.gather(
+            *(single_flight.do("key", func) for _ in range(3)),
+            single_flight.do("other", func),
+        )
+        return results, await single_flight.do("key", func)
+
+    assert asyncio.run(call()) == ([2, 2, 2, 2], 3)
+
+
+def slow_venues(request: Request) -> Response:
+    time.sleep(0.3)
+    return Response(json.dumps(VENUES_PAYLOAD), content_type="application/json")
+
+
+@pytest.fixture
+def coalescing_client(client: Api) -> Api:
+    client.market_data._single_flight = SingleFlight()
+    return client
+
+
+def test_coalesce_concurrent_gets(
+    coalescing_client: Api, market_data_httpserver: HTTPServer
+):
+    market_data_httpserver.expect_oneshot_request(
+        "/venues", query_string="mic=XMUN"
+    ).respond_with_handler(slow_venues)
+    barrier = Barrier(3)
+
+    def call():
+        barrier.wait(timeout=5)
+        return coalescing_client.market_data.venues.get(mic="XMUN")
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [executor.submit(call) for _ in range(3)]
+        responses = [future.result(timeout=5) for future in futures]
+
+    assert all(response.results == [] for response in responses)
+    assert len(market_data_httpserver.log) == 1
+
+
+def test_coalesce_concurrent_gets_async(
+    async_client, market_data_httpserver: HTTPServer
+):
+    market_data_httpserver.expect_oneshot_request(
+        "/venues", query_string="mic=XMUN"
+    ).respond_with_handler(slow_venues)
+    market_data_httpserver.expect_oneshot_request(
+        "/venues", query_string="mic=XFRA"
+    ).respond_with_json(VENUES_PAYLOAD)
+
+    async def call():
+        async with async_client() as client:
+            client.market_data._single_flight = AsyncSingleFlight()
+            return await asyncio.gather(
+                client.market_data.venues.get(mic="XMUN"),
+                client.market_data.venues.get(mic="XMUN"),
+                client.market_data.venues.get(mic="XFRA"),
+            )
+
+    assert len(asyncio.run(call())) == 3
+    assert len(market_data_httpserver.log) == 2
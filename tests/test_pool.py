@@ -0,0 +1,124 @@
+from threading import Event, Lock
+from unittest import mock
+
+import pytest
+
+from lemon.api import Api
+from lemon.pool import ApiPool
+from lemon.transport import Transport
+
+
+@pytest.fixture
+def pool():
+    pool = ApiPool(workers=2, max_concurrency_per_account=1)
+    pool.add_account("a", "market-data-a", "trading-a")
+    pool.add_account("b", "market-data-b", "trading-b")
+    yield pool
+    pool.shutdown(cancel_pending=True)
+
+
+def test_accounts_share_transport(pool: ApiPool):
+    assert pool["a"].market_data._session is pool.transport.session
+    assert pool["b"].trading._session is pool.transport.session
+    assert pool["a"].market_data._api_token == "market-data-a"
+    assert pool["b"].trading._api_token == "trading-b"
+    assert "a" in pool and len(pool) == 2
+
+
+def test_submit_returns_result(pool: ApiPool):
+    future = pool.submit("a", lambda api, value: (api, value), value=42)
+
+    assert future.result(timeout=5) == (pool["a"], 42)
+
+
+def test_submit_propagates_exception(pool: ApiPool):
+    def fail(api: Api):
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError, match="boom"):
+        pool.submit("a", fail).result(timeout=5)
+
+
+def test_account_cannot_starve_other_accounts(pool: ApiPool):
+    release, order, lock = Event(), [], Lock()
+
+    def backfill(api: Api, page: int):
+        release.wait(timeout=5)
+        with lock:
+            order.append(f"a{page}")
+
+    def create_order(api: Api):
+        with lock:
+            order.append("b")
+
+    futures = [pool.submit("a", backfill, page) for page in range(5)]
+    pool.submit("b", create_order).result(timeout=5)
+    release.set()
+    for future in futures:
+        future.result(timeout=5)
+
+    assert order[0] == "b"
+    assert order[1:] == [f"a{page}" for page in range(5)]
+
+
+def test_concurrency_per_account_is_bounded():
+    running, max_running, lock = [0], [0], Lock()
+
+    def call(api: Api):
+        with lock:
+            running[0] += 1
+            max_running[0] = max(max_running[0], running[0])
+        Event().wait(0.01)
+        with lock:
+            running[0] -= 1
+
+    with ApiPool(workers=6, max_concurrency_per_account=2) as pool:
+        pool.add_account("a", "foo", "bar")
+        futures = [pool.submit("a", call) for _ in range(10)]
+        for future in futures:
+            future.result(timeout=5)
+
+    assert max_running[0] == 2
+
+
+def test_remove_account_cancels_pending_calls(pool: ApiPool):
+    started, release = Event(), Event()
+
+    def call(api: Api):
+        started.set()
+        return release.wait(timeout=5)
+
+    running = pool.submit("a", call)
+    pending = pool.submit("a", lambda api: None)
+    started.wait(timeout=5)
+
+    pool.remove_account("a")
+    release.set()
+
+    assert running.result(timeout=5) is True
+    assert pending.cancelled()
+    with pytest.raises(KeyError):
+        pool.submit("a", lambda api: None)
+
+
+def test_add_account_twice(pool: ApiPool):
+    with pytest.raises(ValueError):
+        pool.add_account("a", "foo", "bar")
+
+
+def test_submit_after_shutdown():
+    pool = ApiPool(workers=1)
+    pool.add_account("a", "foo", "bar")
+    pool.shutdown()
+
+    with pytest.raises(RuntimeError):
+        pool.submit("a", lambda api: None)
+
+
+def test_shared_transport_is_not_closed():
+    transport = mock.Mock(wraps=Transport())
+    with ApiPool(transport=transport, workers=1) as pool:
+        pool.add_account("a", "foo", "bar")
+
+    assert pool.transport is transport
+    transport.close.assert_not_called()
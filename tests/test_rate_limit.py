@@ -0,0 +1,245 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import pytest
+from pytest_httpserver import HTTPServer
+
+from lemon import api
+from lemon.api import Api
+from lemon.rate_limit import RateLimiter, RateLimitStatus
+
+VENUES_PAYLOAD = {
+    "time": "2022-02-14T20:44:03.759+00:00",
+    "results": [],
+    "previous": None,
+    "next": None,
+    "total": 0,
+    "page": 1,
+    "pages": 1,
+}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def sleep():
+    with mock.patch("lemon.rate_limit.time.sleep") as sleep:
+        yield sleep
+
+
+def test_burst_is_not_delayed(clock, sleep):
+    limiter = RateLimiter(rate=2, burst=3, clock=clock)
+
+    for _ in range(3):
+        limiter.acquire()
+
+    sleep.assert_not_called()
+
+
+def test_requests_over_budget_are_delayed(clock, sleep):
+    limiter = RateLimiter(rate=2, burst=1, clock=clock)
+
+    limiter.acquire()
+    limiter.acquire()
+    limiter.acquire()
+
+    assert sleep.call_args_list == [mock.call(0.5), mock.call(1.0)]
+
+
+def test_bucket_is_refilled(clock, sleep):
+    limiter = RateLimiter(rate=2, burst=2, clock=clock)
+    limiter.acquire()
+    limiter.acquire()
+
+    clock.now = 10.0
+    limiter.acquire()
+    limiter.acquire()
+
+    sleep.assert_not_called()
+
+
+def test_acquire_async(clock):
+    limiter = RateLimiter(rate=4, burst=1, clock=clock)
+
+    with mock.patch("lemon.rate_limit.asyncio.sleep") as sleep:
+
+        async def call():
+            await limiter.acquire_async()
+            await limiter.acquire_async()
+
+        asyncio.run(call())
+
+    sleep.assert_called_once_with(0.25)
+
+
+def test_pause(clock, sleep):
+    limiter = RateLimiter(rate=2, burst=2, clock=clock)
+
+    limiter.pause(3)
+    limiter.acquire()
+    limiter.acquire()
+
+    assert sleep.call_args_list == [mock.call(3.0), mock.call(3.5)]
+
+
+def test_update_pauses_until_reset(clock, sleep):
+    limiter = RateLimiter(rate=1, clock=clock)
+    now = datetime.now(timezone.utc)
+
+    limiter.update(
+        RateLimitStatus(
+            limit=100,
+            remaining=0,
+            reset_at=now + timedelta(seconds=60),
+            retry_after=None,
+        )
+    )
+    limiter.acquire()
+
+    assert sleep.call_args.args[0] == pytest.approx(60, abs=1)
+
+
+def test_update_with_remaining_budget(clock, sleep):
+    limiter = RateLimiter(rate=1, clock=clock)
+
+    limiter.update(
+        RateLimitStatus(limit=100, remaining=5, reset_at=None, retry_after=None)
+    )
+    limiter.acquire()
+
+    sleep.assert_not_called()
+
+
+NOW = datetime(2022, 2, 14, 20, 44, 3, tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize(
+    "headers,expected",
+    [
+        ({}, None),
+        ({"Content-Type": "application/json"}, None),
+        (
+            {"Retry-After": "7"},
+            RateLimitStatus(limit=None, remaining=None, reset_at=None, retry_after=7),
+        ),
+        (
+            {"Retry-After": "Mon, 14 Feb 2022 20:44:13 GMT"},
+            RateLimitStatus(limit=None, remaining=None, reset_at=None, retry_after=10),
+        ),
+        (
+            {
+                "X-RateLimit-Limit": "200",
+                "X-RateLimit-Remaining": "199",
+                "X-RateLimit-Reset": "30",
+            },
+            RateLimitStatus(
+                limit=200,
+                remaining=199,
+                reset_at=NOW + timedelta(seconds=30),
+                retry_after=None,
+            ),
+        ),
+        (
+            {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1644871500"},
+            RateLimitStatus(
+                limit=None,
+                remaining=0,
+                reset_at=datetime(2022, 2, 14, 20, 45, tzinfo=timezone.utc),
+                retry_after=None,
+            ),
+        ),
+        ({"Retry-After": "soon", "X-RateLimit-Limit": "many"}, None),
+    ],
+)
+def test_rate_limit_status_from_headers(headers, expected):
+    assert RateLimitStatus.from_headers(headers, now=NOW) == expected
+
+
+def test_rate_has_to_be_positive():
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
+
+
+def test_create_with_rate_limits():
+    client = api.create(
+        market_data_api_token="foo",
+        trading_api_token="bar",
+        market_data_rate_limit=10,
+        trading_rate_limit=RateLimiter(rate=2),
+    )
+
+    assert client.market_data.rate_limiter.rate == 10
+    assert client.streaming.rate_limiter is client.market_data.rate_limiter
+    assert client.trading.rate_limiter.rate == 2
+
+
+def test_create_without_rate_limits():
+    client = api.create(market_data_api_token="foo", trading_api_token="bar")
+
+    assert client.market_data.rate_limiter is None
+    assert client.trading.rate_limiter is None
+
+
+def test_client_acquires_token_per_request(
+    client: Api, market_data_httpserver: HTTPServer
+):
+    limiter = mock.Mock(spec=RateLimiter)
+    client.market_data._rate_limiter = limiter
+    market_data_httpserver.expect_oneshot_request(
+        "/venues", method="GET"
+    ).respond_with_json(VENUES_PAYLOAD)
+
+    client.market_data.venues.get()
+
+    limiter.acquire.assert_called_once_with()
+
+
+def test_client_exposes_rate_limit(client: Api, market_data_httpserver: HTTPServer):
+    limiter = mock.Mock(spec=RateLimiter)
+    client.market_data._rate_limiter = limiter
+    market_data_httpserver.expect_oneshot_request(
+        "/venues", method="GET"
+    ).respond_with_json(
+        VENUES_PAYLOAD,
+        headers={"X-RateLimit-Limit": "200", "X-RateLimit-Remaining": "42"},
+    )
+
+    assert client.market_data.rate_limit is None
+    client.market_data.venues.get()
+
+    assert client.market_data.rate_limit.limit == 200
+    assert client.market_data.rate_limit.remaining == 42
+    limiter.update.assert_called_once_with(client.market_data.rate_limit)
+
+
+def test_async_client_honors_retry_after(
+    async_client, market_data_httpserver: HTTPServer
+):
+    market_data_httpserver.expect_oneshot_request(
+        "/venues", method="GET"
+    ).respond_with_data(status=429, headers={"Retry-After": "3"})
+    market_data_httpserver.expect_oneshot_request(
+        "/venues", method="GET"
+    ).respond_with_json(VENUES_PAYLOAD)
+
+    async def call():
+        async with async_client() as client:
+            await client.market_data.venues.get()
+            return client.market_data.rate_limit
+
+    with mock.patch("lemon.base.asyncio.sleep") as sleep:
+        assert asyncio.run(call()) is not None
+
+    sleep.assert_called_once_with(3.0)
@@ -0,0 +1,142 @@
+import asyncio
+import time
+
+import httpx
+import pytest
+from pytest_httpserver import HTTPServer
+from werkzeug import Request, Response
+
+from lemon.api import Api, AsyncApi, create, create_async
+from lemon.transport import AsyncTransport, Transport
+
+VENUES_PAYLOAD = {
+    "time": "2022-02-14T20:44:03.759+00:00",
+    "results": [],
+    "previous": None,
+    "next": None,
+    "total": 0,
+    "page": 1,
+    "pages": 1,
+}
+
+
+def make_api(transport: Transport, token: str, url: str) -> Api:
+    return Api(
+        market_data_api_token=token,
+        trading_api_token=token,
+        market_data_api_url=url,
+        trading_api_url=url,
+        streaming_api_url=url,
+        timeout=1,
+        retry_count=1,
+        retry_backoff_factor=1,
+        transport=transport,
+    )
+
+
+def test_apis_share_transport(market_data_httpserver: HTTPServer):
+    url = market_data_httpserver.url_for("/")
+    for token in ["foo", "bar"]:
+        market_data_httpserver.expect_oneshot_request(
+            "/venues", headers={"Authorization": f"Bearer {token}"}
+        ).respond_with_json(VENUES_PAYLOAD)
+
+    with Transport(pool_maxsize=4) as transport:
+        clients = [make_api(transport, token, url) for token in ["foo", "bar"]]
+
+        for client in clients:
+            assert client.market_data.venues.get().results == []
+
+    sessions = {
+        id(api._session)
+        for client in clients
+        for api in [client.market_data, client.trading, client.streaming]
+    }
+    assert sessions == {id(transport.session)}
+
+
+def test_transport_shares_ssl_context():
+    transport = Transport()
+    adapter = transport.session.get_adapter("https://data.lemon.markets/v1/")
+
+    pool = adapter.poolmanager.connection_from_url("https://data.lemon.markets/v1/")
+    other_pool = adapter.poolmanager.connection_from_url(
+        "https://trading.lemon.markets/v1/"
+    )
+
+    assert pool.conn_kw["ssl_context"] is other_pool.conn_kw["ssl_context"]
+
+
+def test_async_api_does_not_close_shared_transport(
+    market_data_httpserver: HTTPServer,
+):
+    url = market_data_httpserver.url_for("/")
+    market_data_httpserver.expect_oneshot_request("/venues").respond_with_json(
+        VENUES_PAYLOAD
+    )
+
+    async def call():
+        async with AsyncTransport(timeout=1) as transport:
+            async with AsyncApi(
+                market_data_api_token="foo",
+                trading_api_token="foo",
+                market_data_api_url=url,
+                trading_api_url=url,
+                streaming_api_url=url,
+                timeout=1,
+                retry_count=1,
+                retry_backoff_factor=1,
+                transport=transport,
+            ):
+                pass
+            async with AsyncApi(
+                market_data_api_token="bar",
+                trading_api_token="bar",
+                market_data_api_url=url,
+                trading_api_url=url,
+                streaming_api_url=url,
+                timeout=1,
+                retry_count=1,
+                retry_backoff_factor=1,
+                transport=transport,
+            ) as client:
+                return await client.market_data.venues.get()
+
+    assert asyncio.run(call()).results == []
+
+
+def test_options_of_transport_are_rejected():
+    with pytest.raises(ValueError, match="pool_maxsize, tcp_keepalive"):
+        create("foo", "foo", pool_maxsize=4, tcp_keepalive=60, transport=Transport())
+    with pytest.raises(ValueError, match="retry_count"):
+        create("foo", "foo", retry_count=5, transport=Transport())
+    with pytest.raises(ValueError, match="pool_maxsize"):
+        create_async("foo", "foo", pool_maxsize=4, transport=AsyncTransport())
+
+
+def test_async_api_timeout_with_transport(market_data_httpserver: HTTPServer):
+    url = market_data_httpserver.url_for("/")
+
+    def slow(request: Request) -> Response:
+        time.sleep(0.5)
+        return Response(status=204)
+
+    market_data_httpserver.expect_oneshot_request("/venues").respond_with_handler(slow)
+
+    async def call():
+        async with AsyncTransport(timeout=5) as transport:
+            client = AsyncApi(
+                market_data_api_token="foo",
+                trading_api_token="foo",
+                market_data_api_url=url,
+                trading_api_url=url,
+                streaming_api_url=url,
+                timeout=0.1,
+                retry_count=0,
+                retry_backoff_factor=1,
+                transport=transport,
+            )
+            await client.market_data.venues.get()
+
+    with pytest.raises(httpx.TimeoutException):
+        asyncio.run(call())
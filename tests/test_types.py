@@ -0,0 +1,110 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import List, Optional
+
+import pytest
+from pytest_httpserver import HTTPServer
+
+from lemon.api import Api
+from lemon.cache import MemoryCache
+from lemon.errors import APIError
+from lemon.market_data.model import GetOhlcResponse, Instrument, OhlcData
+from lemon.rate_limit import RateLimiter
+from lemon.trading.model import GetOrdersResponse, Order
+from lemon.types import BaseModel, convert_datetime
+from tests.market_data.test_instruments import DUMMY_PAYLOAD as INSTRUMENTS_PAYLOAD
+from tests.trading.test_orders import DUMMY_ORDERS_PAYLOAD
+
+
+def generic_from_data(cls, data):
+    return BaseModel._from_data.__func__(cls, data)  # type: ignore
+
+
+def test_compiled_parser_matches_generic_parser():
+    for cls, data in [
+        (Order, DUMMY_ORDERS_PAYLOAD["results"][0]),
+        (Instrument, INSTRUMENTS_PAYLOAD["results"][0]),
+        (GetOrdersResponse, dict(DUMMY_ORDERS_PAYLOAD, _client=object())),
+    ]:
+        assert cls._from_data(data) == generic_from_data(cls, data)
+
+
+def test_compiled_parser_is_generated_per_model():
+    assert Order._from_data.__func__ is not Instrument._from_data.__func__
+    assert Order._from_data.__func__ is not BaseModel._from_data.__func__
+
+
+def test_custom_parser_is_not_replaced():
+    assert OhlcData._from_data.__qualname__ == "OhlcData._from_data"
+    assert not hasattr(OhlcData._from_data, "__func__")
+    assert not hasattr(GetOhlcResponse._from_data, "__func__")
+
+
+def test_compiled_parser_for_nested_optional_models():
+    @dataclass
+    class Child(BaseModel):
+        value: int
+
+    @dataclass
+    class Parent(BaseModel):
+        children: List[Child]
+        child: Optional[Child]
+        _private: Optional[str]
+
+    parent = Parent._from_data(
+        {"children": [{"value": "1"}], "child": None, "_private": "foo"}
+    )
+
+    assert parent.children[0].value == 1
+    assert parent.child is None
+    assert parent._private == "foo"
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        ("2021-10-28T08:51:03.669+00:00", datetime(2021, 10, 28, 8, 51, 3, 669000)),
+        ("2021-10-28T08:51:03.669Z", datetime(2021, 10, 28, 8, 51, 3, 669000)),
+        (1635411063669, datetime(2021, 10, 28, 8, 51, 3, 669000)),
+    ],
+)
+def test_convert_datetime(value, expected):
+    assert convert_datetime(value) == expected.replace(tzinfo=timezone.utc)
+
+
+@pytest.mark.parametrize("value", ["not-a-datetime", None, [1]])
+def test_convert_datetime_raises_api_error(value):
+    with pytest.raises(APIError):
+        convert_datetime(value)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"market_data_rate_limiter": RateLimiter(5)},
+        {"coalesce_requests": True},
+        {"cache": MemoryCache()},
+    ],
+)
+def test_response_of_client_with_locks_is_serializable(
+    kwargs, market_data_httpserver: HTTPServer
+):
+    client = Api(
+        market_data_api_token="foobar",
+        trading_api_token="barbaz",
+        market_data_api_url=market_data_httpserver.url_for(""),
+        streaming_api_url=market_data_httpserver.url_for(""),
+        trading_api_url=market_data_httpserver.url_for(""),
+        timeout=1,
+        retry_count=1,
+        retry_backoff_factor=1,
+        **kwargs,
+    )
+    market_data_httpserver.expect_oneshot_request("/instruments").respond_with_json(
+        INSTRUMENTS_PAYLOAD
+    )
+
+    response = client.market_data.instruments.get()
+
+    assert response.dict()["results"][0]["isin"] == response.results[0].isin
+    assert response.json()
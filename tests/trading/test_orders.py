@@ -1,9 +1,11 @@
+import asyncio
 from datetime import date, datetime
 
 import pytest
 from pytest_httpserver import HTTPServer
 
 from lemon.api import Api
+from lemon.errors import BusinessLogicError
 from lemon.trading.model import (
     ActivateOrderResponse,
     CreatedOrder,
@@ -14,6 +16,7 @@ from lemon.trading.model import (
     Order,
     RegulatoryInformation,
 )
+from tests.conftest import build_error
 from tests.trading.conftest import CommonTradingApiTests
 
 DUMMY_ORDERS_PAYLOAD = {
@@ -499,6 +502,46 @@ class TestCreateOrderApi(CommonTradingApiTests):
             == DUMMY_CREATE_ORDER_RESPONSE
         )
 
+    def test_create_order_async(self, async_client, httpserver: HTTPServer):
+        httpserver.expect_oneshot_request(
+            "/orders",
+            method="POST",
+            json={
+                "isin": "DE0008232125",
+                "expires_at": "P7D",
+                "side": "buy",
+                "quantity": 1000,
+                "venue": "xmun",
+            },
+            headers={"Authorization": "Bearer barbaz"},
+        ).respond_with_json(DUMMY_CREATE_ORDER_PAYLOAD)
+
+        async def call():
+            async with async_client() as client:
+                return await client.trading.orders.create(
+                    isin="DE0008232125",
+                    expires_at=7,
+                    side="buy",
+                    quantity=1000,
+                    venue="xmun",
+                )
+
+        assert asyncio.run(call()) == DUMMY_CREATE_ORDER_RESPONSE
+
+    def test_handle_trading_error_async(self, async_client, httpserver: HTTPServer):
+        httpserver.expect_oneshot_request("/orders", method="POST").respond_with_json(
+            build_error("pin_invalid"), status=400
+        )
+
+        async def call():
+            async with async_client() as client:
+                return await client.trading.orders.create(
+                    isin="DE0008232125", side="buy", quantity=1000
+                )
+
+        with pytest.raises(BusinessLogicError):
+            asyncio.run(call())
+
     def test_fail_to_create_order_for_invalid_expires_at(self, client: Api):
         with pytest.raises(ValueError) as err:
             client.trading.orders.create(
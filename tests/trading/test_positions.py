@@ -1,3 +1,4 @@
+import asyncio
 from datetime import date, datetime
 
 import pytest
@@ -274,6 +275,32 @@ class TestGetStatementsApi(CommonTradingApiTests):
         DUMMY_STATEMENTS_RESPONSE._client = client.trading
         assert client.trading.positions.get_statements() == DUMMY_STATEMENTS_RESPONSE
 
+    def test_async_iterator(self, client: Api, httpserver: HTTPServer):
+        last_page = dict(
+            DUMMY_STATEMENTS_PAYLOAD, previous=None, next=None, page=3, pages=3
+        )
+        httpserver.expect_oneshot_request(
+            "/positions/statements",
+            query_string="page=3",
+            method="GET",
+        ).respond_with_json(last_page)
+        httpserver.expect_oneshot_request(
+            "/positions/statements",
+            query_string="page=2",
+            method="GET",
+        ).respond_with_json(
+            dict(
+                DUMMY_STATEMENTS_PAYLOAD,
+                next=httpserver.url_for("/positions/statements?page=3"),
+            )
+        )
+        response = client.trading.positions.get_statements(page=2)
+
+        async def consume():
+            return [statement async for statement in response.auto_aiter()]
+
+        assert asyncio.run(consume()) == DUMMY_STATEMENTS_RESPONSE.results * 2
+
 
 class TestGetPerformanceApi(CommonTradingApiTests):
     def make_api_call(self, client: Api):